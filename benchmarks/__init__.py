@@ -0,0 +1,3 @@
+"""
+Microbenchmarks, run them with `python -m benchmarks`.
+"""
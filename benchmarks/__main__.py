@@ -0,0 +1,94 @@
+import argparse
+import json
+import platform
+import sys
+
+import pydantic
+
+from benchmarks import fields, models
+from benchmarks.harness import DEFAULT_MIN_TIME, report
+
+DEFAULT_THRESHOLD = 0.2
+
+SUITES = {
+    'fields': fields.run,
+    'models': models.run,
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Model validation and serialization microbenchmarks.',
+    )
+    parser.add_argument(
+        'suites',
+        nargs='*',
+        metavar='SUITE',
+        help=f'suites to run, any of {", ".join(SUITES)} (default: all)',
+    )
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='print machine readable results',
+    )
+    parser.add_argument(
+        '--min-time',
+        type=float,
+        default=DEFAULT_MIN_TIME,
+        help='seconds to run each benchmark for',
+    )
+    parser.add_argument(
+        '--compare',
+        metavar='BASELINE',
+        help='JSON output of a previous run, exit with an error on regressions',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='tolerated relative ops/s drop when comparing (default: %(default)s)',
+    )
+    args = parser.parse_args()
+    for suite in args.suites:
+        if suite not in SUITES:
+            parser.error(f'unknown suite: {suite}')
+
+    results = [
+        result
+        for suite in args.suites or SUITES
+        for result in SUITES[suite](min_time=args.min_time)
+    ]
+
+    if args.json:
+        json.dump(
+            {
+                'python': platform.python_version(),
+                'pydantic': pydantic.VERSION,
+                'results': results,
+            },
+            sys.stdout,
+            indent=2,
+        )
+        print()
+    else:
+        report(results)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = {result['name']: result for result in json.load(f)['results']}
+        regressions = [
+            result['name']
+            for result in results
+            if result['name'] in baseline
+            and result['ops_per_sec']
+            < baseline[result['name']]['ops_per_sec'] * (1 - args.threshold)
+        ]
+        for name in regressions:
+            print(f'regression: {name}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+from decimal import Decimal
+from typing import Annotated
+
+from pydantic import BaseModel, BeforeValidator, TypeAdapter
+
+from benchmarks.harness import Result, bench, report
+from uberpy import fields
+
+MANIFESTS = 100
+ITEMS = 50
+
+
+class Item(BaseModel):
+    price: fields.DecimalFromInt
+    vat_percentage: fields.DecimalFromInt
+
+
+def _legacy_int_to_decimal(value: int) -> Decimal:
+    return Decimal(str(value / 100))
+
+
+type LegacyDecimalFromInt = Annotated[Decimal, BeforeValidator(_legacy_int_to_decimal)]
+
+
+def run(*, min_time: float | None = None) -> list[Result]:
+    adapter = TypeAdapter(list[list[Item]])
+    manifests = [
+        [{'price': 1099 + i, 'vat_percentage': 1600} for i in range(ITEMS)]
+        for _ in range(MANIFESTS)
+    ]
+    validated = adapter.validate_python(manifests)
+    cents = list(range(10_000))
+    field = TypeAdapter(fields.DecimalFromInt)
+    legacy_field = TypeAdapter(LegacyDecimalFromInt)
+    assert [field.validate_python(value) for value in cents] == [
+        legacy_field.validate_python(value) for value in cents
+    ]
+
+    return [
+        bench(
+            f'decimal_from_int validate {MANIFESTS}x{ITEMS} items',
+            lambda: adapter.validate_python(manifests),
+            min_time=min_time,
+        ),
+        bench(
+            f'decimal_from_int serialize {MANIFESTS}x{ITEMS} items',
+            lambda: adapter.dump_python(validated, mode='json'),
+            min_time=min_time,
+        ),
+        bench(
+            'DecimalFromInt validate x10000',
+            lambda: [field.validate_python(value) for value in cents],
+            min_time=min_time,
+        ),
+        bench(
+            'DecimalFromInt validate x10000 (float round-trip)',
+            lambda: [legacy_field.validate_python(value) for value in cents],
+            min_time=min_time,
+        ),
+    ]
+
+
+if __name__ == '__main__':
+    report(run())
@@ -0,0 +1,138 @@
+"""
+Synthetic payloads of realistic size.
+"""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+ADDRESS = {
+    'street_address': ('Av. Paseo de la Reforma 222', 'Piso 3'),
+    'city': 'Ciudad de México',
+    'state': 'CDMX',
+    'zip_code': '06600',
+    'country': 'MX',
+}
+
+ADDRESS_JSON = json.dumps(ADDRESS, sort_keys=True, separators=(',', ':'))
+
+
+def manifest_items(count: int = 50, /) -> list[dict[str, Any]]:
+    return [
+        {
+            'name': f'Item {i}',
+            'quantity': 1 + i % 3,
+            'size': 'small',
+            'price': 1099 + i,
+            'vat_percentage': 1600,
+            'item_customizations': [
+                {
+                    'name': 'Extras',
+                    'options': [
+                        {
+                            'name': f'Option {j}',
+                            'price': 250,
+                            'quantity': 1,
+                            'customization_tax_info': {'tax_percentage': 1600},
+                        }
+                        for j in range(3)
+                    ],
+                },
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def delivery_create_request(items: int = 50, /) -> dict[str, Any]:
+    now = datetime.now(timezone.utc)
+    return {
+        'pickup_name': 'Store',
+        'pickup_address': ADDRESS_JSON,
+        'pickup_phone_number': '+525555555555',
+        'pickup_business_name': 'Store S.A. de C.V.',
+        'pickup_latitude': 19.4326,
+        'pickup_longitude': -99.1332,
+        'pickup_notes': 'Ask for the manager',
+        'pickup_verification': {'picture': True},
+        'pickup_ready_dt': now.isoformat(),
+        'pickup_deadline_dt': (now + timedelta(minutes=30)).isoformat(),
+        'dropoff_name': 'Customer',
+        'dropoff_address': ADDRESS_JSON,
+        'dropoff_phone_number': '+525555555556',
+        'dropoff_latitude': 19.4270,
+        'dropoff_longitude': -99.1677,
+        'dropoff_notes': 'Ring the bell',
+        'dropoff_verification': {'picture': True},
+        'dropoff_ready_dt': now.isoformat(),
+        'dropoff_deadline_dt': (now + timedelta(minutes=60)).isoformat(),
+        'manifest_items': manifest_items(items),
+        'manifest_reference': 'order-1',
+        'manifest_total_value': 150000,
+        'quote_id': 'dqt_1',
+        'tip': 2000,
+        'idempotency_key': 'order-1',
+        'external_store_id': 'store-1',
+    }
+
+
+def quote_create_request() -> dict[str, Any]:
+    return {
+        'pickup_address': ADDRESS_JSON,
+        'pickup_phone_number': '+525555555555',
+        'pickup_latitude': 19.4326,
+        'pickup_longitude': -99.1332,
+        'dropoff_address': ADDRESS_JSON,
+        'dropoff_phone_number': '+525555555556',
+        'dropoff_latitude': 19.4270,
+        'dropoff_longitude': -99.1677,
+        'manifest_total_value': 150000,
+        'external_store_id': 'store-1',
+    }
+
+
+def quote_create_response() -> dict[str, Any]:
+    return {
+        'id': 'dqt_1',
+        'kind': 'delivery_quote',
+        'created': '2025-01-01T00:00:00Z',
+        'expires': '2025-01-01T00:15:00Z',
+        'fee': 4599,
+        'currency_type': 'MXN',
+        'dropoff_eta': '2025-01-01T00:45:00Z',
+        'duration': 45,
+        'pickup_duration': 10,
+        'dropoff_deadline': '2025-01-01T01:00:00Z',
+    }
+
+
+def delivery() -> dict[str, Any]:
+    return {
+        'id': 'del_1',
+        'quote_id': 'dqt_1',
+        'status': 'pickup',
+        'complete': False,
+        'courier': {
+            'name': 'Juan P.',
+            'vehicle_type': 'motorcycle',
+            'phone_number': '+525555555557',
+            'img_href': 'https://example.com/courier.png',
+            'public_phone_info': {
+                'formatted_phone_number': '+52 55 5555 5557 ext. 1234',
+                'phone_number': '+525555555557',
+                'pin_code': '1234',
+            },
+        },
+        'courier_imminent': False,
+        'created': '2025-01-01T00:00:00Z',
+        'currency': 'mxn',
+        'deliverable_action': 'deliverable_action_meet_at_door',
+        'dropoff_deadline': '2025-01-01T01:00:00Z',
+        'dropoff_eta': '2025-01-01T00:45:00Z',
+        'fee': 4599,
+        'pickup_deadline': '2025-01-01T00:30:00Z',
+        'pickup_eta': '2025-01-01T00:10:00Z',
+        'pickup_ready': '2025-01-01T00:00:00Z',
+        'uuid': '6e5b1f7c2a3d4e5f8a9b0c1d2e3f4a5b',
+        'tracking_url': 'https://www.ubereats.com/orders/1',
+    }
@@ -0,0 +1,63 @@
+import gc
+import tracemalloc
+from time import perf_counter
+from typing import Callable, TypedDict
+
+DEFAULT_MIN_TIME = 0.5
+
+
+class Result(TypedDict):
+    name: str
+    ops_per_sec: float
+    allocated_bytes_per_op: float
+
+
+def bench(
+    name: str,
+    fn: Callable[[], object],
+    /,
+    *,
+    min_time: float | None = None,
+) -> Result:
+    """
+    Run `fn` for at least `min_time` seconds and measure its throughput, then run
+    it once more under tracemalloc to measure allocations.
+    """
+    min_time = DEFAULT_MIN_TIME if min_time is None else min_time
+
+    # warm up caches and lazily built validators
+    fn()
+
+    gc.collect()
+    ops = 0
+    started = perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time:
+        fn()
+        ops += 1
+        elapsed = perf_counter() - started
+
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return Result(
+        name=name,
+        ops_per_sec=ops / elapsed,
+        allocated_bytes_per_op=peak - before,
+    )
+
+
+def report(results: list[Result], /) -> None:
+    width = max(len(result['name']) for result in results)
+    for result in results:
+        print(
+            f'{result["name"]:<{width}}  '
+            f'{result["ops_per_sec"]:>12,.1f} ops/s  '
+            f'{result["allocated_bytes_per_op"]:>12,.0f} B/op'
+        )
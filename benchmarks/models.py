@@ -0,0 +1,140 @@
+import json
+from typing import Annotated
+
+from pydantic import BaseModel, TypeAdapter
+from pydantic_extra_types.phone_numbers import PhoneNumberValidator
+
+from benchmarks import fixtures
+from benchmarks.harness import Result, bench, report
+from uberpy import fields, models
+
+
+class _PhoneNumber(BaseModel):
+    phone_number: fields.PhoneNumber
+
+
+class _UncachedPhoneNumber(BaseModel):
+    phone_number: Annotated[
+        str,
+        PhoneNumberValidator(number_format='E164', default_region='MX'),
+    ]
+
+
+def _lazy_status(raw: bytes, /) -> tuple[str, bool]:
+    delivery = models.LazyModel(models.Delivery, raw)
+    return delivery.id, delivery.complete
+
+
+def run(*, min_time: float | None = None) -> list[Result]:
+    delivery_request_data = fixtures.delivery_create_request()
+    delivery_request = models.DeliveryCreateRequest.model_validate(
+        delivery_request_data
+    )
+    quote_request = models.QuoteCreateRequest.model_validate(
+        fixtures.quote_create_request()
+    )
+    profile = models.PickupProfile.model_validate(
+        {
+            name: value
+            for name, value in delivery_request_data.items()
+            if name in models.pickup.DELIVERY_PICKUP_FIELDS
+        }
+    )
+    order_data = {
+        name: value
+        for name, value in delivery_request_data.items()
+        if name not in models.pickup.DELIVERY_PICKUP_FIELDS
+    }
+    delivery_data = fixtures.delivery()
+    delivery_json = json.dumps(delivery_data).encode()
+    quote_data = fixtures.quote_create_response()
+    quote_json = json.dumps(quote_data).encode()
+    address = TypeAdapter(fields.StructuredAddress)
+    address_value = address.validate_python(fixtures.ADDRESS_JSON)
+
+    return [
+        bench(
+            'DeliveryCreateRequest.model_validate (50 items)',
+            lambda: models.DeliveryCreateRequest.model_validate(delivery_request_data),
+            min_time=min_time,
+        ),
+        bench(
+            'DeliveryCreateRequest.model_dump json (50 items)',
+            lambda: delivery_request.model_dump(mode='json', exclude_none=True),
+            min_time=min_time,
+        ),
+        bench(
+            'PickupProfile.delivery_request + model_dump json (50 items)',
+            lambda: profile.delivery_request(**order_data).model_dump(
+                mode='json',
+                exclude_none=True,
+            ),
+            min_time=min_time,
+        ),
+        bench(
+            'DeliveryCreateRequest.model_validate + model_dump json (50 items)',
+            lambda: models.DeliveryCreateRequest.model_validate(
+                delivery_request_data
+            ).model_dump(mode='json', exclude_none=True),
+            min_time=min_time,
+        ),
+        bench(
+            'QuoteCreateRequest.model_dump json',
+            lambda: quote_request.model_dump(mode='json', exclude_none=True),
+            min_time=min_time,
+        ),
+        bench(
+            'Delivery.model_validate',
+            lambda: models.Delivery.model_validate(delivery_data),
+            min_time=min_time,
+        ),
+        bench(
+            'Delivery.model_validate_json',
+            lambda: models.Delivery.model_validate_json(delivery_json),
+            min_time=min_time,
+        ),
+        bench(
+            'Delivery json.loads + model_validate',
+            lambda: models.Delivery.model_validate(json.loads(delivery_json)),
+            min_time=min_time,
+        ),
+        bench(
+            'LazyModel[Delivery] id + complete',
+            lambda: _lazy_status(delivery_json),
+            min_time=min_time,
+        ),
+        bench(
+            'QuoteCreateResponse.model_validate',
+            lambda: models.QuoteCreateResponse.model_validate(quote_data),
+            min_time=min_time,
+        ),
+        bench(
+            'QuoteCreateResponse.model_validate_json',
+            lambda: models.QuoteCreateResponse.model_validate_json(quote_json),
+            min_time=min_time,
+        ),
+        bench(
+            'StructuredAddress parse',
+            lambda: address.validate_python(fixtures.ADDRESS_JSON),
+            min_time=min_time,
+        ),
+        bench(
+            'StructuredAddress serialize',
+            lambda: address.dump_python(address_value, mode='json'),
+            min_time=min_time,
+        ),
+        bench(
+            'PhoneNumber validate',
+            lambda: _PhoneNumber(phone_number='+525555555555'),
+            min_time=min_time,
+        ),
+        bench(
+            'PhoneNumber validate (uncached)',
+            lambda: _UncachedPhoneNumber(phone_number='+525555555555'),
+            min_time=min_time,
+        ),
+    ]
+
+
+if __name__ == '__main__':
+    report(run())
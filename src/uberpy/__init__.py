@@ -1,7 +1,9 @@
 from . import (
     constants,
+    exceptions,
     fields,
     models,
+    webhooks,
 )
 from .core.uberdirect import (
     UberDirect,
@@ -0,0 +1,7 @@
+"""
+Asyncio client, requires the `aio` extra (`pip install uberpy[aio]`).
+"""
+
+from .uberdirect import (
+    AsyncUberDirect,
+)
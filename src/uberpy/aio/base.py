@@ -0,0 +1,604 @@
+import inspect
+from abc import ABC
+from asyncio import FIRST_COMPLETED, Task, create_task, gather, sleep, to_thread, wait
+from time import monotonic, perf_counter, thread_time, time_ns
+from typing import Any, Awaitable, Callable, NotRequired, TypedDict, Unpack
+from urllib.parse import urlsplit, urlunsplit
+
+import httpx
+from pydantic import BaseModel
+
+from uberpy import exceptions
+from uberpy.core.auth import TokenProvider
+from uberpy.core.base import (
+    DEFAULT_JITTER_MAX,
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_MAX_RETRY_AFTER,
+    DEFAULT_RETRIABLE_HTTP_CODES,
+    DEFAULT_TIMEOUT,
+    OAUTH_URL,
+    URL,
+    APIVersion,
+    Body,
+    Headers,
+    Method,
+    OAuthVersion,
+    OptionalArguments,
+    Params,
+    ResponseMode,
+    api_root,
+    build_url,
+    compute_backoff,
+    endpoint_name,
+    parse_body,
+    parse_retry_after,
+    serialize_body,
+)
+from uberpy.core.circuitbreaker import CircuitBreaker
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import AttemptInfo, CallRecorder, Instrumentation
+from uberpy.core.ratelimit import RateLimiter
+from uberpy.core.retry import RetryBudget
+
+type AsyncAccessToken = str | Callable[[], str] | Callable[[], Awaitable[str]]
+
+DEFAULT_MAX_CONNECTIONS = 100
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+DEFAULT_KEEPALIVE_EXPIRY = 5.0
+
+
+class AsyncBaseArguments(TypedDict):
+    timeout: NotRequired[float | None]
+    connect_timeout: NotRequired[float | None]
+    client: NotRequired[httpx.AsyncClient | None]
+    jitter_max: NotRequired[float | None]
+    max_retries: NotRequired[int | None]
+    retriable_http_codes: NotRequired[set[int] | None]
+    rate_limiter: NotRequired[RateLimiter | None]
+    instrumentation: NotRequired[Instrumentation | None]
+    circuit_breaker: NotRequired[CircuitBreaker | None]
+    deadline: NotRequired[float | None]
+    max_retry_after: NotRequired[float | None]
+    retry_budget: NotRequired[RetryBudget | None]
+    hedging: NotRequired[Hedging | None]
+    base_url: NotRequired[str | None]
+
+
+class AsyncBase(ABC):
+    def __init__(
+        self,
+        customer_id: str,
+        access_token: AsyncAccessToken,
+        /,
+        *,
+        version: APIVersion,
+        timeout: float | None = None,
+        connect_timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
+        jitter_max: float | None = None,
+        max_retries: int | None = None,
+        retriable_http_codes: set[int] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float | None = None,
+        max_retry_after: float | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: Hedging | None = None,
+        base_url: str | None = None,
+    ) -> None:
+        self._client = client or create_client()
+        self._timeout = httpx.Timeout(
+            DEFAULT_TIMEOUT if timeout is None else timeout,
+            **({} if connect_timeout is None else {'connect': connect_timeout}),
+        )
+        self._api_root = api_root(version, customer_id, base_url)
+        self._jitter_max = DEFAULT_JITTER_MAX if jitter_max is None else jitter_max
+        self._max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
+        self._customer_id = customer_id
+        self._access_token = access_token
+        self._retriable_http_codes = (
+            DEFAULT_RETRIABLE_HTTP_CODES
+            if retriable_http_codes is None
+            else frozenset(retriable_http_codes)
+        )
+        self._rate_limiter = rate_limiter
+        self._instrumentation = instrumentation
+        self._circuit_breaker = circuit_breaker
+        self._deadline = deadline
+        self._max_retry_after = (
+            DEFAULT_MAX_RETRY_AFTER if max_retry_after is None else max_retry_after
+        )
+        self._retry_budget = retry_budget
+        self._hedging = hedging
+
+    async def _get(
+        self,
+        /,
+        *args: URL,
+        **kwargs: Unpack[OptionalArguments],
+    ):
+        return await self._wrapper(
+            *args,
+            **kwargs,
+            method='GET',
+        )
+
+    async def _put(
+        self,
+        body: Body,
+        /,
+        *args: URL,
+        **kwargs: Unpack[OptionalArguments],
+    ):
+        return await self._wrapper(
+            *args,
+            **kwargs,
+            body=body,
+            method='PUT',
+        )
+
+    async def _post(
+        self,
+        body: Body,
+        /,
+        *args: URL,
+        **kwargs: Unpack[OptionalArguments],
+    ):
+        return await self._wrapper(
+            *args,
+            **kwargs,
+            body=body,
+            method='POST',
+        )
+
+    async def _patch(
+        self,
+        body: Body,
+        /,
+        *args: URL,
+        **kwargs: Unpack[OptionalArguments],
+    ):
+        return await self._wrapper(
+            *args,
+            **kwargs,
+            body=body,
+            method='PATCH',
+        )
+
+    async def _delete(
+        self,
+        /,
+        data: Body | None = None,
+        *args: URL,
+        **kwargs: Unpack[OptionalArguments],
+    ):
+        return await self._wrapper(
+            *args,
+            **kwargs,
+            body=data,
+            method='DELETE',
+        )
+
+    async def _wrapper(
+        self,
+        *args: URL,
+        body: Body | None = None,
+        params: Params | None = None,
+        method: Method,
+        headers: Headers | None = None,
+        model: type[BaseModel] | None = None,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+        hedge: bool = False,
+    ) -> Any:
+        send = self._hedged_send if hedge and self._hedging else self._send
+        if self._instrumentation is None:
+            content = await send(
+                *args,
+                body=body,
+                params=params,
+                method=method,
+                headers=headers,
+                deadline=deadline,
+            )
+            return parse_body(model, content, response_mode)
+
+        recorder = CallRecorder(
+            self._instrumentation,
+            method,
+            endpoint_name(*args),
+            args,
+        )
+        try:
+            content = await send(
+                *args,
+                body=body,
+                params=params,
+                method=method,
+                headers=headers,
+                deadline=deadline,
+                recorder=recorder,
+            )
+            started, cpu_started = perf_counter(), thread_time()
+            result = parse_body(model, content, response_mode)
+        except Exception as e:
+            recorder.giveup(e)
+            raise
+        recorder.success(
+            result,
+            perf_counter() - started,
+            thread_time() - cpu_started,
+        )
+        return result
+
+    async def _hedged_send(
+        self,
+        *args: URL,
+        method: Method,
+        recorder: CallRecorder | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        `_send` hedged by a second identical request when the first one is slow,
+        see `uberpy.core.hedging.Hedging`.
+        """
+        hedging = self._hedging
+        assert hedging
+        key = f'{method} {endpoint_name(*args)}'
+
+        async def send(recorder: CallRecorder | None) -> bytes:
+            return await self._send(
+                *args,
+                method=method,
+                recorder=recorder,
+                hedge_key=key,
+                **kwargs,
+            )
+
+        # every request records its attempts apart, only the winner's are kept
+        def fork() -> CallRecorder | None:
+            return None if recorder is None else recorder.fork()
+
+        primary_recorder = fork()
+        primary = create_task(send(primary_recorder))
+        recorders: dict[Task[bytes], CallRecorder | None] = {primary: primary_recorder}
+        try:
+            delay = hedging.delay(key)
+            if (
+                delay is not None
+                and not (await wait({primary}, timeout=delay))[0]
+                and hedging.acquire(key)
+            ):
+                hedge_recorder = fork()
+                recorders[create_task(send(hedge_recorder))] = hedge_recorder
+
+            winner = None
+            pending = set(recorders)
+            while pending and winner is None:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                winner = next((task for task in done if not task.exception()), None)
+            if winner is None:
+                # every request failed, raise the primary's error
+                winner = primary
+            elif winner is not primary:
+                hedging.won(key)
+            winner_recorder = recorders[winner]
+            if recorder is not None and winner_recorder is not None:
+                recorder.merge(winner_recorder)
+            return winner.result()
+        finally:
+            # the loser is cancelled
+            for task in recorders:
+                task.cancel()
+
+    async def _send(
+        self,
+        *args: URL,
+        body: Body | None = None,
+        params: Params | None = None,
+        method: Method,
+        headers: Headers | None = None,
+        deadline: float | None = None,
+        recorder: CallRecorder | None = None,
+        hedge_key: str | None = None,
+    ) -> bytes:
+        retries = 0
+        endpoint = endpoint_name(*args)
+        deadline = self._deadline if deadline is None else deadline
+        expires = None if deadline is None else monotonic() + deadline
+        if self._retry_budget:
+            self._retry_budget.deposit()
+        while True:
+            # fail fast, including between retries, before taking a rate limit slot
+            if self._circuit_breaker:
+                try:
+                    self._circuit_breaker.acquire(self._customer_id, endpoint)
+                except exceptions.CircuitOpenError as e:
+                    if recorder is not None:
+                        recorder.start_attempt()
+                        recorder.after_response(error=e)
+                    raise
+            try:
+                if self._rate_limiter:
+                    # the attempt timeout is computed from what is left after the wait
+                    await sleep(
+                        self._rate_limiter.reserve(
+                            self._customer_id,
+                            endpoint,
+                            remaining=None
+                            if expires is None
+                            else expires - monotonic(),
+                        )
+                    )
+                attempt = None if recorder is None else recorder.start_attempt()
+                access_token = await self._get_access_token()
+                if recorder is not None:
+                    recorder.before_request()
+                try:
+                    timeout = self._attempt_timeout(expires)
+                except exceptions.DeadlineExceeded as e:
+                    if recorder is not None:
+                        recorder.after_response(error=e)
+                    raise
+            except BaseException:
+                # not sent, no outcome to record
+                if self._circuit_breaker:
+                    self._circuit_breaker.release(self._customer_id, endpoint)
+                raise
+            started = monotonic()
+            # unclassified errors record no outcome
+            failure: bool | None = None
+            try:
+                response = await self._request(
+                    *args,
+                    body=body,
+                    params=params,
+                    method=method,
+                    headers=headers,
+                    access_token=access_token,
+                    timeout=timeout,
+                    attempt=attempt,
+                )
+                failure = False
+                if hedge_key is not None and self._hedging:
+                    self._hedging.record(hedge_key, monotonic() - started)
+                if self._rate_limiter:
+                    self._rate_limiter.succeeded(self._customer_id, endpoint)
+                if recorder is not None:
+                    recorder.after_response()
+                return response
+            except httpx.HTTPStatusError as e:
+                exception: Exception = e
+                failure = e.response.status_code >= 500
+                retry_after = e.response.headers.get('Retry-After')
+                if recorder is not None:
+                    recorder.after_response(
+                        error=e,
+                        retry_after=parse_retry_after(retry_after),
+                    )
+                if self._rate_limiter and e.response.status_code == 429:
+                    self._rate_limiter.throttled(
+                        self._customer_id,
+                        endpoint,
+                        retry_after=parse_retry_after(retry_after),
+                    )
+                if e.response.status_code not in self._retriable_http_codes:
+                    raise
+                # refresh the stale token once and retry right away
+                invalidate = getattr(self._access_token, 'invalidate', None)
+                if e.response.status_code == 401 and invalidate:
+                    await to_thread(invalidate, access_token)
+                    backoff = 0.0
+                else:
+                    backoff = compute_backoff(
+                        retries,
+                        self._jitter_max,
+                        retry_after=retry_after,
+                        max_retry_after=self._max_retry_after,
+                    )
+            except httpx.TransportError as e:
+                exception = e
+                failure = True
+                if recorder is not None:
+                    recorder.after_response(error=e)
+                backoff = compute_backoff(retries, self._jitter_max)
+            finally:
+                if self._circuit_breaker:
+                    if failure is None:
+                        self._circuit_breaker.release(self._customer_id, endpoint)
+                    else:
+                        self._circuit_breaker.record(
+                            self._customer_id,
+                            endpoint,
+                            failure=failure,
+                        )
+            if not self._can_retry(retries, backoff, monotonic() - started, expires):
+                raise exception
+            if recorder is not None:
+                recorder.retry(backoff)
+            if backoff:
+                await sleep(backoff)
+            retries += 1
+
+    def _attempt_timeout(self, expires: float | None, /) -> httpx.Timeout:
+        if expires is None:
+            return self._timeout
+        remaining = expires - monotonic()
+        if remaining <= 0:
+            raise exceptions.DeadlineExceeded('deadline exceeded')
+        return cap_timeout(self._timeout, remaining)
+
+    def _can_retry(
+        self,
+        retries: int,
+        backoff: float,
+        duration: float,
+        expires: float | None,
+        /,
+    ) -> bool:
+        """
+        Whether another attempt, expected to last as long as the failed one, can
+        finish before the deadline and fits in the retry budget.
+        """
+        if retries >= self._max_retries:
+            return False
+        if expires is not None and monotonic() + backoff + duration > expires:
+            return False
+        return self._retry_budget is None or self._retry_budget.withdraw()
+
+    async def warmup(self, connections: int = 1) -> int:
+        """
+        Open up to `connections` pooled connections to the API host ahead of the
+        first requests, so they do not pay TCP and TLS handshakes.
+
+        Returns the number of successful handshakes.
+        """
+        origin = urlunsplit(urlsplit(self._api_root)[:2] + ('/', '', ''))
+
+        async def connect() -> bool:
+            try:
+                await self._client.head(origin, timeout=self._timeout)
+            except httpx.HTTPError:
+                return False
+            return True
+
+        return sum(await gather(*(connect() for _ in range(connections))))
+
+    async def _get_access_token(self) -> str:
+        access_token = self._access_token
+        # fetching a token blocks, keep it off the event loop
+        if isinstance(access_token, TokenProvider) and not access_token.fresh:
+            return await to_thread(access_token)
+        if not callable(access_token):
+            return access_token
+        token = access_token()
+        if inspect.isawaitable(token):
+            return await token
+        return token
+
+    async def _request(
+        self,
+        *args: URL,
+        body: Body | None = None,
+        params: Params | None = None,
+        method: Method,
+        headers: Headers | None = None,
+        access_token: str,
+        timeout: httpx.Timeout | None = None,
+        attempt: AttemptInfo | None = None,
+    ) -> bytes:
+        # copy headers to avoid mutating caller dict
+        headers = {**(headers or {})}
+        headers['Authorization'] = f'Bearer {access_token}'
+        headers.setdefault('Accept', 'application/json')
+
+        started, cpu_started = perf_counter(), thread_time()
+        payload = serialize_body(body)
+        serialized, cpu_serialized = perf_counter(), thread_time()
+        try:
+            response = await self._client.request(
+                url=build_url(self._api_root, *args),
+                json=payload,
+                method=method,
+                params=params,
+                headers=headers,
+                timeout=self._timeout if timeout is None else timeout,
+            )
+        finally:
+            if attempt is not None:
+                attempt['end_time'] = time_ns()
+                attempt['serialization_duration'] = serialized - started
+                attempt['serialization_cpu'] = cpu_serialized - cpu_started
+                attempt['network_duration'] = perf_counter() - serialized
+
+        if attempt is not None:
+            attempt['status_code'] = response.status_code
+            attempt['response_size'] = len(response.content)
+
+        response.raise_for_status()
+
+        if response.status_code == 204:
+            return b''
+
+        return response.content
+
+    @staticmethod
+    async def get_access_token(
+        *,
+        version: OAuthVersion = 'v2',
+        client_id: str,
+        client_secret: str,
+        client: httpx.AsyncClient | None = None,
+    ) -> str:
+        # oauth endpoint
+        url = f'{OAUTH_URL}/{version}/token'
+
+        # data
+        data = {
+            'scope': 'eats.deliveries',
+            'client_id': client_id,
+            'grant_type': 'client_credentials',
+            'client_secret': client_secret,
+        }
+
+        # request
+        if client is None:
+            async with httpx.AsyncClient() as new_client:
+                response = await new_client.post(
+                    url=url,
+                    data=data,
+                    timeout=DEFAULT_TIMEOUT,
+                )
+        else:
+            response = await client.post(
+                url=url,
+                data=data,
+                timeout=DEFAULT_TIMEOUT,
+            )
+
+        # assert response
+        response.raise_for_status()
+
+        # decode jwt
+        jwt = response.json()
+
+        return jwt['access_token']
+
+
+def cap_timeout(timeout: httpx.Timeout, remaining: float, /) -> httpx.Timeout:
+    """
+    HTTP timeout of an attempt, cut to the `remaining` seconds of the deadline.
+    """
+    return httpx.Timeout(
+        **{
+            name: remaining if value is None else min(value, remaining)
+            for name, value in timeout.as_dict().items()
+        }
+    )
+
+
+def create_client(
+    *,
+    max_connections: int | None = None,
+    max_keepalive_connections: int | None = None,
+    keepalive_expiry: float | None = None,
+) -> httpx.AsyncClient:
+    """
+    Pooled async HTTP client shared by the whole client tree.
+
+    `keepalive_expiry` is the idle time after which pooled connections are closed.
+    """
+    return httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS
+            if max_connections is None
+            else max_connections,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            if max_keepalive_connections is None
+            else max_keepalive_connections,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY
+            if keepalive_expiry is None
+            else keepalive_expiry,
+        ),
+    )
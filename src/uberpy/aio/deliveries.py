@@ -0,0 +1,382 @@
+import asyncio
+from itertools import islice
+from typing import AsyncIterator, Iterable, Literal, Self, overload
+
+from uberpy import models
+from uberpy.aio.base import AsyncBase
+from uberpy.core.base import ResponseMode
+from uberpy.core.deliveries import (
+    DEFAULT_MAX_CONCURRENCY,
+    DEFAULT_PAGE_SIZE,
+    DeliveryBatchSummary,
+    DeliveryResult,
+    list_params,
+    with_idempotency_key,
+)
+
+
+class AsyncDeliveryBatch:
+    """
+    Async iterator counterpart of `uberpy.core.deliveries.DeliveryBatch`.
+    """
+
+    def __init__(self, results: AsyncIterator[DeliveryResult], /) -> None:
+        self._results = results
+        self.summary = DeliveryBatchSummary(
+            total=0,
+            succeeded=0,
+            failed=0,
+        )
+
+    def __aiter__(self) -> Self:
+        return self
+
+    async def __anext__(self) -> DeliveryResult:
+        request, result = await anext(self._results)
+        self.summary['total'] += 1
+        if isinstance(result, Exception):
+            self.summary['failed'] += 1
+        else:
+            self.summary['succeeded'] += 1
+        return request, result
+
+
+class Deliveries(AsyncBase):
+    """
+    Deliveries
+
+    https://developer.uber.com/docs/deliveries/api-reference/daas#tag/Delivery
+    """
+
+    @overload
+    async def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    async def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    async def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return await self._post(
+            request,
+            'deliveries',
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    async def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    async def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    async def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return await self._post(
+            request,
+            'deliveries',
+            delivery_id,
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    async def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    async def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    async def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return await self._post(
+            {},
+            'deliveries',
+            delivery_id,
+            'cancel',
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    async def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.DeliveryProofOfDeliveryResponse: ...
+
+    @overload
+    async def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.DeliveryProofOfDeliveryResponse]: ...
+
+    @overload
+    async def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> (
+        models.DeliveryProofOfDeliveryResponse
+        | models.LazyModel[models.DeliveryProofOfDeliveryResponse]
+        | bytes
+    ):
+        return await self._post(
+            request,
+            'deliveries',
+            delivery_id,
+            'proof-of-delivery',
+            model=models.DeliveryProofOfDeliveryResponse,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    async def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    async def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    async def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return await self._get(
+            'deliveries',
+            delivery_id,
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+            hedge=True,
+        )
+
+    async def list_deliveries(
+        self,
+        *,
+        filter: str | None = None,
+        page_size: int | None = None,
+        deadline: float | None = None,
+    ) -> AsyncIterator[models.Delivery]:
+        """
+        Async counterpart of `uberpy.core.deliveries.Deliveries.list_deliveries`.
+        """
+        page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+
+        async def fetch(offset: int) -> models.DeliveryList:
+            return await self._get(
+                'deliveries',
+                params=list_params(filter, page_size, offset),
+                model=models.DeliveryList,
+                deadline=deadline,
+            )
+
+        task: asyncio.Task[models.DeliveryList] | None = asyncio.create_task(fetch(0))
+        offset = 0
+        try:
+            while task is not None:
+                page = await task
+                offset += len(page.data)
+                task = (
+                    asyncio.create_task(fetch(offset))
+                    if page.next_href and page.data
+                    else None
+                )
+                for delivery in page.data:
+                    yield delivery
+        finally:
+            if task is not None:
+                task.cancel()
+
+    def create_deliveries(
+        self,
+        *,
+        requests: Iterable[models.DeliveryCreateRequest],
+        max_concurrency: int | None = None,
+    ) -> AsyncDeliveryBatch:
+        """
+        Create deliveries concurrently, see
+        `uberpy.core.deliveries.Deliveries.create_deliveries`.
+        """
+        return AsyncDeliveryBatch(
+            self._create_deliveries(
+                requests,
+                DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency,
+            ),
+        )
+
+    async def _create_deliveries(
+        self,
+        requests: Iterable[models.DeliveryCreateRequest],
+        max_concurrency: int,
+        /,
+    ) -> AsyncIterator[DeliveryResult]:
+        iterator = iter(requests)
+        pending: dict[asyncio.Task[models.Delivery], models.DeliveryCreateRequest] = {}
+
+        def submit(count: int) -> None:
+            for request in islice(iterator, count):
+                request = with_idempotency_key(request)
+                task = asyncio.create_task(self.create_delivery(request=request))
+                pending[task] = request
+
+        submit(max_concurrency)
+        try:
+            while pending:
+                done, _ = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in done:
+                    request = pending.pop(task)
+                    result: models.Delivery | Exception
+                    try:
+                        result = task.result()
+                    except Exception as e:
+                        result = e
+                    yield request, result
+                submit(len(done))
+        finally:
+            for task in pending:
+                task.cancel()
@@ -0,0 +1,199 @@
+import asyncio
+from typing import Callable, Literal, Sequence, Unpack, overload
+
+from uberpy import models
+from uberpy.aio.base import AsyncAccessToken, AsyncBase, AsyncBaseArguments
+from uberpy.core.base import APIVersion, ResponseMode
+from uberpy.core.quotes import (
+    DEFAULT_MAX_CONCURRENCY,
+    QuoteCache,
+    QuoteResult,
+    quote_key,
+)
+from uberpy.core.singleflight import AsyncSingleFlight
+
+
+class Quotes(AsyncBase):
+    """
+    Quotes
+
+    https://developer.uber.com/docs/deliveries/api-reference/daas#tag/Quotes
+    """
+
+    def __init__(
+        self,
+        customer_id: str,
+        access_token: AsyncAccessToken,
+        /,
+        *,
+        version: APIVersion,
+        cache: QuoteCache | None = None,
+        coalesce: bool = False,
+        **kwargs: Unpack[AsyncBaseArguments],
+    ) -> None:
+        super().__init__(
+            customer_id,
+            access_token,
+            version=version,
+            **kwargs,
+        )
+        self._cache = cache
+        self._single_flight: AsyncSingleFlight[models.QuoteCreateResponse] | None = (
+            AsyncSingleFlight() if coalesce else None
+        )
+
+    @overload
+    async def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.QuoteCreateResponse: ...
+
+    @overload
+    async def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.QuoteCreateResponse]: ...
+
+    @overload
+    async def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    async def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> (
+        models.QuoteCreateResponse
+        | models.LazyModel[models.QuoteCreateResponse]
+        | bytes
+    ):
+        """
+        Quote for `request`, `lazy` and `raw` response modes bypass the cache and
+        request coalescing. Coalesced requests share the deadline of the first one.
+        """
+        if response_mode != 'model':
+            return await self._post(
+                request,
+                'delivery_quotes',
+                model=models.QuoteCreateResponse,
+                response_mode=response_mode,
+                deadline=deadline,
+                hedge=True,
+            )
+
+        if self._cache is None and self._single_flight is None:
+            return await self._create_quote(request, deadline)
+
+        key = quote_key(self._customer_id, request)
+        if self._cache is not None and (quote := self._cache.get(key)):
+            return quote
+
+        if self._single_flight is None:
+            return await self._create_cached_quote(key, request, deadline)
+
+        return await self._single_flight.do(
+            key,
+            lambda: self._create_cached_quote(key, request, deadline),
+        )
+
+    async def _create_cached_quote(
+        self,
+        key: str,
+        request: models.QuoteCreateRequest,
+        deadline: float | None,
+        /,
+    ) -> models.QuoteCreateResponse:
+        quote = await self._create_quote(request, deadline)
+        if self._cache is not None:
+            self._cache.set(key, quote)
+        return quote
+
+    async def _create_quote(
+        self,
+        request: models.QuoteCreateRequest,
+        deadline: float | None,
+        /,
+    ) -> models.QuoteCreateResponse:
+        return await self._post(
+            request,
+            'delivery_quotes',
+            model=models.QuoteCreateResponse,
+            deadline=deadline,
+            hedge=True,
+        )
+
+    async def create_quotes(
+        self,
+        *,
+        requests: Sequence[models.QuoteCreateRequest],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+        accept: Callable[[models.QuoteCreateResponse], bool] | None = None,
+    ) -> list[QuoteResult]:
+        """
+        Request several quotes concurrently, see `uberpy.core.quotes.Quotes.create_quotes`.
+
+        Quotes still in flight when returning are cancelled.
+        """
+        results: list[QuoteResult] = [None] * len(requests)
+        if not requests:
+            return results
+
+        semaphore = asyncio.Semaphore(
+            DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency,
+        )
+
+        async def create_quote(
+            request: models.QuoteCreateRequest,
+        ) -> models.QuoteCreateResponse:
+            async with semaphore:
+                return await self.create_quote(request=request, deadline=deadline)
+
+        tasks = {
+            asyncio.create_task(create_quote(request)): index
+            for index, request in enumerate(requests)
+        }
+        loop = asyncio.get_running_loop()
+        timeout_at = None if deadline is None else loop.time() + deadline
+        pending = set(tasks)
+        try:
+            while pending:
+                timeout = (
+                    None if timeout_at is None else max(timeout_at - loop.time(), 0)
+                )
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # deadline elapsed
+                if not done:
+                    break
+                for task in done:
+                    index = tasks[task]
+                    try:
+                        quote = task.result()
+                    except Exception as e:
+                        results[index] = e
+                        continue
+                    results[index] = quote
+                    if accept and accept(quote):
+                        return results
+        finally:
+            for task in pending:
+                task.cancel()
+
+        return results
@@ -0,0 +1,130 @@
+from types import TracebackType
+from typing import Self
+
+import httpx
+
+from uberpy.aio.base import AsyncAccessToken, AsyncBase, create_client
+from uberpy.aio.deliveries import Deliveries
+from uberpy.aio.quotes import Quotes
+from uberpy.core.base import APIVersion
+from uberpy.core.circuitbreaker import CircuitBreaker
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import Instrumentation
+from uberpy.core.quotes import QuoteCache
+from uberpy.core.ratelimit import RateLimiter
+from uberpy.core.retry import RetryBudget
+
+
+class AsyncUberDirect(AsyncBase):
+    """
+    Asyncio counterpart of `uberpy.UberDirect`.
+
+    Quotes and deliveries share a single pooled `httpx.AsyncClient`, close it with
+    `aclose` or by using the client as an async context manager.
+    """
+
+    def __init__(
+        self,
+        customer_id: str,
+        access_token: AsyncAccessToken,
+        /,
+        *,
+        version: APIVersion,
+        timeout: float | None = None,
+        connect_timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
+        jitter_max: float | None = None,
+        max_retries: int | None = None,
+        retriable_http_codes: set[int] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float | None = None,
+        max_retry_after: float | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: Hedging | None = None,
+        base_url: str | None = None,
+        quote_cache: QuoteCache | None = None,
+        coalesce_quotes: bool = False,
+        max_connections: int | None = None,
+        max_keepalive_connections: int | None = None,
+        keepalive_expiry: float | None = None,
+    ) -> None:
+        client = client or create_client(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        super().__init__(
+            customer_id,
+            access_token,
+            version=version,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            client=client,
+            jitter_max=jitter_max,
+            max_retries=max_retries,
+            retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
+        )
+        self.quotes = Quotes(
+            customer_id,
+            access_token,
+            version=version,
+            cache=quote_cache,
+            coalesce=coalesce_quotes,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            client=client,
+            jitter_max=jitter_max,
+            max_retries=max_retries,
+            retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
+        )
+        self.deliveries = Deliveries(
+            customer_id,
+            access_token,
+            version=version,
+            timeout=timeout,
+            connect_timeout=connect_timeout,
+            client=client,
+            jitter_max=jitter_max,
+            max_retries=max_retries,
+            retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
+        )
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -3,6 +3,7 @@ from .deliveries import (
     DeliveryDeliverableAction,
     DeliveryManifestItemSize,
     DeliveryPincodeRequirementType,
+    DeliveryStatus,
     DeliveryUndeliverableAction,
 )
 from .proof_of_delivery import (
@@ -13,3 +14,6 @@ from .robocourier import (
     RoboCourierCancelReason,
     RoboCourierMode,
 )
+from .webhooks import (
+    WebhookEventKind,
+)
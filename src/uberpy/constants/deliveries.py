@@ -74,3 +74,44 @@ class DeliveryDeliverableAction(StrEnum):
     """
     The “happy path” action for the courier to take on a delivery. When used, delivery action can be set to “leave at door” for a contactless delivery. Cannot leave at door when signature or ID verification requirements are applied when creating a delivery. Photo confirmation of delivery will be automatically applied as a requirement to complete drop-off.
     """
+
+
+class DeliveryStatus(StrEnum):
+    """
+    Current status of a delivery.
+    """
+
+    PENDING = 'pending'
+    """
+    Delivery has been accepted but does not yet have a courier assigned.
+    """
+
+    PICKUP = 'pickup'
+    """
+    Courier is assigned and is en route to pick up the items.
+    """
+
+    PICKUP_COMPLETE = 'pickup_complete'
+    """
+    Courier is moving towards the dropoff.
+    """
+
+    DROPOFF = 'dropoff'
+    """
+    Courier is at the dropoff location.
+    """
+
+    DELIVERED = 'delivered'
+    """
+    Courier has completed the dropoff.
+    """
+
+    CANCELED = 'canceled'
+    """
+    Delivery has been canceled.
+    """
+
+    RETURNED = 'returned'
+    """
+    The delivery was canceled and a new job created to return items to the sender.
+    """
@@ -0,0 +1,18 @@
+from enum import StrEnum
+
+
+class WebhookEventKind(StrEnum):
+    DELIVERY_STATUS = 'event.delivery_status'
+    """
+    The status of a delivery changed.
+    """
+
+    COURIER_UPDATE = 'event.courier_update'
+    """
+    The courier location or details changed.
+    """
+
+    REFUND_REQUEST = 'event.refund_request'
+    """
+    A refund was requested for a delivery.
+    """
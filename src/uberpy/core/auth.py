@@ -0,0 +1,127 @@
+import threading
+from time import monotonic
+
+import requests
+
+from uberpy.core.base import OAUTH_URL, Base, OAuthVersion
+
+DEFAULT_EXPIRES_IN = 2592000
+DEFAULT_REFRESH_MARGIN = 300
+DEFAULT_REFRESH_RETRY = 10
+
+
+class TokenProvider:
+    """
+    Thread-safe, cached OAuth access token.
+
+    Pass it as the `access_token` of `UberDirect`: the token is fetched once, kept
+    for its `expires_in` and refreshed `refresh_margin` seconds before it expires by
+    a single background refresher. When the API answers 401 the client calls
+    `invalidate` with the rejected token, which refreshes it at most once no matter
+    how many requests failed with it.
+    """
+
+    def __init__(
+        self,
+        *,
+        client_id: str,
+        client_secret: str,
+        version: OAuthVersion = 'v2',
+        refresh_margin: float | None = None,
+        background_refresh: bool = True,
+        oauth_url: str = OAUTH_URL,
+        session: requests.Session | None = None,
+    ) -> None:
+        self._client_id = client_id
+        self._client_secret = client_secret
+        self._version: OAuthVersion = version
+        self._refresh_margin = (
+            DEFAULT_REFRESH_MARGIN if refresh_margin is None else refresh_margin
+        )
+        self._background_refresh = background_refresh
+        self._oauth_url = oauth_url
+        self._session = session
+        self._lock = threading.Lock()
+        self._timer: threading.Timer | None = None
+        self._token: str | None = None
+        self._expires_at = 0.0
+        self._refresh_at = 0.0
+        self._closed = False
+        self.refreshes = 0
+
+    def __call__(self) -> str:
+        token = self._token
+        if token is not None and self._usable(monotonic()):
+            return token
+        return self._refresh(token)
+
+    @property
+    def fresh(self) -> bool:
+        """
+        Whether calling the provider returns right away without fetching a token.
+        """
+        return self._token is not None and self._usable(monotonic())
+
+    def _usable(self, now: float, /) -> bool:
+        if now < self._refresh_at:
+            return True
+        # the background refresher replaces the token before it expires
+        return self._timer is not None and now < self._expires_at
+
+    def invalidate(self, token: str, /) -> str:
+        """
+        Refresh the token unless it was already refreshed since `token` was issued.
+        """
+        return self._refresh(token)
+
+    def close(self) -> None:
+        """
+        Stop the background refresher.
+        """
+        with self._lock:
+            self._closed = True
+            if self._timer:
+                self._timer.cancel()
+                self._timer = None
+
+    def _refresh(self, stale: str | None, /) -> str:
+        with self._lock:
+            # someone else refreshed it while we waited for the lock
+            if self._token is not None and self._token != stale:
+                return self._token
+
+            jwt = Base.request_access_token(
+                version=self._version,
+                client_id=self._client_id,
+                client_secret=self._client_secret,
+                oauth_url=self._oauth_url,
+                session=self._session,
+            )
+            expires_in = jwt.get('expires_in', DEFAULT_EXPIRES_IN)
+            now = monotonic()
+            self._token = jwt['access_token']
+            self._expires_at = now + expires_in
+            self._refresh_at = self._expires_at - min(
+                self._refresh_margin,
+                expires_in / 2,
+            )
+            self.refreshes += 1
+            self._schedule(self._refresh_at - now)
+            return self._token
+
+    def _schedule(self, delay: float, /) -> None:
+        if not self._background_refresh or self._closed:
+            return
+        if self._timer:
+            self._timer.cancel()
+        self._timer = threading.Timer(delay, self._refresh_in_background)
+        self._timer.daemon = True
+        self._timer.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self._refresh(self._token)
+        except Exception:
+            # keep serving the current token and try again shortly
+            with self._lock:
+                self._schedule(DEFAULT_REFRESH_RETRY)
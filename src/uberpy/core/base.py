@@ -1,12 +1,24 @@
+import json
 import random
 from abc import ABC
-from time import sleep
-from typing import Any, Callable, Literal, NotRequired, TypedDict, Unpack
-from urllib.parse import quote
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from time import monotonic, perf_counter, sleep, thread_time, time_ns
+from typing import Any, Callable, Literal, NotRequired, TypedDict, Unpack, overload
+from urllib.parse import quote, urlsplit, urlunsplit
 
 import requests
 from pydantic import BaseModel
 
+from uberpy import exceptions
+from uberpy.core.circuitbreaker import CircuitBreaker
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import AttemptInfo, CallRecorder, Instrumentation
+from uberpy.core.ratelimit import RateLimiter
+from uberpy.core.retry import RetryBudget
+from uberpy.core.session import ThreadLocalSession
+from uberpy.models.lazy import LazyModel
+
 type URL = str | int
 type Body = dict | BaseModel
 type Params = dict
@@ -15,25 +27,194 @@ type Headers = dict
 type APIVersion = Literal['v1']
 type OAuthVersion = Literal['v2']
 type AccessToken = str | Callable[[], str]
+type ResponseMode = Literal['model', 'lazy', 'raw']
+type Timeout = float | tuple[float, float]
+type Session = requests.Session | ThreadLocalSession
 
 BASE_URL = 'https://api.uber.com/{version}/customers/{customer_id}'
 OAUTH_URL = 'https://auth.uber.com/oauth'
 DEFAULT_TIMEOUT = 10
 DEFAULT_JITTER_MAX = 0.5
 DEFAULT_MAX_RETRIES = 3
-DEFAULT_RETRIABLE_HTTP_CODES = {
-    401,
-    429,
-    500,
-    502,
-    503,
-    504,
-}
+DEFAULT_MAX_RETRY_AFTER = 20.0
+DEFAULT_RETRIABLE_HTTP_CODES = frozenset(
+    (
+        401,
+        429,
+        500,
+        502,
+        503,
+        504,
+    )
+)
 
 
 class OptionalArguments(TypedDict):
     params: NotRequired[Params | None]
     headers: NotRequired[Headers | None]
+    model: NotRequired[type[BaseModel] | None]
+    response_mode: NotRequired[ResponseMode]
+    deadline: NotRequired[float | None]
+    hedge: NotRequired[bool]
+
+
+class AccessTokenResponse(TypedDict):
+    access_token: str
+    token_type: NotRequired[str]
+    expires_in: NotRequired[int]
+    scope: NotRequired[str]
+
+
+class BaseArguments(TypedDict):
+    timeout: NotRequired[float | None]
+    connect_timeout: NotRequired[float | None]
+    session: NotRequired[Session | None]
+    jitter_max: NotRequired[float | None]
+    max_retries: NotRequired[int | None]
+    retriable_http_codes: NotRequired[set[int] | None]
+    rate_limiter: NotRequired[RateLimiter | None]
+    instrumentation: NotRequired[Instrumentation | None]
+    circuit_breaker: NotRequired[CircuitBreaker | None]
+    deadline: NotRequired[float | None]
+    max_retry_after: NotRequired[float | None]
+    retry_budget: NotRequired[RetryBudget | None]
+    hedging: NotRequired[Hedging | None]
+    base_url: NotRequired[str | None]
+
+
+def build_url(api_root: str, /, *args: URL) -> str:
+    """
+    Safe URL join without double slashes and with path segment quoting.
+    """
+    path_segments = [api_root.rstrip('/')]
+    path_segments.extend(quote(str(arg).strip('/'), safe='') for arg in args)
+    return '/'.join(path_segments)
+
+
+def serialize_body(body: Body | None, /) -> dict | None:
+    """
+    Serialize pydantic models, plain dicts are sent as is.
+    """
+    if isinstance(body, BaseModel):
+        return body.model_dump(
+            mode='json',
+            exclude_none=True,
+        )
+    return body
+
+
+@overload
+def parse_response[M: BaseModel](
+    model: type[M],
+    content: bytes,
+    /,
+    mode: Literal['model'] = 'model',
+) -> M: ...
+
+
+@overload
+def parse_response[M: BaseModel](
+    model: type[M],
+    content: bytes,
+    /,
+    mode: ResponseMode,
+) -> M | LazyModel[M] | bytes: ...
+
+
+def parse_response[M: BaseModel](
+    model: type[M],
+    content: bytes,
+    /,
+    mode: ResponseMode = 'model',
+) -> M | LazyModel[M] | bytes:
+    """
+    Response body as `raw` bytes, a `lazy` model validated on first access or a
+    `model` validated straight from the JSON bytes.
+    """
+    if mode == 'raw':
+        return content
+    if mode == 'lazy':
+        return LazyModel(model, content or b'{}')
+    return model.model_validate_json(content or b'{}')
+
+
+def parse_body(
+    model: type[BaseModel] | None,
+    content: bytes,
+    /,
+    mode: ResponseMode = 'model',
+) -> Any:
+    """
+    `parse_response`, or without a model the decoded JSON body, `{}` when empty,
+    and the bytes in `raw` mode.
+    """
+    if model is not None:
+        return parse_response(model, content, mode)
+    if mode == 'raw':
+        return content
+    return json.loads(content) if content else {}
+
+
+def parse_retry_after(retry_after: str | None, /) -> float | None:
+    """
+    Retry-After header in seconds, `None` when missing or not in seconds.
+    """
+    if retry_after:
+        try:
+            return float(retry_after)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def compute_backoff(
+    retries: int,
+    jitter_max: float,
+    /,
+    retry_after: str | None = None,
+    max_retry_after: float | None = None,
+) -> float:
+    """
+    Honor Retry-After if present (seconds, capped to `max_retry_after`), else
+    exponential backoff with jitter.
+    """
+    seconds = parse_retry_after(retry_after)
+    if seconds is not None:
+        return seconds if max_retry_after is None else min(seconds, max_retry_after)
+    return min(2**retries, 20) + random.uniform(0, jitter_max)
+
+
+def cap_timeout(timeout: Timeout, remaining: float | None, /) -> Timeout:
+    """
+    HTTP timeout of an attempt, cut to the `remaining` seconds of the deadline.
+    """
+    if remaining is None:
+        return timeout
+    if isinstance(timeout, tuple):
+        connect, read = timeout
+        return min(connect, remaining), min(read, remaining)
+    return min(timeout, remaining)
+
+
+def api_root(
+    version: APIVersion,
+    customer_id: str,
+    /,
+    base_url: str | None = None,
+) -> str:
+    """
+    Customer API root, under `base_url` (e.g. a local test server) when given.
+    """
+    if base_url is None:
+        return BASE_URL.format(version=version, customer_id=customer_id)
+    return f'{base_url.rstrip("/")}/{version}/customers/{customer_id}'
+
+
+def endpoint_name(*args: URL) -> str:
+    """
+    First path segment, e.g. `delivery_quotes` or `deliveries`.
+    """
+    return str(args[0]).strip('/') if args else ''
 
 
 class Base(ABC):
@@ -45,23 +226,45 @@ class Base(ABC):
         *,
         version: APIVersion,
         timeout: float | None = None,
-        session: requests.Session | None = None,
+        connect_timeout: float | None = None,
+        session: Session | None = None,
         jitter_max: float | None = None,
         max_retries: int | None = None,
         retriable_http_codes: set[int] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float | None = None,
+        max_retry_after: float | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: Hedging | None = None,
+        base_url: str | None = None,
     ) -> None:
         self._session = session or requests.Session()
-        self._timeout = DEFAULT_TIMEOUT if timeout is None else timeout
-        self._api_root = BASE_URL.format(version=version, customer_id=customer_id)
+        self._timeout: Timeout = DEFAULT_TIMEOUT if timeout is None else timeout
+        # timeout becomes the read timeout
+        if connect_timeout is not None:
+            self._timeout = (connect_timeout, self._timeout)
+        self._api_root = api_root(version, customer_id, base_url)
         self._jitter_max = DEFAULT_JITTER_MAX if jitter_max is None else jitter_max
         self._max_retries = DEFAULT_MAX_RETRIES if max_retries is None else max_retries
         self._customer_id = customer_id
         self._access_token = access_token
+        # frozen, so callers mutating their set cannot race with requests
         self._retriable_http_codes = (
             DEFAULT_RETRIABLE_HTTP_CODES
             if retriable_http_codes is None
-            else retriable_http_codes
+            else frozenset(retriable_http_codes)
         )
+        self._rate_limiter = rate_limiter
+        self._instrumentation = instrumentation
+        self._circuit_breaker = circuit_breaker
+        self._deadline = deadline
+        self._max_retry_after = (
+            DEFAULT_MAX_RETRY_AFTER if max_retry_after is None else max_retry_after
+        )
+        self._retry_budget = retry_budget
+        self._hedging = hedging
 
     def _get(
         self,
@@ -138,43 +341,299 @@ class Base(ABC):
         params: Params | None = None,
         method: Method,
         headers: Headers | None = None,
+        model: type[BaseModel] | None = None,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+        hedge: bool = False,
     ) -> Any:
+        send = self._hedged_send if hedge and self._hedging else self._send
+        if self._instrumentation is None:
+            content = send(
+                *args,
+                body=body,
+                params=params,
+                method=method,
+                headers=headers,
+                deadline=deadline,
+            )
+            return parse_body(model, content, response_mode)
+
+        recorder = CallRecorder(
+            self._instrumentation,
+            method,
+            endpoint_name(*args),
+            args,
+        )
+        try:
+            content = send(
+                *args,
+                body=body,
+                params=params,
+                method=method,
+                headers=headers,
+                deadline=deadline,
+                recorder=recorder,
+            )
+            started, cpu_started = perf_counter(), thread_time()
+            result = parse_body(model, content, response_mode)
+        except Exception as e:
+            recorder.giveup(e)
+            raise
+        recorder.success(
+            result,
+            perf_counter() - started,
+            thread_time() - cpu_started,
+        )
+        return result
+
+    def _hedged_send(
+        self,
+        *args: URL,
+        method: Method,
+        recorder: CallRecorder | None = None,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        `_send` hedged by a second identical request when the first one is slow,
+        see `uberpy.core.hedging.Hedging`.
+        """
+        hedging = self._hedging
+        assert hedging
+        key = f'{method} {endpoint_name(*args)}'
+
+        def send(recorder: CallRecorder | None) -> bytes:
+            return self._send(
+                *args,
+                method=method,
+                recorder=recorder,
+                hedge_key=key,
+                **kwargs,
+            )
+
+        # every request records its attempts apart, only the winner's are kept
+        def fork() -> CallRecorder | None:
+            return None if recorder is None else recorder.fork()
+
+        delay = hedging.delay(key)
+        primary_recorder = fork()
+        primary = (
+            None
+            if delay is None
+            else hedging.submit_primary(copy_context().run, send, primary_recorder)
+        )
+        if primary is None:
+            # nothing to hedge against yet or no worker free, stay on the calling
+            # thread
+            return send(recorder)
+
+        recorders = {primary: primary_recorder}
+        if not wait({primary}, timeout=delay).done and hedging.acquire(key):
+            hedge_recorder = fork()
+            hedge = hedging.executor.submit(copy_context().run, send, hedge_recorder)
+            recorders[hedge] = hedge_recorder
+
+        winner = None
+        pending = set(recorders)
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            # the loser cannot be interrupted, its response is discarded
+            winner = next((future for future in done if not future.exception()), None)
+        if winner is None:
+            # every request failed, raise the primary's error
+            winner = primary
+        elif winner is not primary:
+            hedging.won(key)
+        winner_recorder = recorders[winner]
+        if recorder is not None and winner_recorder is not None:
+            recorder.merge(winner_recorder)
+        return winner.result()
+
+    def _send(
+        self,
+        *args: URL,
+        body: Body | None = None,
+        params: Params | None = None,
+        method: Method,
+        headers: Headers | None = None,
+        deadline: float | None = None,
+        recorder: CallRecorder | None = None,
+        hedge_key: str | None = None,
+    ) -> bytes:
         retries = 0
-        exception: Exception | None = None
-        while retries <= self._max_retries:
+        endpoint = endpoint_name(*args)
+        deadline = self._deadline if deadline is None else deadline
+        expires = None if deadline is None else monotonic() + deadline
+        if self._retry_budget:
+            self._retry_budget.deposit()
+        while True:
+            # fail fast, including between retries, before taking a rate limit slot
+            if self._circuit_breaker:
+                try:
+                    self._circuit_breaker.acquire(self._customer_id, endpoint)
+                except exceptions.CircuitOpenError as e:
+                    if recorder is not None:
+                        recorder.start_attempt()
+                        recorder.after_response(error=e)
+                    raise
+            try:
+                if self._rate_limiter:
+                    # the attempt timeout is computed from what is left after the wait
+                    sleep(
+                        self._rate_limiter.reserve(
+                            self._customer_id,
+                            endpoint,
+                            remaining=None
+                            if expires is None
+                            else expires - monotonic(),
+                        )
+                    )
+                attempt = None if recorder is None else recorder.start_attempt()
+                access_token = self._get_access_token()
+                if recorder is not None:
+                    recorder.before_request()
+                try:
+                    timeout = self._attempt_timeout(expires)
+                except exceptions.DeadlineExceeded as e:
+                    if recorder is not None:
+                        recorder.after_response(error=e)
+                    raise
+            except BaseException:
+                # not sent, no outcome to record
+                if self._circuit_breaker:
+                    self._circuit_breaker.release(self._customer_id, endpoint)
+                raise
+            started = monotonic()
+            # unclassified errors record no outcome
+            failure: bool | None = None
             try:
-                return self._request(
+                response = self._request(
                     *args,
                     body=body,
                     params=params,
                     method=method,
                     headers=headers,
+                    access_token=access_token,
+                    timeout=timeout,
+                    attempt=attempt,
                 )
+                failure = False
+                if hedge_key is not None and self._hedging:
+                    self._hedging.record(hedge_key, monotonic() - started)
+                if self._rate_limiter:
+                    self._rate_limiter.succeeded(self._customer_id, endpoint)
+                if recorder is not None:
+                    recorder.after_response()
+                return response
             except requests.HTTPError as e:
-                exception = e
-                if e.response.status_code in self._retriable_http_codes:
-                    backoff = min(2**retries, 20) + random.uniform(0, self._jitter_max)
-                    # honor Retry-After if present (seconds), else exponential backoff with jitter
-                    if retry_after := e.response.headers.get('Retry-After'):
-                        try:
-                            backoff = float(retry_after)
-                        except (TypeError, ValueError):
-                            pass
-                    sleep(backoff)
-                    retries += 1
-                    continue
-                raise
+                exception: Exception = e
+                failure = e.response.status_code >= 500
+                retry_after = e.response.headers.get('Retry-After')
+                if recorder is not None:
+                    recorder.after_response(
+                        error=e,
+                        retry_after=parse_retry_after(retry_after),
+                    )
+                if self._rate_limiter and e.response.status_code == 429:
+                    self._rate_limiter.throttled(
+                        self._customer_id,
+                        endpoint,
+                        retry_after=parse_retry_after(retry_after),
+                    )
+                if e.response.status_code not in self._retriable_http_codes:
+                    raise
+                # refresh the stale token once and retry right away
+                invalidate = getattr(self._access_token, 'invalidate', None)
+                if e.response.status_code == 401 and invalidate:
+                    invalidate(access_token)
+                    backoff = 0.0
+                else:
+                    backoff = compute_backoff(
+                        retries,
+                        self._jitter_max,
+                        retry_after=retry_after,
+                        max_retry_after=self._max_retry_after,
+                    )
             except (requests.ConnectionError, requests.Timeout) as e:
                 exception = e
-                backoff = min(2**retries, 20) + random.uniform(0, self._jitter_max)
+                failure = True
+                if recorder is not None:
+                    recorder.after_response(error=e)
+                backoff = compute_backoff(retries, self._jitter_max)
+            finally:
+                if self._circuit_breaker:
+                    if failure is None:
+                        self._circuit_breaker.release(self._customer_id, endpoint)
+                    else:
+                        self._circuit_breaker.record(
+                            self._customer_id,
+                            endpoint,
+                            failure=failure,
+                        )
+            if not self._can_retry(retries, backoff, monotonic() - started, expires):
+                raise exception
+            if recorder is not None:
+                recorder.retry(backoff)
+            if backoff:
                 sleep(backoff)
-                retries += 1
-                continue
+            retries += 1
 
-        # linter
-        assert exception
+    def _attempt_timeout(self, expires: float | None, /) -> Timeout:
+        if expires is None:
+            return self._timeout
+        remaining = expires - monotonic()
+        if remaining <= 0:
+            raise exceptions.DeadlineExceeded('deadline exceeded')
+        return cap_timeout(self._timeout, remaining)
 
-        raise exception
+    def _can_retry(
+        self,
+        retries: int,
+        backoff: float,
+        duration: float,
+        expires: float | None,
+        /,
+    ) -> bool:
+        """
+        Whether another attempt, expected to last as long as the failed one, can
+        finish before the deadline and fits in the retry budget.
+        """
+        if retries >= self._max_retries:
+            return False
+        if expires is not None and monotonic() + backoff + duration > expires:
+            return False
+        return self._retry_budget is None or self._retry_budget.withdraw()
+
+    def warmup(self, connections: int = 1) -> int:
+        """
+        Open up to `connections` pooled connections to the API host ahead of the
+        first requests, so they do not pay TCP and TLS handshakes.
+
+        With a `ThreadLocalSession` every thread has a pool of its own and
+        connections opened from other threads would be lost, only the calling
+        thread's session is warmed, with a single connection as its requests are
+        sequential.
+
+        Returns the number of successful handshakes.
+        """
+        origin = urlunsplit(urlsplit(self._api_root)[:2] + ('/', '', ''))
+
+        def connect(_: int) -> bool:
+            try:
+                self._session.head(origin, timeout=self._timeout)
+            except requests.RequestException:
+                return False
+            return True
+
+        if isinstance(self._session, ThreadLocalSession):
+            return int(connect(0))
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            return sum(executor.map(connect, range(connections)))
+
+    def _get_access_token(self) -> str:
+        access_token = self._access_token
+        if callable(access_token):
+            access_token = access_token()
+        return access_token
 
     def _request(
         self,
@@ -183,44 +642,44 @@ class Base(ABC):
         params: Params | None = None,
         method: Method,
         headers: Headers | None = None,
-    ) -> Any:
+        access_token: str,
+        timeout: Timeout | None = None,
+        attempt: AttemptInfo | None = None,
+    ) -> bytes:
         # copy headers to avoid mutating caller dict
         headers = {**(headers or {})}
-
-        access_token = self._access_token
-        if callable(access_token):
-            access_token = access_token()
-
         headers['Authorization'] = f'Bearer {access_token}'
         headers.setdefault('Accept', 'application/json')
 
-        # safe URL join without double slashes and with path segment quoting
-        path_segments = [self._api_root.rstrip('/')]
-        path_segments.extend(quote(str(arg).strip('/'), safe='') for arg in args)
-        url = '/'.join(path_segments)
-
-        # serialize pydantic models
-        if isinstance(body, BaseModel):
-            body = body.model_dump(
-                mode='json',
-                exclude_none=True,
+        started, cpu_started = perf_counter(), thread_time()
+        payload = serialize_body(body)
+        serialized, cpu_serialized = perf_counter(), thread_time()
+        try:
+            response = self._session.request(
+                url=build_url(self._api_root, *args),
+                json=payload,
+                method=method,
+                params=params,
+                headers=headers,
+                timeout=self._timeout if timeout is None else timeout,
             )
+        finally:
+            if attempt is not None:
+                attempt['end_time'] = time_ns()
+                attempt['serialization_duration'] = serialized - started
+                attempt['serialization_cpu'] = cpu_serialized - cpu_started
+                attempt['network_duration'] = perf_counter() - serialized
 
-        response = self._session.request(
-            url=url,
-            json=body,
-            method=method,
-            params=params,
-            headers=headers,
-            timeout=self._timeout,
-        )
+        if attempt is not None:
+            attempt['status_code'] = response.status_code
+            attempt['response_size'] = len(response.content)
 
         response.raise_for_status()
 
-        if response.status_code == 204 or not response.content:
-            return {}
+        if response.status_code == 204:
+            return b''
 
-        return response.json()
+        return response.content
 
     @staticmethod
     def get_access_token(
@@ -229,8 +688,24 @@ class Base(ABC):
         client_id: str,
         client_secret: str,
     ) -> str:
+        jwt = Base.request_access_token(
+            version=version,
+            client_id=client_id,
+            client_secret=client_secret,
+        )
+        return jwt['access_token']
+
+    @staticmethod
+    def request_access_token(
+        *,
+        version: OAuthVersion = 'v2',
+        client_id: str,
+        client_secret: str,
+        oauth_url: str = OAUTH_URL,
+        session: requests.Session | None = None,
+    ) -> AccessTokenResponse:
         # oauth endpoint
-        url = '/'.join([OAUTH_URL, version, 'token'])
+        url = '/'.join([oauth_url, version, 'token'])
 
         # data
         data = {
@@ -241,7 +716,7 @@ class Base(ABC):
         }
 
         # request
-        response = requests.post(
+        response = (session or requests).post(
             url=url,
             data=data,
             timeout=DEFAULT_TIMEOUT,
@@ -251,6 +726,4 @@ class Base(ABC):
         response.raise_for_status()
 
         # decode jwt
-        jwt = response.json()
-
-        return jwt['access_token']
+        return response.json()
@@ -0,0 +1,242 @@
+import threading
+from collections import deque
+from time import monotonic
+from typing import Literal, TypedDict
+
+from uberpy import exceptions
+
+type CircuitState = Literal['closed', 'open', 'half_open']
+
+DEFAULT_FAILURE_RATE = 0.5
+DEFAULT_MIN_CALLS = 10
+DEFAULT_WINDOW_SIZE = 20
+DEFAULT_OPEN_DURATION = 30.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+
+class CircuitSnapshot(TypedDict):
+    state: CircuitState
+    failure_rate: float
+    calls: int
+    opened: int
+    """
+    Times the circuit opened.
+    """
+
+    retry_after: float | None
+    """
+    Seconds until an open circuit lets probes through.
+    """
+
+
+class Circuit:
+    """
+    Circuit over a sliding window of the last `window_size` outcomes.
+
+    Opens once at least `min_calls` outcomes were recorded and the failure rate
+    reaches `failure_rate`. After `open_duration` seconds up to `half_open_probes`
+    requests are let through, the circuit closes once they all succeed and opens
+    again on any failure.
+
+    Not thread-safe on its own, `CircuitBreaker` serializes access.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float,
+        min_calls: int,
+        window_size: int,
+        open_duration: float,
+        half_open_probes: int,
+    ) -> None:
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_probes = half_open_probes
+        self.opened = 0
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probes = 0
+        self._probe_successes = 0
+
+    def state(self, now: float, /) -> CircuitState:
+        if self._opened_at is None:
+            return 'closed'
+        if now - self._opened_at < self.open_duration:
+            return 'open'
+        return 'half_open'
+
+    def retry_after(self, now: float, /) -> float | None:
+        if self._opened_at is None:
+            return None
+        return max(self._opened_at + self.open_duration - now, 0.0)
+
+    @property
+    def calls(self) -> int:
+        return len(self._outcomes)
+
+    def current_failure_rate(self) -> float:
+        return self._failures / len(self._outcomes) if self._outcomes else 0.0
+
+    def acquire(self, now: float, /) -> bool:
+        """
+        Whether a request may be sent, probes are counted in half open state.
+        """
+        state = self.state(now)
+        if state == 'closed':
+            return True
+        if state == 'open' or self._probes >= self.half_open_probes:
+            return False
+        self._probes += 1
+        return True
+
+    def record(self, now: float, /, *, failure: bool) -> None:
+        state = self.state(now)
+        if state == 'closed':
+            if len(self._outcomes) == self._outcomes.maxlen and self._outcomes[0]:
+                self._failures -= 1
+            self._outcomes.append(failure)
+            self._failures += failure
+            if (
+                len(self._outcomes) >= self.min_calls
+                and self.current_failure_rate() >= self.failure_rate
+            ):
+                self._open(now)
+            return
+
+        # outcomes of requests sent while closed may land while open
+        if state == 'open':
+            return
+        self._probes = max(self._probes - 1, 0)
+        if failure:
+            self._open(now)
+            return
+        self._probe_successes += 1
+        if self._probe_successes >= self.half_open_probes:
+            self._close()
+
+    def release(self, now: float, /) -> None:
+        """
+        Free the probe of a request that was not sent or has no outcome.
+        """
+        if self.state(now) == 'half_open':
+            self._probes = max(self._probes - 1, 0)
+
+    def _open(self, now: float, /) -> None:
+        self._opened_at = now
+        self._probes = 0
+        self._probe_successes = 0
+        self.opened += 1
+
+    def _close(self) -> None:
+        self._opened_at = None
+        self._probes = 0
+        self._probe_successes = 0
+        self._outcomes.clear()
+        self._failures = 0
+
+
+class CircuitBreaker:
+    """
+    Circuit breaker per customer and endpoint (e.g. `delivery_quotes` or
+    `deliveries`).
+
+    Server errors (5xx), timeouts and connection errors count as failures, any
+    other response as a success. While a circuit is open requests raise
+    `uberpy.exceptions.CircuitOpenError` right away instead of retrying, see
+    `Circuit` for the state transitions and `snapshot` for dashboards.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate: float | None = None,
+        min_calls: int | None = None,
+        window_size: int | None = None,
+        open_duration: float | None = None,
+        half_open_probes: int | None = None,
+    ) -> None:
+        self._failure_rate = (
+            DEFAULT_FAILURE_RATE if failure_rate is None else failure_rate
+        )
+        self._min_calls = DEFAULT_MIN_CALLS if min_calls is None else min_calls
+        self._window_size = DEFAULT_WINDOW_SIZE if window_size is None else window_size
+        self._open_duration = (
+            DEFAULT_OPEN_DURATION if open_duration is None else open_duration
+        )
+        self._half_open_probes = (
+            DEFAULT_HALF_OPEN_PROBES if half_open_probes is None else half_open_probes
+        )
+        self._lock = threading.Lock()
+        self._circuits: dict[tuple[str, str], Circuit] = {}
+
+    def _circuit(self, customer_id: str, endpoint: str, /) -> Circuit:
+        key = (customer_id, endpoint)
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = Circuit(
+                failure_rate=self._failure_rate,
+                min_calls=self._min_calls,
+                window_size=self._window_size,
+                open_duration=self._open_duration,
+                half_open_probes=self._half_open_probes,
+            )
+        return circuit
+
+    def acquire(self, customer_id: str, endpoint: str, /) -> None:
+        """
+        Raise if the circuit does not let the request through.
+        """
+        with self._lock:
+            circuit = self._circuit(customer_id, endpoint)
+            now = monotonic()
+            if not circuit.acquire(now):
+                raise exceptions.CircuitOpenError(
+                    f'circuit open for {endpoint}',
+                    retry_after=circuit.retry_after(now) or 0.0,
+                )
+
+    def record(
+        self,
+        customer_id: str,
+        endpoint: str,
+        /,
+        *,
+        failure: bool,
+    ) -> None:
+        """
+        Record the outcome of a request let through by `acquire`.
+        """
+        with self._lock:
+            self._circuit(customer_id, endpoint).record(monotonic(), failure=failure)
+
+    def release(self, customer_id: str, endpoint: str, /) -> None:
+        """
+        Release a request let through by `acquire` without recording an outcome,
+        e.g. when it was not sent or failed with an unclassified error.
+        """
+        with self._lock:
+            self._circuit(customer_id, endpoint).release(monotonic())
+
+    def state(self, customer_id: str, endpoint: str, /) -> CircuitState:
+        with self._lock:
+            return self._circuit(customer_id, endpoint).state(monotonic())
+
+    def snapshot(self) -> dict[str, CircuitSnapshot]:
+        """
+        Circuits keyed by `'<customer_id> <endpoint>'`.
+        """
+        with self._lock:
+            now = monotonic()
+            return {
+                f'{customer_id} {endpoint}': CircuitSnapshot(
+                    state=circuit.state(now),
+                    failure_rate=circuit.current_failure_rate(),
+                    calls=circuit.calls,
+                    opened=circuit.opened,
+                    retry_after=circuit.retry_after(now),
+                )
+                for (customer_id, endpoint), circuit in self._circuits.items()
+            }
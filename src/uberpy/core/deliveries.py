@@ -1,5 +1,69 @@
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Iterable, Iterator, Literal, Self, TypedDict, overload
+from uuid import uuid4
+
 from uberpy import models
-from uberpy.core.base import Base
+from uberpy.core.base import Base, ResponseMode
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_PAGE_SIZE = 50
+
+type DeliveryResult = tuple[models.DeliveryCreateRequest, models.Delivery | Exception]
+
+
+class DeliveryBatchSummary(TypedDict):
+    total: int
+    succeeded: int
+    failed: int
+
+
+def with_idempotency_key(
+    request: models.DeliveryCreateRequest,
+    /,
+) -> models.DeliveryCreateRequest:
+    """
+    Fill in a random idempotency key so the request can be safely retried.
+    """
+    if request.idempotency_key is not None:
+        return request
+    return request.model_copy(update={'idempotency_key': uuid4().hex})
+
+
+def list_params(filter: str | None, limit: int, offset: int, /) -> dict:
+    params: dict = {'limit': limit, 'offset': offset}
+    if filter is not None:
+        params['filter'] = filter
+    return params
+
+
+class DeliveryBatch:
+    """
+    Iterator of `(request, delivery or exception)` pairs in completion order.
+
+    Yielded requests carry the idempotency key they were sent with, `summary` is
+    updated as results are consumed.
+    """
+
+    def __init__(self, results: Iterator[DeliveryResult], /) -> None:
+        self._results = results
+        self.summary = DeliveryBatchSummary(
+            total=0,
+            succeeded=0,
+            failed=0,
+        )
+
+    def __iter__(self) -> Self:
+        return self
+
+    def __next__(self) -> DeliveryResult:
+        request, result = next(self._results)
+        self.summary['total'] += 1
+        if isinstance(result, Exception):
+            self.summary['failed'] += 1
+        else:
+            self.summary['succeeded'] += 1
+        return request, result
 
 
 class Deliveries(Base):
@@ -9,13 +73,80 @@ class Deliveries(Base):
     https://developer.uber.com/docs/deliveries/api-reference/daas#tag/Delivery
     """
 
+    @overload
+    def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
     def create_delivery(
         self,
         *,
         request: models.DeliveryCreateRequest,
-    ) -> models.Delivery:
-        response = self._post(request, 'deliveries')
-        return models.Delivery.model_validate(response)
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    def create_delivery(
+        self,
+        *,
+        request: models.DeliveryCreateRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return self._post(
+            request,
+            'deliveries',
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    def update_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryUpdateRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
 
     def update_delivery(
         self,
@@ -23,24 +154,254 @@ class Deliveries(Base):
         delivery_id: str,
         *,
         request: models.DeliveryUpdateRequest,
-    ) -> models.Delivery:
-        response = self._post(request, 'deliveries', delivery_id)
-        return models.Delivery.model_validate(response)
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return self._post(
+            request,
+            'deliveries',
+            delivery_id,
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
 
+    @overload
     def cancel_delivery(
         self,
         /,
         delivery_id: str,
-    ) -> models.Delivery:
-        response = self._post({}, 'deliveries', delivery_id, 'cancel')
-        return models.Delivery.model_validate(response)
+        *,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    def cancel_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return self._post(
+            {},
+            'deliveries',
+            delivery_id,
+            'cancel',
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
 
+    @overload
     def proof_of_delivery(
         self,
         /,
         delivery_id: str,
         *,
         request: models.DeliveryProofOfDeliveryRequest,
-    ) -> models.DeliveryProofOfDeliveryResponse:
-        response = self._post(request, 'deliveries', delivery_id, 'proof-of-delivery')
-        return models.DeliveryProofOfDeliveryResponse.model_validate(response)
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.DeliveryProofOfDeliveryResponse: ...
+
+    @overload
+    def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.DeliveryProofOfDeliveryResponse]: ...
+
+    @overload
+    def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    def proof_of_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        request: models.DeliveryProofOfDeliveryRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> (
+        models.DeliveryProofOfDeliveryResponse
+        | models.LazyModel[models.DeliveryProofOfDeliveryResponse]
+        | bytes
+    ):
+        return self._post(
+            request,
+            'deliveries',
+            delivery_id,
+            'proof-of-delivery',
+            model=models.DeliveryProofOfDeliveryResponse,
+            response_mode=response_mode,
+            deadline=deadline,
+        )
+
+    @overload
+    def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery: ...
+
+    @overload
+    def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.Delivery]: ...
+
+    @overload
+    def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    def get_delivery(
+        self,
+        /,
+        delivery_id: str,
+        *,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> models.Delivery | models.LazyModel[models.Delivery] | bytes:
+        return self._get(
+            'deliveries',
+            delivery_id,
+            model=models.Delivery,
+            response_mode=response_mode,
+            deadline=deadline,
+            hedge=True,
+        )
+
+    def list_deliveries(
+        self,
+        *,
+        filter: str | None = None,
+        page_size: int | None = None,
+        deadline: float | None = None,
+    ) -> Iterator[models.Delivery]:
+        """
+        Lazily walk every delivery, optionally filtered by status (see
+        `constants.DeliveryStatus`, or `ongoing`).
+
+        The next page is fetched in the background while the current one is
+        consumed, only two pages are held in memory at a time. `deadline` bounds
+        each page request.
+        """
+        page_size = DEFAULT_PAGE_SIZE if page_size is None else page_size
+        executor = ThreadPoolExecutor(max_workers=1)
+
+        def fetch(offset: int) -> models.DeliveryList:
+            return self._get(
+                'deliveries',
+                params=list_params(filter, page_size, offset),
+                model=models.DeliveryList,
+                deadline=deadline,
+            )
+
+        future: Future[models.DeliveryList] | None = executor.submit(fetch, 0)
+        offset = 0
+        try:
+            while future is not None:
+                page = future.result()
+                offset += len(page.data)
+                future = (
+                    executor.submit(fetch, offset)
+                    if page.next_href and page.data
+                    else None
+                )
+                yield from page.data
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def create_deliveries(
+        self,
+        *,
+        requests: Iterable[models.DeliveryCreateRequest],
+        max_concurrency: int | None = None,
+    ) -> DeliveryBatch:
+        """
+        Create deliveries concurrently from a (possibly lazy) iterable.
+
+        At most `max_concurrency` requests are in flight and read from `requests`
+        at a time, so results are never accumulated in memory.
+        """
+        return DeliveryBatch(
+            self._create_deliveries(
+                requests,
+                DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency,
+            ),
+        )
+
+    def _create_deliveries(
+        self,
+        requests: Iterable[models.DeliveryCreateRequest],
+        max_concurrency: int,
+        /,
+    ) -> Iterator[DeliveryResult]:
+        iterator = iter(requests)
+        pending: dict[Future[models.Delivery], models.DeliveryCreateRequest] = {}
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+
+            def submit(count: int) -> None:
+                for request in islice(iterator, count):
+                    request = with_idempotency_key(request)
+                    future = executor.submit(self.create_delivery, request=request)
+                    pending[future] = request
+
+            submit(max_concurrency)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    request = pending.pop(future)
+                    result: models.Delivery | Exception
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = e
+                    yield request, result
+                submit(len(done))
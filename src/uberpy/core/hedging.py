@@ -0,0 +1,214 @@
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypedDict
+
+from uberpy.core.retry import RetryBudget
+
+DEFAULT_PERCENTILE = 95.0
+DEFAULT_MIN_DELAY = 0.01
+DEFAULT_MAX_RATIO = 0.1
+DEFAULT_MAX_BURST = 5.0
+DEFAULT_WINDOW_SIZE = 200
+DEFAULT_MIN_SAMPLES = 20
+DEFAULT_MAX_WORKERS = 32
+
+
+class HedgeSnapshot(TypedDict):
+    calls: int
+    hedged: int
+    """
+    Calls that sent a hedge request.
+    """
+
+    wins: int
+    """
+    Hedged calls answered first by the hedge request.
+    """
+
+    denied: int
+    """
+    Hedges skipped because of `max_ratio`.
+    """
+
+    delay: float | None
+
+
+class _HedgeStats:
+    def __init__(self, window_size: int, /) -> None:
+        self.calls = 0
+        self.hedged = 0
+        self.wins = 0
+        self.denied = 0
+        self.latencies: deque[float] = deque(maxlen=window_size)
+        self.delay: float | None = None
+        self.stale = False
+
+
+class Hedging:
+    """
+    Hedged requests policy for idempotent endpoints.
+
+    When a request has not answered after the `percentile` latency of the last
+    `window_size` successful requests of its endpoint (and at least `min_samples`
+    were seen), an identical hedge request is sent over another pooled connection
+    and the first successful response wins. Hedges are limited to `max_ratio` of the
+    calls, in bursts of up to `max_burst`.
+
+    Until an endpoint has a delay the sync client sends its requests from the
+    calling thread. Afterwards primary requests are sent from a pool of
+    `max_workers` threads (32 by default) while the caller waits, or from the
+    calling thread unhedged when every worker is busy, and hedges from a second
+    pool of the same size. A losing request cannot be interrupted and its
+    response is discarded, the async client cancels it. Only the attempts of the
+    winning request are recorded by the instrumentation, and the latency samples
+    are single successful attempts, excluding rate limit waits, retries and
+    backoff.
+    """
+
+    def __init__(
+        self,
+        *,
+        percentile: float | None = None,
+        min_delay: float | None = None,
+        max_ratio: float | None = None,
+        max_burst: float | None = None,
+        window_size: int | None = None,
+        min_samples: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._percentile = DEFAULT_PERCENTILE if percentile is None else percentile
+        self._min_delay = DEFAULT_MIN_DELAY if min_delay is None else min_delay
+        self._window_size = DEFAULT_WINDOW_SIZE if window_size is None else window_size
+        self._min_samples = DEFAULT_MIN_SAMPLES if min_samples is None else min_samples
+        self._max_workers = DEFAULT_MAX_WORKERS if max_workers is None else max_workers
+        self._budget = RetryBudget(
+            ratio=DEFAULT_MAX_RATIO if max_ratio is None else max_ratio,
+            min_retries_per_second=0,
+            max_tokens=DEFAULT_MAX_BURST if max_burst is None else max_burst,
+        )
+        self._lock = threading.Lock()
+        self._stats: dict[str, _HedgeStats] = {}
+        self._executor: ThreadPoolExecutor | None = None
+        self._primary_executor: ThreadPoolExecutor | None = None
+        self._primary_slots = threading.BoundedSemaphore(self._max_workers)
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Pool sending the hedge requests of the sync client.
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='uberpy-hedging',
+                )
+            return self._executor
+
+    def submit_primary[T](
+        self,
+        fn: Callable[..., T],
+        /,
+        *args: Any,
+    ) -> Future[T] | None:
+        """
+        Send a primary request of the sync client from its pool, `None` when every
+        worker is busy and the caller sends it itself.
+        """
+        # never queue, a primary waiting for a worker would only add latency
+        if not self._primary_slots.acquire(blocking=False):
+            return None
+        with self._lock:
+            if self._primary_executor is None:
+                self._primary_executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='uberpy-primary',
+                )
+            executor = self._primary_executor
+        future = executor.submit(fn, *args)
+        future.add_done_callback(lambda _: self._primary_slots.release())
+        return future
+
+    def _endpoint(self, key: str, /) -> _HedgeStats:
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = _HedgeStats(self._window_size)
+        return stats
+
+    def _delay(self, stats: _HedgeStats, /) -> float | None:
+        if not stats.latencies or len(stats.latencies) < self._min_samples:
+            return None
+        if stats.stale:
+            latencies = sorted(stats.latencies)
+            index = min(
+                int(len(latencies) * self._percentile / 100),
+                len(latencies) - 1,
+            )
+            stats.delay = max(latencies[index], self._min_delay)
+            stats.stale = False
+        return stats.delay
+
+    def delay(self, key: str, /) -> float | None:
+        """
+        Record a call, returns the seconds after which to hedge it or `None` while
+        there are not enough samples.
+        """
+        self._budget.deposit()
+        with self._lock:
+            stats = self._endpoint(key)
+            stats.calls += 1
+            return self._delay(stats)
+
+    def acquire(self, key: str, /) -> bool:
+        """
+        Whether a hedge request may be sent, the hedge is recorded if so.
+        """
+        allowed = self._budget.withdraw()
+        with self._lock:
+            stats = self._endpoint(key)
+            if allowed:
+                stats.hedged += 1
+            else:
+                stats.denied += 1
+        return allowed
+
+    def record(self, key: str, latency: float, /) -> None:
+        """
+        Record the latency of a successful request attempt.
+        """
+        with self._lock:
+            stats = self._endpoint(key)
+            stats.latencies.append(latency)
+            stats.stale = True
+
+    def won(self, key: str, /) -> None:
+        with self._lock:
+            self._endpoint(key).wins += 1
+
+    def snapshot(self) -> dict[str, HedgeSnapshot]:
+        """
+        Hedging metrics keyed by `'<method> <endpoint>'`.
+        """
+        with self._lock:
+            return {
+                key: HedgeSnapshot(
+                    calls=stats.calls,
+                    hedged=stats.hedged,
+                    wins=stats.wins,
+                    denied=stats.denied,
+                    delay=self._delay(stats),
+                )
+                for key, stats in self._stats.items()
+            }
+
+    def close(self) -> None:
+        """
+        Wait for the requests still in flight, sync client only.
+        """
+        with self._lock:
+            executors = (self._primary_executor, self._executor)
+            self._primary_executor = self._executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=True)
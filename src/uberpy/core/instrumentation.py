@@ -0,0 +1,484 @@
+import threading
+from bisect import bisect_left
+from time import time_ns
+from typing import Any, NotRequired, Self, Sequence, TypedDict
+
+DEFAULT_DURATION_BUCKETS = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+DEFAULT_SIZE_BUCKETS = tuple(4**exponent for exponent in range(4, 12))
+
+
+class AttemptInfo(TypedDict):
+    attempt: int
+    """
+    Zero based attempt number.
+    """
+
+    start_time: int
+    """
+    Epoch nanoseconds when the attempt started.
+    """
+
+    end_time: int
+    """
+    Epoch nanoseconds when the response, or the error, was received.
+    """
+
+    token_duration: float
+    """
+    Seconds spent getting the access token.
+    """
+
+    serialization_duration: float
+    """
+    Seconds spent serializing the request body.
+    """
+
+    serialization_cpu: float
+    """
+    CPU seconds of the calling thread spent serializing the request body.
+    """
+
+    network_duration: float
+    """
+    Seconds spent sending the request and reading the response.
+    """
+
+    status_code: int | None
+    response_size: int
+    retry_after: float | None
+    """
+    Retry-After header in seconds.
+    """
+
+    backoff: float | None
+    """
+    Seconds slept before the next attempt, `None` when not retried.
+    """
+
+    error: Exception | None
+
+
+class CallInfo(TypedDict):
+    endpoint: str
+    """
+    First path segment, e.g. `delivery_quotes` or `deliveries`.
+    """
+
+    method: str
+    path: tuple[str, ...]
+    """
+    Path segments after the customer root, e.g. `('deliveries', 'del_1')`.
+    """
+
+    start_time: int
+    """
+    Epoch nanoseconds when the call started.
+    """
+
+    end_time: int
+    attempts: list[AttemptInfo]
+    validation_duration: float
+    """
+    Seconds spent parsing and validating the response.
+    """
+
+    validation_cpu: float
+    """
+    CPU seconds of the calling thread spent parsing and validating the response.
+    """
+
+    result: Any
+    """
+    Returned value, e.g. the validated model.
+    """
+
+    error: Exception | None
+    attributes: NotRequired[dict[str, Any]]
+    """
+    Free form storage for instrumentations.
+    """
+
+
+class Instrumentation:
+    """
+    Hooks called by the retry loop of every API call, no-ops by default.
+
+    `before_request` and `after_response` wrap each attempt, `on_retry` is called
+    before the backoff sleep of a failed attempt, then the call ends with either
+    `on_success` or `on_giveup`. Hooks are called from the calling thread, or the
+    event loop with the async client, keep them cheap.
+    """
+
+    def before_request(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        pass
+
+    def after_response(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        pass
+
+    def on_retry(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        pass
+
+    def on_success(self, call: CallInfo, /) -> None:
+        pass
+
+    def on_giveup(self, call: CallInfo, /) -> None:
+        pass
+
+
+class CompositeInstrumentation(Instrumentation):
+    """
+    Calls the hooks of every instrumentation in order, e.g. metrics and tracing.
+    """
+
+    def __init__(self, *instrumentations: Instrumentation) -> None:
+        self._instrumentations = instrumentations
+
+    def before_request(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.before_request(call, attempt)
+
+    def after_response(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.after_response(call, attempt)
+
+    def on_retry(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.on_retry(call, attempt)
+
+    def on_success(self, call: CallInfo, /) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.on_success(call)
+
+    def on_giveup(self, call: CallInfo, /) -> None:
+        for instrumentation in self._instrumentations:
+            instrumentation.on_giveup(call)
+
+
+class CallRecorder:
+    """
+    Records a call and its attempts, calling the `instrumentation` hooks.
+    """
+
+    __slots__ = ('_events', '_instrumentation', 'attempt', 'info')
+
+    attempt: AttemptInfo
+    """
+    Current attempt, set by `start_attempt`.
+    """
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        method: str,
+        endpoint: str,
+        path: Sequence[Any],
+        /,
+    ) -> None:
+        self._instrumentation = instrumentation
+        # attempt hooks buffered until `merge`, for forks
+        self._events: list[tuple[str, AttemptInfo]] | None = None
+        self.info = CallInfo(
+            endpoint=endpoint,
+            method=method,
+            path=tuple(str(segment) for segment in path),
+            start_time=time_ns(),
+            end_time=0,
+            attempts=[],
+            validation_duration=0.0,
+            validation_cpu=0.0,
+            result=None,
+            error=None,
+        )
+
+    def fork(self) -> Self:
+        """
+        Recorder of a concurrent request of the same call, e.g. a hedge. Its
+        attempts and their hooks are only recorded once merged with `merge`.
+        """
+        info = self.info
+        recorder = type(self)(
+            self._instrumentation,
+            info['method'],
+            info['endpoint'],
+            info['path'],
+        )
+        recorder._events = []
+        return recorder
+
+    def merge(self, fork: Self, /) -> None:
+        """
+        Record the attempts of `fork` as this call's, calling their hooks.
+        """
+        assert fork._events is not None
+        for attempt in fork.info['attempts']:
+            attempt['attempt'] = len(self.info['attempts'])
+            self.info['attempts'].append(attempt)
+            self.attempt = attempt
+        for hook, attempt in fork._events:
+            getattr(self._instrumentation, hook)(self.info, attempt)
+
+    def _hook(self, hook: str, attempt: AttemptInfo, /) -> None:
+        if self._events is None:
+            getattr(self._instrumentation, hook)(self.info, attempt)
+        else:
+            self._events.append((hook, attempt))
+
+    def start_attempt(self) -> AttemptInfo:
+        self.attempt = AttemptInfo(
+            attempt=len(self.info['attempts']),
+            start_time=time_ns(),
+            end_time=0,
+            token_duration=0.0,
+            serialization_duration=0.0,
+            serialization_cpu=0.0,
+            network_duration=0.0,
+            status_code=None,
+            response_size=0,
+            retry_after=None,
+            backoff=None,
+            error=None,
+        )
+        self.info['attempts'].append(self.attempt)
+        return self.attempt
+
+    def before_request(self) -> None:
+        attempt = self.attempt
+        attempt['token_duration'] = (time_ns() - attempt['start_time']) / 1e9
+        self._hook('before_request', attempt)
+
+    def after_response(
+        self,
+        *,
+        error: Exception | None = None,
+        retry_after: float | None = None,
+    ) -> None:
+        # not sent, e.g. an open circuit
+        if not self.attempt['end_time']:
+            self.attempt['end_time'] = time_ns()
+        self.attempt['error'] = error
+        self.attempt['retry_after'] = retry_after
+        self._hook('after_response', self.attempt)
+
+    def retry(self, backoff: float, /) -> None:
+        self.attempt['backoff'] = backoff
+        self._hook('on_retry', self.attempt)
+
+    def success(
+        self,
+        result: Any,
+        validation_duration: float,
+        validation_cpu: float = 0.0,
+        /,
+    ) -> None:
+        self.info['result'] = result
+        self.info['validation_duration'] = validation_duration
+        self.info['validation_cpu'] = validation_cpu
+        self.info['end_time'] = time_ns()
+        self._instrumentation.on_success(self.info)
+
+    def giveup(self, error: Exception, /) -> None:
+        self.info['error'] = error
+        self.info['end_time'] = time_ns()
+        self._instrumentation.on_giveup(self.info)
+
+
+class HistogramSnapshot(TypedDict):
+    count: int
+    sum: float
+    min: float | None
+    max: float | None
+    buckets: dict[float, int]
+    p50: float | None
+    p90: float | None
+    p99: float | None
+
+
+class Histogram:
+    """
+    Fixed buckets histogram, percentiles are estimated as bucket upper bounds.
+
+    Not thread-safe on its own, `MetricsInstrumentation` serializes access.
+    """
+
+    def __init__(self, buckets: Sequence[float], /) -> None:
+        self._bounds = tuple(buckets)
+        self._counts = [0] * (len(self._bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def record(self, value: float, /) -> None:
+        self._counts[bisect_left(self._bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percentile: float, /) -> float | None:
+        if not self.count:
+            return None
+        rank = percentile / 100 * self.count
+        seen = 0
+        for bound, count in zip(self._bounds, self._counts):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max) if self.max is not None else bound
+        return self.max
+
+    def snapshot(self) -> HistogramSnapshot:
+        return HistogramSnapshot(
+            count=self.count,
+            sum=self.sum,
+            min=self.min,
+            max=self.max,
+            buckets=dict(zip((*self._bounds, float('inf')), self._counts)),
+            p50=self.percentile(50),
+            p90=self.percentile(90),
+            p99=self.percentile(99),
+        )
+
+
+class EndpointSnapshot(TypedDict):
+    calls: int
+    attempts: int
+    retries: int
+    giveups: int
+    status_codes: dict[int, int]
+    duration: HistogramSnapshot
+    token: HistogramSnapshot
+    serialization: HistogramSnapshot
+    network: HistogramSnapshot
+    validation: HistogramSnapshot
+    backoff: HistogramSnapshot
+    response_size: HistogramSnapshot
+
+
+class _EndpointMetrics:
+    def __init__(
+        self,
+        duration_buckets: Sequence[float],
+        size_buckets: Sequence[float],
+        /,
+    ) -> None:
+        self.calls = 0
+        self.attempts = 0
+        self.retries = 0
+        self.giveups = 0
+        self.status_codes: dict[int, int] = {}
+        self.duration = Histogram(duration_buckets)
+        self.token = Histogram(duration_buckets)
+        self.serialization = Histogram(duration_buckets)
+        self.network = Histogram(duration_buckets)
+        self.validation = Histogram(duration_buckets)
+        self.backoff = Histogram(duration_buckets)
+        self.response_size = Histogram(size_buckets)
+
+    def snapshot(self) -> EndpointSnapshot:
+        return EndpointSnapshot(
+            calls=self.calls,
+            attempts=self.attempts,
+            retries=self.retries,
+            giveups=self.giveups,
+            status_codes=dict(self.status_codes),
+            duration=self.duration.snapshot(),
+            token=self.token.snapshot(),
+            serialization=self.serialization.snapshot(),
+            network=self.network.snapshot(),
+            validation=self.validation.snapshot(),
+            backoff=self.backoff.snapshot(),
+            response_size=self.response_size.snapshot(),
+        )
+
+
+class MetricsInstrumentation(Instrumentation):
+    """
+    In-process aggregator of per endpoint and method counters and histograms.
+
+    Export `snapshot` to your metrics backend periodically.
+    """
+
+    def __init__(
+        self,
+        *,
+        duration_buckets: Sequence[float] | None = None,
+        size_buckets: Sequence[float] | None = None,
+    ) -> None:
+        self._duration_buckets = (
+            DEFAULT_DURATION_BUCKETS if duration_buckets is None else duration_buckets
+        )
+        self._size_buckets = (
+            DEFAULT_SIZE_BUCKETS if size_buckets is None else size_buckets
+        )
+        self._lock = threading.Lock()
+        self._metrics: dict[str, _EndpointMetrics] = {}
+
+    def _endpoint(self, call: CallInfo, /) -> _EndpointMetrics:
+        key = f'{call["method"]} {call["endpoint"]}'
+        metrics = self._metrics.get(key)
+        if metrics is None:
+            metrics = self._metrics[key] = _EndpointMetrics(
+                self._duration_buckets,
+                self._size_buckets,
+            )
+        return metrics
+
+    def after_response(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        with self._lock:
+            metrics = self._endpoint(call)
+            metrics.attempts += 1
+            if attempt['status_code'] is not None:
+                metrics.status_codes[attempt['status_code']] = (
+                    metrics.status_codes.get(attempt['status_code'], 0) + 1
+                )
+            metrics.token.record(attempt['token_duration'])
+            metrics.serialization.record(attempt['serialization_duration'])
+            metrics.network.record(attempt['network_duration'])
+            if attempt['error'] is None:
+                metrics.response_size.record(attempt['response_size'])
+
+    def on_retry(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        with self._lock:
+            metrics = self._endpoint(call)
+            metrics.retries += 1
+            metrics.backoff.record(attempt['backoff'] or 0.0)
+
+    def on_success(self, call: CallInfo, /) -> None:
+        with self._lock:
+            metrics = self._endpoint(call)
+            metrics.calls += 1
+            metrics.duration.record((call['end_time'] - call['start_time']) / 1e9)
+            metrics.validation.record(call['validation_duration'])
+
+    def on_giveup(self, call: CallInfo, /) -> None:
+        with self._lock:
+            metrics = self._endpoint(call)
+            metrics.calls += 1
+            metrics.giveups += 1
+            metrics.duration.record((call['end_time'] - call['start_time']) / 1e9)
+
+    def snapshot(self) -> dict[str, EndpointSnapshot]:
+        """
+        Metrics keyed by `'<method> <endpoint>'`, e.g. `'POST deliveries'`.
+        """
+        with self._lock:
+            return {key: metrics.snapshot() for key, metrics in self._metrics.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._metrics.clear()
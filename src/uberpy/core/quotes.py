@@ -1,21 +1,311 @@
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
+from time import monotonic
+from typing import Callable, Literal, Sequence, Unpack, overload
+
 from uberpy import models
-from uberpy.core.base import Base
+from uberpy.core.base import (
+    AccessToken,
+    APIVersion,
+    Base,
+    BaseArguments,
+    ResponseMode,
+)
+from uberpy.core.singleflight import SingleFlight
+
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MAX_WORKERS = 32
+DEFAULT_CACHE_MAX_SIZE = 1024
+DEFAULT_CACHE_EXPIRY_MARGIN = 30
+
+type QuoteResult = models.QuoteCreateResponse | Exception | None
+
+
+def quote_key(customer_id: str, request: models.QuoteCreateRequest, /) -> str:
+    """
+    Canonical serialization of a quote request.
+
+    Addresses are serialized as sorted keys JSON and fields keep their declaration
+    order, so equal requests always produce the same key.
+    """
+    return f'{customer_id}:{request.model_dump_json(exclude_none=True)}'
+
+
+class QuoteCache:
+    """
+    Thread-safe LRU cache of quotes.
+
+    Quotes are served until `expiry_margin` seconds before they expire.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_size: int | None = None,
+        expiry_margin: float | None = None,
+    ) -> None:
+        self._max_size = DEFAULT_CACHE_MAX_SIZE if max_size is None else max_size
+        self._expiry_margin = timedelta(
+            seconds=DEFAULT_CACHE_EXPIRY_MARGIN
+            if expiry_margin is None
+            else expiry_margin
+        )
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, models.QuoteCreateResponse] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _is_fresh(self, quote: models.QuoteCreateResponse, /) -> bool:
+        expires = quote.expires
+        if expires.tzinfo is None:
+            expires = expires.replace(tzinfo=timezone.utc)
+        return expires - self._expiry_margin > datetime.now(timezone.utc)
+
+    def get(self, key: str, /) -> models.QuoteCreateResponse | None:
+        with self._lock:
+            quote = self._entries.get(key)
+            if quote is not None and not self._is_fresh(quote):
+                del self._entries[key]
+                quote = None
+            if quote is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return quote
+
+    def set(self, key: str, quote: models.QuoteCreateResponse, /) -> None:
+        if not self._is_fresh(quote):
+            return
+        with self._lock:
+            self._entries[key] = quote
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
 
 
 class Quotes(Base):
     """
     Quotes
 
+    `create_quotes` sends its requests on a pool of `max_workers` threads owned by
+    the client, `close` waits for the requests still in flight.
+
     https://developer.uber.com/docs/deliveries/api-reference/daas#tag/Quotes
     """
 
+    def __init__(
+        self,
+        customer_id: str,
+        access_token: AccessToken,
+        /,
+        *,
+        version: APIVersion,
+        cache: QuoteCache | None = None,
+        coalesce: bool = False,
+        max_workers: int | None = None,
+        **kwargs: Unpack[BaseArguments],
+    ) -> None:
+        super().__init__(
+            customer_id,
+            access_token,
+            version=version,
+            **kwargs,
+        )
+        self._cache = cache
+        self._single_flight: SingleFlight[models.QuoteCreateResponse] | None = (
+            SingleFlight() if coalesce else None
+        )
+        self._max_workers = DEFAULT_MAX_WORKERS if max_workers is None else max_workers
+        self._executor_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """
+        Pool sending the requests of `create_quotes`.
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix='uberpy-quotes',
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """
+        Wait for the quote requests still in flight.
+        """
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @overload
+    def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: Literal['model'] = 'model',
+        deadline: float | None = None,
+    ) -> models.QuoteCreateResponse: ...
+
+    @overload
     def create_quote(
         self,
         *,
         request: models.QuoteCreateRequest,
+        response_mode: Literal['lazy'],
+        deadline: float | None = None,
+    ) -> models.LazyModel[models.QuoteCreateResponse]: ...
+
+    @overload
+    def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: Literal['raw'],
+        deadline: float | None = None,
+    ) -> bytes: ...
+
+    def create_quote(
+        self,
+        *,
+        request: models.QuoteCreateRequest,
+        response_mode: ResponseMode = 'model',
+        deadline: float | None = None,
+    ) -> (
+        models.QuoteCreateResponse
+        | models.LazyModel[models.QuoteCreateResponse]
+        | bytes
+    ):
+        """
+        Quote for `request`, `lazy` and `raw` response modes bypass the cache and
+        request coalescing. Coalesced requests share the deadline of the first one.
+        """
+        if response_mode != 'model':
+            return self._post(
+                request,
+                'delivery_quotes',
+                model=models.QuoteCreateResponse,
+                response_mode=response_mode,
+                deadline=deadline,
+                hedge=True,
+            )
+
+        if self._cache is None and self._single_flight is None:
+            return self._create_quote(request, deadline)
+
+        key = quote_key(self._customer_id, request)
+        if self._cache is not None and (quote := self._cache.get(key)):
+            return quote
+
+        if self._single_flight is None:
+            return self._create_cached_quote(key, request, deadline)
+
+        return self._single_flight.do(
+            key,
+            lambda: self._create_cached_quote(key, request, deadline),
+        )
+
+    def _create_cached_quote(
+        self,
+        key: str,
+        request: models.QuoteCreateRequest,
+        deadline: float | None,
+        /,
+    ) -> models.QuoteCreateResponse:
+        quote = self._create_quote(request, deadline)
+        if self._cache is not None:
+            self._cache.set(key, quote)
+        return quote
+
+    def _create_quote(
+        self,
+        request: models.QuoteCreateRequest,
+        deadline: float | None,
+        /,
     ) -> models.QuoteCreateResponse:
-        response = self._post(
+        return self._post(
             request,
             'delivery_quotes',
+            model=models.QuoteCreateResponse,
+            deadline=deadline,
+            hedge=True,
+        )
+
+    def create_quotes(
+        self,
+        *,
+        requests: Sequence[models.QuoteCreateRequest],
+        max_concurrency: int | None = None,
+        deadline: float | None = None,
+        accept: Callable[[models.QuoteCreateResponse], bool] | None = None,
+    ) -> list[QuoteResult]:
+        """
+        Request several quotes in parallel over the shared session.
+
+        Results are returned in input order, failed quotes hold the raised exception
+        and quotes still in flight when `deadline` (seconds) elapses, or when `accept`
+        returns `True` for a quote, hold `None`. At most `max_concurrency` requests
+        are in flight at once, queued requests are not sent once the call returns.
+        """
+        results: list[QuoteResult] = [None] * len(requests)
+        if not requests:
+            return results
+
+        executor = self.executor
+        queued = deque(enumerate(requests))
+        futures: dict[Future[models.QuoteCreateResponse], int] = {}
+
+        def submit() -> Future[models.QuoteCreateResponse]:
+            index, request = queued.popleft()
+            future = executor.submit(
+                self.create_quote,
+                request=request,
+                deadline=deadline,
+            )
+            futures[future] = index
+            return future
+
+        concurrency = (
+            DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
         )
-        return models.QuoteCreateResponse.model_validate(response)
+        pending = {submit() for _ in range(min(concurrency, len(requests)))}
+        timeout_at = None if deadline is None else monotonic() + deadline
+        while pending:
+            timeout = None if timeout_at is None else max(timeout_at - monotonic(), 0)
+            done, pending = wait(
+                pending,
+                timeout=timeout,
+                return_when=FIRST_COMPLETED,
+            )
+            # deadline elapsed, quotes in flight finish on the client's pool
+            if not done:
+                break
+            for future in done:
+                index = futures[future]
+                try:
+                    quote = future.result()
+                except Exception as e:
+                    results[index] = e
+                else:
+                    results[index] = quote
+                    if accept and accept(quote):
+                        return results
+                if queued:
+                    pending.add(submit())
+
+        return results
@@ -0,0 +1,175 @@
+import threading
+from time import monotonic
+from typing import Literal
+
+from uberpy import exceptions
+
+type RateLimitPolicy = Literal['block', 'fail']
+
+DEFAULT_RATE = 10.0
+DEFAULT_BURST = 10
+DEFAULT_DECREASE_FACTOR = 0.5
+DEFAULT_INCREASE_STEP = 0.05
+DEFAULT_MIN_RATE_FACTOR = 0.1
+
+
+class TokenBucket:
+    """
+    Token bucket implemented as a generic cell rate algorithm.
+
+    Not thread-safe on its own, `RateLimiter` serializes access.
+    """
+
+    def __init__(self, *, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._tat = 0.0
+
+    def reserve(self, now: float, /, *, consume: bool = True) -> float:
+        """
+        Seconds to wait before the next request may be sent.
+
+        Unless `consume` is `False` the slot is reserved, so the caller must send the
+        request once the wait elapses.
+        """
+        interval = 1 / self.rate
+        tat = max(self._tat, now)
+        wait = max(tat - (self.burst - 1) * interval - now, 0.0)
+        if consume:
+            self._tat = tat + interval
+        return wait
+
+    def pause(self, now: float, seconds: float, /) -> None:
+        """
+        Hold every request for `seconds`.
+        """
+        interval = 1 / self.rate
+        self._tat = max(self._tat, now + seconds + (self.burst - 1) * interval)
+
+
+class RateLimiter:
+    """
+    Proactive client side rate limiter.
+
+    Keeps a token bucket per customer and endpoint (e.g. `delivery_quotes` or
+    `deliveries`). When the API answers 429 the bucket pauses for `Retry-After`
+    seconds and its rate is multiplicatively decreased, successful requests
+    additively recover it.
+
+    With the `block` policy requests wait for their slot (raising if the wait would
+    exceed `max_wait`), with the `fail` policy they raise
+    `uberpy.exceptions.RateLimitExceeded` right away.
+    """
+
+    def __init__(
+        self,
+        *,
+        rate: float | None = None,
+        burst: int | None = None,
+        rates: dict[str, float] | None = None,
+        policy: RateLimitPolicy = 'block',
+        max_wait: float | None = None,
+        decrease_factor: float | None = None,
+        increase_step: float | None = None,
+        min_rate_factor: float | None = None,
+    ) -> None:
+        self._rate = DEFAULT_RATE if rate is None else rate
+        self._burst = DEFAULT_BURST if burst is None else burst
+        self._rates = rates or {}
+        self._policy = policy
+        self._max_wait = max_wait
+        self._decrease_factor = (
+            DEFAULT_DECREASE_FACTOR if decrease_factor is None else decrease_factor
+        )
+        self._increase_step = (
+            DEFAULT_INCREASE_STEP if increase_step is None else increase_step
+        )
+        self._min_rate_factor = (
+            DEFAULT_MIN_RATE_FACTOR if min_rate_factor is None else min_rate_factor
+        )
+        self._lock = threading.Lock()
+        self._buckets: dict[tuple[str, str], TokenBucket] = {}
+
+    def _configured_rate(self, endpoint: str, /) -> float:
+        return self._rates.get(endpoint, self._rate)
+
+    def _bucket(self, customer_id: str, endpoint: str, /) -> TokenBucket:
+        key = (customer_id, endpoint)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(
+                rate=self._configured_rate(endpoint),
+                burst=self._burst,
+            )
+        return bucket
+
+    def reserve(
+        self,
+        customer_id: str,
+        endpoint: str,
+        /,
+        remaining: float | None = None,
+    ) -> float:
+        """
+        Reserve a slot and return the seconds to wait before sending the request.
+
+        `remaining` is the time left to the deadline of the call, when the wait
+        would not leave any the slot is not reserved and
+        `exceptions.DeadlineExceeded` is raised.
+        """
+        with self._lock:
+            bucket = self._bucket(customer_id, endpoint)
+            now = monotonic()
+            wait = bucket.reserve(now, consume=False)
+            if remaining is not None and wait >= remaining:
+                raise exceptions.DeadlineExceeded(
+                    f'rate limit wait for {endpoint} exceeds the deadline'
+                )
+            if wait > 0 and (
+                self._policy == 'fail'
+                or (self._max_wait is not None and wait > self._max_wait)
+            ):
+                raise exceptions.RateLimitExceeded(
+                    f'rate limit exceeded for {endpoint}',
+                    retry_after=wait,
+                )
+            return bucket.reserve(now)
+
+    def throttled(
+        self,
+        customer_id: str,
+        endpoint: str,
+        /,
+        retry_after: float | None = None,
+    ) -> None:
+        """
+        Record a 429 response.
+        """
+        with self._lock:
+            bucket = self._bucket(customer_id, endpoint)
+            bucket.rate = max(
+                bucket.rate * self._decrease_factor,
+                self._configured_rate(endpoint) * self._min_rate_factor,
+            )
+            if retry_after:
+                bucket.pause(monotonic(), retry_after)
+
+    def succeeded(self, customer_id: str, endpoint: str, /) -> None:
+        """
+        Record a successful response.
+        """
+        with self._lock:
+            bucket = self._bucket(customer_id, endpoint)
+            configured_rate = self._configured_rate(endpoint)
+            if bucket.rate < configured_rate:
+                bucket.rate = min(
+                    bucket.rate + configured_rate * self._increase_step,
+                    configured_rate,
+                )
+
+    def rate(self, customer_id: str, endpoint: str, /) -> float:
+        """
+        Current, possibly decreased, rate in requests per second.
+        """
+        with self._lock:
+            return self._bucket(customer_id, endpoint).rate
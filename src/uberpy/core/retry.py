@@ -0,0 +1,89 @@
+import threading
+from time import monotonic
+from typing import TypedDict
+
+DEFAULT_RETRY_RATIO = 0.1
+DEFAULT_MIN_RETRIES_PER_SECOND = 1.0
+DEFAULT_MAX_TOKENS = 10.0
+
+
+class RetryBudgetSnapshot(TypedDict):
+    requests: int
+    retries: int
+    rejected: int
+    """
+    Retries denied because the budget was exhausted.
+    """
+
+    tokens: float
+
+
+class RetryBudget:
+    """
+    Global budget keeping retries to a fraction of the requests.
+
+    Every call deposits `ratio` tokens and every retry withdraws one, the budget
+    also refills by `min_retries_per_second` so low traffic clients can still
+    retry. Tokens are capped to `max_tokens`, which bounds retry bursts, so retry
+    storms cannot amplify the load during incidents.
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float | None = None,
+        min_retries_per_second: float | None = None,
+        max_tokens: float | None = None,
+    ) -> None:
+        self._ratio = DEFAULT_RETRY_RATIO if ratio is None else ratio
+        self._min_retries_per_second = (
+            DEFAULT_MIN_RETRIES_PER_SECOND
+            if min_retries_per_second is None
+            else min_retries_per_second
+        )
+        self._max_tokens = DEFAULT_MAX_TOKENS if max_tokens is None else max_tokens
+        self._lock = threading.Lock()
+        self._tokens = self._max_tokens
+        self._refilled_at: float | None = None
+        self.requests = 0
+        self.retries = 0
+        self.rejected = 0
+
+    def _refill(self, now: float, /) -> None:
+        if self._refilled_at is not None:
+            self._tokens = min(
+                self._tokens + (now - self._refilled_at) * self._min_retries_per_second,
+                self._max_tokens,
+            )
+        self._refilled_at = now
+
+    def deposit(self, *, now: float | None = None) -> None:
+        """
+        Record a call.
+        """
+        with self._lock:
+            self._refill(monotonic() if now is None else now)
+            self._tokens = min(self._tokens + self._ratio, self._max_tokens)
+            self.requests += 1
+
+    def withdraw(self, *, now: float | None = None) -> bool:
+        """
+        Whether a retry may be sent, the retry is recorded if so.
+        """
+        with self._lock:
+            self._refill(monotonic() if now is None else now)
+            if self._tokens < 1:
+                self.rejected += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def snapshot(self) -> RetryBudgetSnapshot:
+        with self._lock:
+            return RetryBudgetSnapshot(
+                requests=self.requests,
+                retries=self.retries,
+                rejected=self.rejected,
+                tokens=self._tokens,
+            )
@@ -0,0 +1,140 @@
+import socket
+import threading
+from typing import Any, Callable, Literal
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_KEEPALIVE_INTERVAL = 10
+DEFAULT_KEEPALIVE_COUNT = 3
+
+type SessionStrategy = Literal['shared', 'thread']
+
+
+class KeepAliveHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter enabling TCP keep-alive on pooled connections.
+
+    Idle connections are probed after `keepalive_idle` seconds so connections
+    silently dropped by load balancers are detected instead of failing the next
+    request.
+    """
+
+    def __init__(
+        self,
+        *,
+        keepalive_idle: float | None = None,
+        keepalive_interval: float | None = None,
+        keepalive_count: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._socket_options = list(HTTPConnection.default_socket_options)
+        if keepalive_idle is not None:
+            self._socket_options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+            # TCP_KEEP* are not available on every platform
+            for option, value in [
+                ('TCP_KEEPIDLE', keepalive_idle),
+                ('TCP_KEEPALIVE', keepalive_idle),
+                (
+                    'TCP_KEEPINTVL',
+                    DEFAULT_KEEPALIVE_INTERVAL
+                    if keepalive_interval is None
+                    else keepalive_interval,
+                ),
+                (
+                    'TCP_KEEPCNT',
+                    DEFAULT_KEEPALIVE_COUNT
+                    if keepalive_count is None
+                    else keepalive_count,
+                ),
+            ]:
+                if hasattr(socket, option):
+                    self._socket_options.append(
+                        (socket.IPPROTO_TCP, getattr(socket, option), int(value))
+                    )
+        super().__init__(**kwargs)
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs: Any,
+    ) -> None:
+        pool_kwargs.setdefault('socket_options', self._socket_options)
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+
+
+def create_session(
+    *,
+    pool_connections: int | None = None,
+    pool_maxsize: int | None = None,
+    pool_block: bool = False,
+    keepalive_idle: float | None = None,
+) -> requests.Session:
+    """
+    Session with a tuned connection pool.
+
+    `pool_connections` is the number of per-host pools kept, `pool_maxsize` the
+    number of connections kept per host (size it to the number of threads sharing
+    the client) and `pool_block` makes requests wait for a free connection instead
+    of opening throwaway ones.
+    """
+    adapter = KeepAliveHTTPAdapter(
+        keepalive_idle=keepalive_idle,
+        pool_connections=DEFAULT_POOL_CONNECTIONS
+        if pool_connections is None
+        else pool_connections,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE if pool_maxsize is None else pool_maxsize,
+        pool_block=pool_block,
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+class ThreadLocalSession:
+    """
+    Session per thread, created on first use by `factory`.
+
+    Drop-in for the parts of `requests.Session` used by the clients, for callers
+    that prefer not to share a session, and its cookies and adapters state, across
+    threads. Each thread keeps its own connection pool.
+    """
+
+    def __init__(self, factory: Callable[[], requests.Session], /) -> None:
+        self._factory = factory
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: list[requests.Session] = []
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Session of the calling thread.
+        """
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = self._factory()
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.request(method, url, **kwargs)
+
+    def head(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.session.head(url, **kwargs)
+
+    def close(self) -> None:
+        """
+        Close the sessions of every thread.
+        """
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
@@ -0,0 +1,64 @@
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Awaitable, Callable
+
+
+class SingleFlight[T]:
+    """
+    Coalesces concurrent calls sharing a key into a single in-flight call.
+
+    Callers arriving while the call is in flight wait for it and receive the same
+    result, or the same exception.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[str, Future[T]] = {}
+        self.coalesced = 0
+
+    def do(self, key: str, fn: Callable[[], T], /) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if future is None:
+                future = self._calls[key] = Future()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight[T]:
+    """
+    Asyncio counterpart of `SingleFlight`.
+
+    The shared call runs in its own task, so cancelling one caller does not cancel
+    the call for the others.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[T]] = {}
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]], /) -> T:
+        task = self._calls.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = self._calls[key] = asyncio.ensure_future(fn())
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        return await asyncio.shield(task)
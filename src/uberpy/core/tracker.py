@@ -0,0 +1,362 @@
+import heapq
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from itertools import count
+from time import monotonic
+from typing import Any, Callable
+
+from uberpy import constants, models
+from uberpy.core.deliveries import Deliveries
+from uberpy.core.ratelimit import TokenBucket
+
+DEFAULT_MIN_INTERVAL = 10.0
+DEFAULT_MAX_INTERVAL = 300.0
+DEFAULT_ETA_FRACTION = 0.25
+DEFAULT_RATE = 5.0
+DEFAULT_BURST = 10
+DEFAULT_MAX_CONCURRENCY = 10
+
+logger = logging.getLogger(__name__)
+
+type DeliveryChanges = dict[str, tuple[Any, Any]]
+type ChangeCallback = Callable[[models.Delivery, DeliveryChanges], None]
+type ErrorCallback = Callable[[str, Exception], None]
+
+PICKUP_STATUSES = frozenset(
+    (
+        constants.DeliveryStatus.PENDING,
+        constants.DeliveryStatus.PICKUP,
+    )
+)
+
+
+def diff_deliveries(
+    previous: models.Delivery | None,
+    current: models.Delivery,
+    /,
+) -> DeliveryChanges:
+    """
+    Changed fields as `{name: (previous, current)}`, every field when there is no
+    previous snapshot.
+    """
+    changes: DeliveryChanges = {}
+    for name in type(current).model_fields:
+        value = getattr(current, name)
+        old = None if previous is None else getattr(previous, name)
+        if previous is None or old != value:
+            changes[name] = (old, value)
+    return changes
+
+
+def next_interval(
+    delivery: models.Delivery,
+    /,
+    *,
+    min_interval: float,
+    max_interval: float,
+    eta_fraction: float,
+    now: datetime | None = None,
+) -> float:
+    """
+    Seconds until the next refresh.
+
+    Imminent couriers are polled every `min_interval`, otherwise a fraction of the
+    time left to the upcoming ETA (pickup until the items are picked up, dropoff
+    afterwards), bounded by `min_interval` and `max_interval`.
+    """
+    if delivery.courier_imminent:
+        return min_interval
+    eta = (
+        delivery.pickup_eta
+        if delivery.status in PICKUP_STATUSES
+        else delivery.dropoff_eta
+    )
+    if eta.tzinfo is None:
+        eta = eta.replace(tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc) if now is None else now
+    seconds = (eta - now).total_seconds() * eta_fraction
+    return min(max(seconds, min_interval), max_interval)
+
+
+class DeliveryTracker:
+    """
+    Adaptive status poller for many deliveries.
+
+    Tracked deliveries are kept in a priority queue ordered by their next refresh,
+    computed from the ETAs and `courier_imminent` (see `next_interval`). Refreshes
+    share a global budget of `rate` requests per second and run `max_concurrency`
+    at a time. Callbacks registered with `on_change` receive the refreshed
+    delivery and the fields that changed since the previous snapshot, deliveries
+    stop being tracked once `complete`. Exceptions raised by change callbacks are
+    passed to `on_error`, and logged when there is none or it raises too.
+
+    Drive it with `poll` from your own loop or with `start` and `stop`.
+    """
+
+    def __init__(
+        self,
+        deliveries: Deliveries,
+        /,
+        *,
+        rate: float | None = None,
+        burst: int | None = None,
+        min_interval: float | None = None,
+        max_interval: float | None = None,
+        eta_fraction: float | None = None,
+        max_concurrency: int | None = None,
+        on_error: ErrorCallback | None = None,
+    ) -> None:
+        self._deliveries = deliveries
+        self._budget = TokenBucket(
+            rate=DEFAULT_RATE if rate is None else rate,
+            burst=DEFAULT_BURST if burst is None else burst,
+        )
+        self._min_interval = (
+            DEFAULT_MIN_INTERVAL if min_interval is None else min_interval
+        )
+        self._max_interval = (
+            DEFAULT_MAX_INTERVAL if max_interval is None else max_interval
+        )
+        self._eta_fraction = (
+            DEFAULT_ETA_FRACTION if eta_fraction is None else eta_fraction
+        )
+        self._max_concurrency = (
+            DEFAULT_MAX_CONCURRENCY if max_concurrency is None else max_concurrency
+        )
+        self._on_error = on_error
+        self._callbacks: list[ChangeCallback] = []
+        self._lock = threading.Lock()
+        self._queue: list[tuple[float, int, str]] = []
+        self._sequence = count()
+        # delivery id -> (sequence of its live queue entry, last snapshot)
+        self._tracked: dict[str, tuple[int, models.Delivery | None]] = {}
+        self._failures: dict[str, int] = {}
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def __len__(self) -> int:
+        return len(self._tracked)
+
+    def __contains__(self, delivery_id: object) -> bool:
+        return delivery_id in self._tracked
+
+    def on_change(self, callback: ChangeCallback, /) -> ChangeCallback:
+        """
+        Register `callback`, usable as a decorator.
+        """
+        self._callbacks.append(callback)
+        return callback
+
+    def track(
+        self,
+        delivery: models.Delivery | str,
+        /,
+        *,
+        now: float | None = None,
+    ) -> None:
+        """
+        Track a delivery by id, or from a snapshot which schedules the first
+        refresh from its ETAs.
+        """
+        now = monotonic() if now is None else now
+        if isinstance(delivery, str):
+            self._schedule(delivery, None, now)
+        elif not delivery.complete:
+            self._schedule(delivery.id, delivery, now + self._interval(delivery))
+
+    def untrack(self, delivery_id: str, /) -> None:
+        with self._lock:
+            # queue entries are dropped lazily when popped
+            self._tracked.pop(delivery_id, None)
+            self._failures.pop(delivery_id, None)
+
+    def poll(self, *, now: float | None = None) -> float | None:
+        """
+        Refresh the deliveries that are due and within budget.
+
+        Returns the seconds until the next refresh is due, `None` when nothing is
+        tracked.
+        """
+        now = monotonic() if now is None else now
+        due = self._pop_due(now)
+        if due:
+            with ThreadPoolExecutor(
+                max_workers=min(self._max_concurrency, len(due)),
+            ) as executor:
+                results = list(executor.map(self._refresh, due))
+            # reschedule the whole batch before callbacks get a chance to raise
+            notifications = [
+                notification
+                for delivery_id, result in zip(due, results)
+                for notification in self._handle(delivery_id, result, now)
+            ]
+            for notification in notifications:
+                notification()
+        with self._lock:
+            while self._queue and self._is_stale(self._queue[0]):
+                heapq.heappop(self._queue)
+            if not self._queue:
+                return None
+            return max(self._queue[0][0] - now, 0.0)
+
+    def start(self) -> None:
+        """
+        Poll in a background daemon thread until `stop`.
+        """
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name='uberpy-delivery-tracker',
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                wait = self.poll()
+            except Exception:
+                logger.exception('delivery tracker poll failed')
+                wait = None
+            self._stop.wait(self._min_interval if wait is None else wait)
+
+    def _interval(self, delivery: models.Delivery, /) -> float:
+        return next_interval(
+            delivery,
+            min_interval=self._min_interval,
+            max_interval=self._max_interval,
+            eta_fraction=self._eta_fraction,
+        )
+
+    def _schedule(
+        self,
+        delivery_id: str,
+        snapshot: models.Delivery | None,
+        due_at: float,
+        /,
+    ) -> None:
+        with self._lock:
+            self._push(delivery_id, snapshot, due_at)
+
+    def _push(
+        self,
+        delivery_id: str,
+        snapshot: models.Delivery | None,
+        due_at: float,
+        /,
+    ) -> None:
+        # called with the lock held
+        sequence = next(self._sequence)
+        self._tracked[delivery_id] = (sequence, snapshot)
+        heapq.heappush(self._queue, (due_at, sequence, delivery_id))
+
+    def _is_stale(self, entry: tuple[float, int, str], /) -> bool:
+        _, sequence, delivery_id = entry
+        tracked = self._tracked.get(delivery_id)
+        return tracked is None or tracked[0] != sequence
+
+    def _pop_due(self, now: float, /) -> list[str]:
+        due: list[str] = []
+        with self._lock:
+            while self._queue and len(due) < self._max_concurrency:
+                entry = self._queue[0]
+                if self._is_stale(entry):
+                    heapq.heappop(self._queue)
+                    continue
+                due_at, sequence, delivery_id = entry
+                if due_at > now:
+                    break
+                # over budget, postpone until a slot frees up
+                wait = self._budget.reserve(now, consume=False)
+                if wait > 0:
+                    heapq.heapreplace(
+                        self._queue,
+                        (now + wait, sequence, delivery_id),
+                    )
+                    break
+                self._budget.reserve(now)
+                heapq.heappop(self._queue)
+                due.append(delivery_id)
+        return due
+
+    def _refresh(self, delivery_id: str, /) -> models.Delivery | Exception:
+        try:
+            return self._deliveries.get_delivery(delivery_id)
+        except Exception as e:
+            return e
+
+    def _handle(
+        self,
+        delivery_id: str,
+        result: models.Delivery | Exception,
+        now: float,
+        /,
+    ) -> list[Callable[[], None]]:
+        """
+        Reschedule a refreshed delivery, returns the callbacks to notify.
+        """
+        # a single critical section, so a concurrent untrack is not undone
+        with self._lock:
+            tracked = self._tracked.get(delivery_id)
+            if tracked is None:
+                return []
+            _, previous = tracked
+            if isinstance(result, Exception):
+                failures = self._failures[delivery_id] = (
+                    self._failures.get(delivery_id, 0) + 1
+                )
+                self._push(
+                    delivery_id,
+                    previous,
+                    now + min(self._min_interval * 2**failures, self._max_interval),
+                )
+            else:
+                self._failures.pop(delivery_id, None)
+                if result.complete:
+                    del self._tracked[delivery_id]
+                else:
+                    self._push(delivery_id, result, now + self._interval(result))
+
+        if isinstance(result, Exception):
+            return [partial(self._error, delivery_id, result)]
+        changes = diff_deliveries(previous, result)
+        if not changes:
+            return []
+        return [
+            partial(self._changed, callback, result, changes)
+            for callback in self._callbacks
+        ]
+
+    def _changed(
+        self,
+        callback: ChangeCallback,
+        delivery: models.Delivery,
+        changes: DeliveryChanges,
+        /,
+    ) -> None:
+        try:
+            callback(delivery, changes)
+        except Exception as e:
+            if self._on_error is None:
+                logger.exception('on_change callback failed for %s', delivery.id)
+            else:
+                self._error(delivery.id, e)
+
+    def _error(self, delivery_id: str, exception: Exception, /) -> None:
+        if self._on_error is None:
+            return
+        try:
+            self._on_error(delivery_id, exception)
+        except Exception:
+            logger.exception('on_error callback failed for %s', delivery_id)
@@ -1,11 +1,47 @@
-import requests
+from functools import partial
+from types import TracebackType
+from typing import Self
 
-from uberpy.core.base import AccessToken, APIVersion, Base
+from uberpy.core.base import AccessToken, APIVersion, Base, Session
+from uberpy.core.circuitbreaker import CircuitBreaker
 from uberpy.core.deliveries import Deliveries
-from uberpy.core.quotes import Quotes
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import Instrumentation
+from uberpy.core.quotes import QuoteCache, Quotes
+from uberpy.core.ratelimit import RateLimiter
+from uberpy.core.retry import RetryBudget
+from uberpy.core.session import SessionStrategy, ThreadLocalSession, create_session
 
 
 class UberDirect(Base):
+    """
+    Uber Direct client.
+
+    Quotes and deliveries share a single session. Unless one is given, its connection
+    pool is sized with `pool_connections`, `pool_maxsize` and `pool_block` (see
+    `uberpy.core.session.create_session`), with the `thread` session strategy each
+    thread gets its own session and pool instead. `timeout` is the read timeout when
+    `connect_timeout` is given.
+
+    `deadline` bounds every call in seconds, retries included, and can be
+    overridden per call. Retries that cannot finish in time are skipped, each
+    attempt times out with the deadline, `Retry-After` is capped to
+    `max_retry_after` and `retry_budget` (see `uberpy.core.retry.RetryBudget`)
+    limits retries across the client tree.
+
+    With `hedging` (see `uberpy.core.hedging.Hedging`) slow quote and delivery
+    status requests are hedged by a second identical request.
+
+    A single client is meant to be shared by every thread. The rate limiter,
+    circuit breaker, retry budget, hedging and instrumentation keep state across
+    calls and are thread-safe, share a single instance of each across the client
+    tree. `access_token` callables are called concurrently, prefer
+    `uberpy.core.auth.TokenProvider`. Size `pool_maxsize` to the number of
+    threads, or use the `thread` session strategy.
+
+    `close` waits for the quote requests still in flight and closes the session.
+    """
+
     def __init__(
         self,
         customer_id: str,
@@ -14,39 +50,111 @@ class UberDirect(Base):
         *,
         version: APIVersion,
         timeout: float | None = None,
-        session: requests.Session | None = None,
+        connect_timeout: float | None = None,
+        session: Session | None = None,
+        session_strategy: SessionStrategy = 'shared',
         jitter_max: float | None = None,
         max_retries: int | None = None,
         retriable_http_codes: set[int] | None = None,
+        rate_limiter: RateLimiter | None = None,
+        instrumentation: Instrumentation | None = None,
+        circuit_breaker: CircuitBreaker | None = None,
+        deadline: float | None = None,
+        max_retry_after: float | None = None,
+        retry_budget: RetryBudget | None = None,
+        hedging: Hedging | None = None,
+        quote_cache: QuoteCache | None = None,
+        coalesce_quotes: bool = False,
+        pool_connections: int | None = None,
+        pool_maxsize: int | None = None,
+        pool_block: bool = False,
+        keepalive_idle: float | None = None,
+        base_url: str | None = None,
     ) -> None:
-        session = session or requests.Session()
+        if session is None:
+            factory = partial(
+                create_session,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                keepalive_idle=keepalive_idle,
+            )
+            session = (
+                ThreadLocalSession(factory)
+                if session_strategy == 'thread'
+                else factory()
+            )
         super().__init__(
             customer_id,
             access_token,
             version=version,
             timeout=timeout,
+            connect_timeout=connect_timeout,
             session=session,
             jitter_max=jitter_max,
             max_retries=max_retries,
             retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
         )
         self.quotes = Quotes(
             customer_id,
             access_token,
             version=version,
+            cache=quote_cache,
+            coalesce=coalesce_quotes,
             timeout=timeout,
+            connect_timeout=connect_timeout,
             session=session,
             jitter_max=jitter_max,
             max_retries=max_retries,
             retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
         )
         self.deliveries = Deliveries(
             customer_id,
             access_token,
             version=version,
             timeout=timeout,
+            connect_timeout=connect_timeout,
             session=session,
             jitter_max=jitter_max,
             max_retries=max_retries,
             retriable_http_codes=retriable_http_codes,
+            rate_limiter=rate_limiter,
+            instrumentation=instrumentation,
+            circuit_breaker=circuit_breaker,
+            deadline=deadline,
+            max_retry_after=max_retry_after,
+            retry_budget=retry_budget,
+            hedging=hedging,
+            base_url=base_url,
         )
+
+    def close(self) -> None:
+        self.quotes.close()
+        self._session.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
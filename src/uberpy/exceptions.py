@@ -0,0 +1,44 @@
+class UberPyError(Exception):
+    """
+    Base class of the errors raised by uberpy itself.
+
+    HTTP errors are raised as is by the underlying HTTP client.
+    """
+
+
+class RateLimitExceeded(UberPyError):
+    """
+    The client side rate limit would be exceeded by sending the request.
+    """
+
+    def __init__(self, message: str, /, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+        """
+        Seconds until the request would be allowed.
+        """
+
+
+class CircuitOpenError(UberPyError):
+    """
+    The circuit of the endpoint is open after too many failures.
+    """
+
+    def __init__(self, message: str, /, *, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+        """
+        Seconds until the circuit lets probe requests through.
+        """
+
+
+class DeadlineExceeded(UberPyError, TimeoutError):
+    """
+    The deadline of the call passed before a request could be sent.
+    """
+
+
+class InvalidSignature(UberPyError):
+    """
+    The webhook signature is missing or does not match the payload.
+    """
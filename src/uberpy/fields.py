@@ -1,12 +1,25 @@
 import json
+import threading
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Annotated, Any, TypedDict
+from typing import Annotated, Any, Sequence, TypedDict
 
-from pydantic import AfterValidator, AwareDatetime, GetCoreSchemaHandler, ValidationInfo
+from pydantic import (
+    AfterValidator,
+    AwareDatetime,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    TypeAdapter,
+    ValidationError,
+    ValidationInfo,
+)
+from pydantic.json_schema import JsonSchemaValue
 from pydantic_core import PydanticCustomError, core_schema
 from pydantic_extra_types.phone_numbers import PhoneNumberValidator
 
+DEFAULT_PHONE_NUMBER_CACHE_SIZE = 4096
+
 
 class _StructuredAddressDict(TypedDict):
     street_address: tuple[str] | tuple[str, str]
@@ -81,15 +94,139 @@ class _DecimalFromIntAnnotation(Decimal):
 
     @classmethod
     def _int_to_decimal(cls, value: int) -> Decimal:
-        return Decimal(str(value / 100))
+        # exact, shifts the exponent instead of dividing through float
+        return Decimal(value).scaleb(-2)
 
     @classmethod
     def _decimal_to_int(cls, value: int | Decimal) -> int:
         if isinstance(value, Decimal):
-            return int(value * 100)
+            return int(value.scaleb(2))
         return value
 
 
+class PhoneNumberCache:
+    """
+    Thread-safe LRU of raw phone number to normalized phone number.
+
+    Invalid numbers are cached too, so they keep failing without being parsed again.
+    """
+
+    def __init__(self, *, max_size: int | None = None) -> None:
+        self._max_size = (
+            DEFAULT_PHONE_NUMBER_CACHE_SIZE if max_size is None else max_size
+        )
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, str | PydanticCustomError] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, /) -> str | PydanticCustomError | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: str, value: str | PydanticCustomError, /) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class CachedPhoneNumberValidator:
+    """
+    Memoizing counterpart of `pydantic_extra_types` `PhoneNumberValidator`.
+
+    Parsing with libphonenumber is expensive, results are kept per raw input in a
+    bounded `PhoneNumberCache`.
+    """
+
+    def __init__(
+        self,
+        *,
+        number_format: str = 'E164',
+        default_region: str | None = None,
+        supported_regions: Sequence[str] | None = None,
+        cache_size: int | None = None,
+    ) -> None:
+        # validates the arguments
+        validator = PhoneNumberValidator(
+            number_format=number_format,
+            default_region=default_region,
+            supported_regions=supported_regions,
+        )
+        self._adapter = TypeAdapter(Annotated[str, validator])
+        self.cache = PhoneNumberCache(max_size=cache_size)
+
+    def __get_pydantic_core_schema__(
+        self,
+        source: type[Any],
+        handler: GetCoreSchemaHandler,
+    ) -> core_schema.CoreSchema:
+        return core_schema.no_info_before_validator_function(
+            self._validate,
+            core_schema.str_schema(),
+        )
+
+    def __get_pydantic_json_schema__(
+        self,
+        schema: core_schema.CoreSchema,
+        handler: GetJsonSchemaHandler,
+    ) -> JsonSchemaValue:
+        json_schema = handler(schema)
+        json_schema.update({'format': 'phone'})
+        return json_schema
+
+    def _parse(self, value: Any, /) -> str:
+        try:
+            return self._adapter.validate_python(value)
+        except ValidationError as e:
+            error = e.errors()[0]
+            raise PydanticCustomError(error['type'], error['msg']) from None
+
+    def _validate(self, value: Any, /) -> str:
+        if not isinstance(value, str):
+            return self._parse(value)
+
+        cached = self.cache.get(value)
+        if cached is None:
+            try:
+                cached = self._parse(value)
+            except PydanticCustomError as e:
+                cached = e
+            self.cache.set(value, cached)
+
+        if isinstance(cached, PydanticCustomError):
+            # raise a fresh error, re-raising the cached one would grow its traceback
+            raise PydanticCustomError(
+                cached.type,
+                cached.message_template,
+                cached.context,
+            )
+        return cached
+
+
+PHONE_NUMBER_VALIDATOR = CachedPhoneNumberValidator(
+    number_format='E164',
+    default_region='MX',
+)
+"""
+Validator of `PhoneNumber` fields, exposes the shared `cache` and its counters.
+"""
+
+
 def _validate_pickup_deadline_dt(
     pickup_deadline_dt: datetime | None,
     info: ValidationInfo,
@@ -116,12 +253,15 @@ def _validate_dropoff_ready_dt(
     dropoff_ready_dt must be less than or equal to pickup_deadline_dt
     """
     pickup_deadline_dt: datetime | None = info.data.get('pickup_deadline_dt')
-    if dropoff_ready_dt and pickup_deadline_dt:
-        if dropoff_ready_dt > pickup_deadline_dt:
-            raise PydanticCustomError(
-                'pickup_deadline_dt',
-                'must be less than or equal to pickup_deadline_dt',
-            )
+    if (
+        dropoff_ready_dt
+        and pickup_deadline_dt
+        and dropoff_ready_dt > pickup_deadline_dt
+    ):
+        raise PydanticCustomError(
+            'pickup_deadline_dt',
+            'must be less than or equal to pickup_deadline_dt',
+        )
     return dropoff_ready_dt
 
 
@@ -153,10 +293,7 @@ def _validate_dropoff_deadline_dt(
 
 type PhoneNumber = Annotated[
     str,
-    PhoneNumberValidator(
-        number_format='E164',
-        default_region='MX',
-    ),
+    PHONE_NUMBER_VALIDATOR,
 ]
 
 type DecimalFromInt = Annotated[
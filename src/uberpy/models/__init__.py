@@ -10,6 +10,7 @@ from .deliveries import (
     DeliveryExternalUserInfoDevice,
     DeliveryExternalUserInfoMerchantAccount,
     DeliveryIdentificationRequirement,
+    DeliveryList,
     DeliveryManifestItem,
     DeliveryManifestItemCustomization,
     DeliveryManifestItemCustomizationOption,
@@ -27,6 +28,12 @@ from .deliveries import (
     DeliveryUserFeesSummary,
     DeliveryUserFeesSummaryTaxInfo,
 )
+from .lazy import (
+    LazyModel,
+)
+from .pickup import (
+    PickupProfile,
+)
 from .quotes import (
     QuoteCreateRequest,
     QuoteCreateResponse,
@@ -36,3 +43,6 @@ from .robocourier import (
     RoboCourierAuto,
     RoboCourierCustom,
 )
+from .webhooks import (
+    WebhookEvent,
+)
@@ -371,6 +371,12 @@ class Delivery(BaseModel):
     ID for the Delivery Quote if one was provided when creating this delivery.
     """
 
+    status: constants.DeliveryStatus | str | None = None
+    """
+    The current status of the delivery, kept as received when it is not a known
+    `DeliveryStatus`.
+    """
+
     complete: bool
     """
     Flag indicating if the delivery has ended, regardless of the possible end status values: delivered, canceled, returned.
@@ -442,6 +448,18 @@ class Delivery(BaseModel):
     """
 
 
+class DeliveryList(BaseModel):
+    data: list[Delivery]
+    """
+    Deliveries of the page.
+    """
+
+    next_href: str | None = None
+    """
+    URL of the next page, empty on the last page.
+    """
+
+
 class DeliveryCreateRequestTestSpecification(BaseModel):
     robo_courier_specification: RoboCourier
     """
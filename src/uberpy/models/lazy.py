@@ -0,0 +1,82 @@
+from functools import cache
+from typing import Annotated, Any
+
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic_core import from_json
+
+
+@cache
+def _field_adapter(model_type: type[BaseModel], name: str, /) -> TypeAdapter:
+    info = model_type.model_fields[name]
+    annotation: Any = info.annotation
+    return TypeAdapter(
+        Annotated[annotation, *info.metadata] if info.metadata else annotation,
+        config=ConfigDict(
+            use_enum_values=model_type.model_config.get('use_enum_values', False),
+            from_attributes=model_type.model_config.get('from_attributes', False),
+        ),
+    )
+
+
+class LazyModel[M: BaseModel]:
+    """
+    Response body of `model_type` validated on demand, returned by
+    `response_mode='lazy'`:
+
+        delivery = client.deliveries.get_delivery(..., response_mode='lazy')
+        delivery.complete
+
+    Fields are validated on first access and cached, the body is decoded once.
+    Missing required fields raise the `ValidationError` of the full validation.
+    `model` validates the whole body, model validators only run there. `raw`
+    keeps the body as received.
+    """
+
+    def __init__(self, model_type: type[M], raw: bytes | str, /) -> None:
+        self.raw = raw
+        self.model_type = model_type
+        self._data: dict[str, Any] | None = None
+        self._model: M | None = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}[{self.model_type.__name__}]({self.raw!r})'
+
+    def __getattr__(self, name: str) -> Any:
+        info = None if name.startswith('_') else self.model_type.model_fields.get(name)
+        if info is None:
+            raise AttributeError(name)
+        if self._data is None:
+            self._data = from_json(self.raw)
+        data = self._data
+        if name in data:
+            value = data[name]
+        elif info.alias is not None and info.alias in data:
+            value = data[info.alias]
+        elif info.is_required():
+            # raises the same error full validation would
+            self.model_type.model_validate(data)
+            raise AttributeError(name)
+        else:
+            value = info.get_default(call_default_factory=True)
+            setattr(self, name, value)
+            return value
+        # plain JSON scalars need no validation
+        if type(value) is not info.annotation or info.metadata:
+            value = _field_adapter(self.model_type, name).validate_python(value)
+        # cached as an instance attribute, later reads skip __getattr__
+        setattr(self, name, value)
+        return value
+
+    @property
+    def validated(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self) -> M:
+        if self._model is None:
+            self._model = (
+                self.model_type.model_validate_json(self.raw)
+                if self._data is None
+                else self.model_type.model_validate(self._data)
+            )
+        return self._model
@@ -0,0 +1,233 @@
+from typing import Any
+
+from pydantic import ConfigDict, Field, PrivateAttr, create_model
+from pydantic_core import to_json
+from pydantic_extra_types.coordinate import Latitude, Longitude
+
+from uberpy import fields
+from uberpy.models.base import BaseModel
+from uberpy.models.deliveries import DeliveryCreateRequest, DeliveryPickupVerification
+from uberpy.models.quotes import QuoteCreateRequest
+
+DELIVERY_PICKUP_FIELDS = (
+    'pickup_name',
+    'pickup_address',
+    'pickup_phone_number',
+    'pickup_business_name',
+    'pickup_latitude',
+    'pickup_longitude',
+    'pickup_verification',
+    'external_store_id',
+)
+
+QUOTE_PICKUP_FIELDS = (
+    'pickup_address',
+    'pickup_phone_number',
+    'pickup_latitude',
+    'pickup_longitude',
+    'external_store_id',
+)
+
+
+class PickupProfile(BaseModel):
+    """
+    Pickup block shared by every request of a store.
+
+    The profile is validated once and its JSON serialization is cached, requests
+    built with `delivery_request` and `quote_request` skip validating the pickup
+    fields and splice the cached serialization into the outgoing body.
+    """
+
+    # merged with the base model configuration
+    model_config = ConfigDict(frozen=True)
+
+    pickup_name: str | None = None
+    """
+    Designation of the location where the courier will make the pickup. Required to create deliveries.
+    """
+
+    pickup_address: fields.StructuredAddress
+    """
+    Pickup address details.
+    """
+
+    pickup_phone_number: fields.PhoneNumber
+    """
+    Phone number for the pickup location, usually the store's contact.
+    """
+
+    pickup_business_name: str | None = None
+    """
+    Business name of the pickup location.
+    """
+
+    pickup_latitude: Latitude | None = None
+    """
+    Pickup latitude coordinate.
+    """
+
+    pickup_longitude: Longitude | None = None
+    """
+    Pickup longitude coordinate.
+    """
+
+    pickup_verification: DeliveryPickupVerification | None = None
+    """
+    Verification steps that must be taken before the pickup can be completed. Only sent when creating deliveries.
+    """
+
+    external_store_id: str | None = None
+    """
+    Unique identifier used by our Partners to reference a store or location.
+    """
+
+    _serialized: dict[tuple[str, ...], dict[str, Any]] = PrivateAttr(
+        default_factory=dict,
+    )
+
+    def delivery_request(self, **kwargs: Any) -> DeliveryCreateRequest:
+        """
+        Validate a delivery request from the non pickup fields in `kwargs`.
+        """
+        if self.pickup_name is None:
+            raise ValueError('pickup_name is required to create deliveries')
+        return self._request(
+            _PickupDeliveryCreateRequest, DELIVERY_PICKUP_FIELDS, kwargs
+        )
+
+    def quote_request(self, **kwargs: Any) -> QuoteCreateRequest:
+        """
+        Validate a quote request from the non pickup fields in `kwargs`.
+        """
+        return self._request(_PickupQuoteCreateRequest, QUOTE_PICKUP_FIELDS, kwargs)
+
+    def serialize(
+        self,
+        names: tuple[str, ...],
+        /,
+        *,
+        mode: str = 'json',
+        by_alias: bool | None = None,
+        exclude_none: bool = True,
+    ) -> dict[str, Any]:
+        """
+        Serialized pickup fields, JSON mode without nones is computed once.
+        """
+        if mode != 'json' or by_alias or not exclude_none:
+            return self.model_dump(
+                include=set(names),
+                mode=mode,
+                by_alias=by_alias,
+                exclude_none=exclude_none,
+            )
+        serialized = self._serialized.get(names)
+        if serialized is None:
+            serialized = self._serialized[names] = self.model_dump(
+                include=set(names),
+                mode='json',
+                exclude_none=True,
+            )
+        return serialized
+
+    def _request[M: BaseModel](
+        self,
+        model: type[M],
+        names: tuple[str, ...],
+        kwargs: dict[str, Any],
+        /,
+    ) -> M:
+        if overlap := set(names) & kwargs.keys():
+            raise TypeError(
+                f'pickup fields are taken from the profile: {", ".join(sorted(overlap))}'
+            )
+        request = model.model_validate(
+            {**kwargs, **{name: getattr(self, name) for name in names}}
+        )
+        request._pickup = self  # type: ignore[attr-defined]
+        return request
+
+
+class _PickupRequest:
+    """
+    Splices the profile's cached serialization into `model_dump` and
+    `model_dump_json`, in place of the excluded pickup fields.
+    """
+
+    _pickup: PickupProfile
+    _pickup_fields: tuple[str, ...]
+
+    def model_dump(self, **kwargs: Any) -> dict[str, Any]:
+        dumped = super().model_dump(**kwargs)  # type: ignore[misc]
+        pickup = self._pickup.serialize(
+            self._pickup_fields,
+            mode=kwargs.get('mode', 'python'),
+            by_alias=kwargs.get('by_alias'),
+            exclude_none=kwargs.get('exclude_none', False),
+        )
+        include = kwargs.get('include')
+        exclude = kwargs.get('exclude')
+        if include is not None or exclude is not None:
+            pickup = {
+                name: value
+                for name, value in pickup.items()
+                if (include is None or name in include)
+                and (exclude is None or name not in exclude)
+            }
+        return {**dumped, **pickup}
+
+    def model_dump_json(self, *, indent: int | None = None, **kwargs: Any) -> str:
+        return to_json(
+            self.model_dump(**kwargs, mode='json'),
+            indent=indent,
+        ).decode()
+
+
+def _pickup_model[M: BaseModel](
+    name: str,
+    model: type[M],
+    names: tuple[str, ...],
+    /,
+) -> type[M]:
+    """
+    Subclass of `model` taking the pickup fields as is, they were validated by the
+    profile, and excluding them from its own serialization in favor of the profile's.
+
+    `name` is the module attribute the class is bound to, so its instances pickle.
+    """
+    base = create_model(  # type: ignore[call-overload]
+        f'{name}Base',
+        __base__=model,
+        __module__=__name__,
+        _pickup=(PickupProfile, PrivateAttr()),
+        **{
+            name: (
+                Any,
+                Field(
+                    default=None,
+                    exclude=True,
+                ),
+            )
+            for name in names
+        },
+    )
+    return type(
+        name,
+        (_PickupRequest, base),
+        {
+            '__module__': __name__,
+            '_pickup_fields': names,
+        },
+    )
+
+
+_PickupDeliveryCreateRequest = _pickup_model(
+    '_PickupDeliveryCreateRequest',
+    DeliveryCreateRequest,
+    DELIVERY_PICKUP_FIELDS,
+)
+
+_PickupQuoteCreateRequest = _pickup_model(
+    '_PickupQuoteCreateRequest',
+    QuoteCreateRequest,
+    QUOTE_PICKUP_FIELDS,
+)
@@ -0,0 +1,47 @@
+from datetime import datetime
+
+from uberpy import constants
+from uberpy.models.base import BaseModel
+from uberpy.models.deliveries import Delivery
+
+
+class WebhookEvent(BaseModel):
+    id: str
+    """
+    Unique identifier of the event, kept across redeliveries.
+    """
+
+    kind: constants.WebhookEventKind | str
+    """
+    Type of event, e.g. `event.delivery_status`.
+    """
+
+    created: datetime
+    """
+    Date/time at which the event was created.
+    """
+
+    delivery_id: str
+    """
+    Unique identifier of the delivery the event refers to.
+    """
+
+    status: constants.DeliveryStatus | None = None
+    """
+    Status of the delivery when the event was sent.
+    """
+
+    customer_id: str | None = None
+    """
+    Unique identifier of the customer the delivery belongs to.
+    """
+
+    live_mode: bool | None = None
+    """
+    Flag indicating whether the event refers to a production delivery.
+    """
+
+    data: Delivery | None = None
+    """
+    Delivery when the event was sent.
+    """
@@ -0,0 +1,13 @@
+"""
+Local stand-in for the Uber Direct API, to benchmark clients under controlled
+and reproducible load.
+"""
+
+from .server import (
+    FakeServer,
+    Latency,
+    constant,
+    lognormal,
+    parse_latency,
+    uniform,
+)
@@ -0,0 +1,638 @@
+import argparse
+import asyncio
+import importlib.metadata
+import json
+import multiprocessing
+import platform
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing.connection import Connection
+from time import perf_counter, process_time, time
+from typing import Any, Literal, Sequence, TypedDict, get_args
+
+import uberpy
+from uberpy import UberDirect, models
+from uberpy.core.instrumentation import (
+    AttemptInfo,
+    CallInfo,
+    CompositeInstrumentation,
+    Instrumentation,
+    MetricsInstrumentation,
+)
+from uberpy.testing.server import (
+    DEFAULT_ERROR_STATUS,
+    FakeServer,
+    parse_latency,
+)
+
+type Mode = Literal['threads', 'processes', 'async']
+type Operation = Literal['quote', 'delivery']
+
+DEFAULT_MODE: Mode = 'threads'
+DEFAULT_OPERATION: Operation = 'delivery'
+DEFAULT_CONCURRENCY = 8
+DEFAULT_REQUESTS = 400
+DEFAULT_RETRY_AFTER = 0.1
+DEFAULT_THRESHOLD = 0.2
+
+PHASES = ('serialization', 'validation', 'io')
+
+ADDRESS = {
+    'street_address': ['Av. Paseo de la Reforma 222', 'Piso 3'],
+    'city': 'Ciudad de México',
+    'state': 'CDMX',
+    'zip_code': '06600',
+    'country': 'MX',
+}
+
+QUOTE_REQUEST = models.QuoteCreateRequest.model_validate(
+    {
+        'pickup_address': ADDRESS,
+        'pickup_phone_number': '+525555555555',
+        'dropoff_address': ADDRESS,
+        'dropoff_phone_number': '+525555555556',
+        'manifest_total_value': 1099,
+    }
+)
+
+DELIVERY_REQUEST = models.DeliveryCreateRequest.model_validate(
+    {
+        'quote_id': 'dqt_loadgen',
+        'pickup_name': 'Store',
+        'pickup_address': ADDRESS,
+        'pickup_phone_number': '+525555555555',
+        'dropoff_name': 'Customer',
+        'dropoff_address': ADDRESS,
+        'dropoff_phone_number': '+525555555556',
+        'manifest_items': [
+            {'name': f'Item {i}', 'quantity': 1, 'price': 1099} for i in range(10)
+        ],
+        'manifest_total_value': 10990,
+    }
+)
+
+
+class LatencySummary(TypedDict):
+    count: int
+    mean: float | None
+    p50: float | None
+    p90: float | None
+    p99: float | None
+    max: float | None
+
+
+class WorkerResult(TypedDict):
+    started: float
+    finished: float
+    cpu_time: float
+    latencies: dict[str, list[float]]
+    """
+    Seconds of every successful operation, by operation.
+    """
+
+    errors: dict[str, int]
+    """
+    Failed operations by exception type.
+    """
+
+    retries: int
+    giveups: int
+    phase_cpu_time: dict[str, float]
+    """
+    CPU seconds spent in each phase of the calls, see `PHASES`. `io` is the rest
+    of `cpu_time`: sockets, HTTP parsing and the remaining client code.
+    """
+
+
+class LoadResult(TypedDict):
+    mode: Mode
+    operation: Operation
+    concurrency: int
+    requests: int
+    duration: float
+    throughput: dict[str, float]
+    """
+    Successful operations per second, by operation.
+    """
+
+    latency: dict[str, LatencySummary]
+    errors: dict[str, int]
+    retries: int
+    giveups: int
+    cpu_time: float
+    """
+    CPU seconds of the client processes.
+    """
+
+    phase_cpu_time: dict[str, float]
+
+
+def percentile(values: Sequence[float], p: float, /) -> float | None:
+    if not values:
+        return None
+    return values[min(int(len(values) * p / 100), len(values) - 1)]
+
+
+def summarize(latencies: list[float], /) -> LatencySummary:
+    latencies = sorted(latencies)
+    return LatencySummary(
+        count=len(latencies),
+        mean=sum(latencies) / len(latencies) if latencies else None,
+        p50=percentile(latencies, 50),
+        p90=percentile(latencies, 90),
+        p99=percentile(latencies, 99),
+        max=latencies[-1] if latencies else None,
+    )
+
+
+class _CPUInstrumentation(Instrumentation):
+    """
+    Sums the CPU time spent serializing requests and validating responses,
+    thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.serialization = 0.0
+        self.validation = 0.0
+
+    def after_response(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        with self._lock:
+            self.serialization += attempt['serialization_cpu']
+
+    def on_success(self, call: CallInfo, /) -> None:
+        with self._lock:
+            self.validation += call['validation_cpu']
+
+    def reset(self) -> None:
+        with self._lock:
+            self.serialization = 0.0
+            self.validation = 0.0
+
+
+class _Recorder:
+    """
+    Latencies and errors of the operations of a worker, thread-safe.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.latencies: dict[str, list[float]] = {'quote': [], 'delivery': []}
+        self.errors: dict[str, int] = {}
+
+    def success(self, operation: str, latency: float, /) -> None:
+        with self._lock:
+            self.latencies[operation].append(latency)
+
+    def failure(self, exception: Exception, /) -> None:
+        with self._lock:
+            name = type(exception).__name__
+            self.errors[name] = self.errors.get(name, 0) + 1
+
+    def result(
+        self,
+        metrics: MetricsInstrumentation,
+        cpu: _CPUInstrumentation,
+        started: float,
+        cpu_started: float,
+        /,
+    ) -> WorkerResult:
+        endpoints = metrics.snapshot().values()
+        cpu_time = process_time() - cpu_started
+        return WorkerResult(
+            started=started,
+            finished=time(),
+            cpu_time=cpu_time,
+            latencies=self.latencies,
+            errors=self.errors,
+            retries=sum(endpoint['retries'] for endpoint in endpoints),
+            giveups=sum(endpoint['giveups'] for endpoint in endpoints),
+            phase_cpu_time={
+                'serialization': cpu.serialization,
+                'validation': cpu.validation,
+                'io': max(cpu_time - cpu.serialization - cpu.validation, 0.0),
+            },
+        )
+
+
+def client_options(url: str, max_retries: int | None, /) -> dict:
+    return {
+        'version': 'v1',
+        'base_url': url,
+        'max_retries': max_retries,
+    }
+
+
+def run_flow(
+    client: UberDirect,
+    operation: Operation,
+    recorder: _Recorder,
+    /,
+) -> None:
+    """
+    Create a quote and, for the `delivery` operation, a delivery from it.
+    """
+    try:
+        started = perf_counter()
+        quote = client.quotes.create_quote(request=QUOTE_REQUEST)
+        quoted = perf_counter()
+        recorder.success('quote', quoted - started)
+        if operation == 'delivery':
+            client.deliveries.create_delivery(
+                request=DELIVERY_REQUEST.model_copy(update={'quote_id': quote.id})
+            )
+            recorder.success('delivery', perf_counter() - quoted)
+    except Exception as e:
+        recorder.failure(e)
+
+
+def run_threads(
+    url: str,
+    operation: Operation,
+    requests: int,
+    threads: int,
+    max_retries: int | None,
+    /,
+) -> WorkerResult:
+    """
+    Run `requests` flows over `threads` threads sharing one client.
+    """
+    metrics, cpu = MetricsInstrumentation(), _CPUInstrumentation()
+    client = UberDirect(
+        'loadgen',
+        'token',
+        pool_maxsize=threads,
+        instrumentation=CompositeInstrumentation(metrics, cpu),
+        **client_options(url, max_retries),
+    )
+    # open the connections and build the validators before measuring
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        warmup = _Recorder()
+        list(
+            executor.map(lambda _: run_flow(client, operation, warmup), range(threads))
+        )
+
+        recorder = _Recorder()
+        metrics.reset()
+        cpu.reset()
+        started, cpu_started = time(), process_time()
+        list(
+            executor.map(
+                lambda _: run_flow(client, operation, recorder),
+                range(requests),
+            )
+        )
+    return recorder.result(metrics, cpu, started, cpu_started)
+
+
+def run_async(
+    url: str,
+    operation: Operation,
+    requests: int,
+    tasks: int,
+    max_retries: int | None,
+    /,
+) -> WorkerResult:
+    """
+    Run `requests` flows over `tasks` tasks sharing one client.
+    """
+    from uberpy.aio import AsyncUberDirect
+
+    async def flow(client: AsyncUberDirect, recorder: _Recorder) -> None:
+        try:
+            started = perf_counter()
+            quote = await client.quotes.create_quote(request=QUOTE_REQUEST)
+            quoted = perf_counter()
+            recorder.success('quote', quoted - started)
+            if operation == 'delivery':
+                await client.deliveries.create_delivery(
+                    request=DELIVERY_REQUEST.model_copy(update={'quote_id': quote.id})
+                )
+                recorder.success('delivery', perf_counter() - quoted)
+        except Exception as e:
+            recorder.failure(e)
+
+    async def run() -> WorkerResult:
+        metrics, cpu = MetricsInstrumentation(), _CPUInstrumentation()
+        async with AsyncUberDirect(
+            'loadgen',
+            'token',
+            max_connections=tasks,
+            instrumentation=CompositeInstrumentation(metrics, cpu),
+            **client_options(url, max_retries),
+        ) as client:
+            warmup = _Recorder()
+            await asyncio.gather(*(flow(client, warmup) for _ in range(tasks)))
+
+            recorder = _Recorder()
+            metrics.reset()
+            cpu.reset()
+            started, cpu_started = time(), process_time()
+            semaphore = asyncio.Semaphore(tasks)
+
+            async def bounded() -> None:
+                async with semaphore:
+                    await flow(client, recorder)
+
+            await asyncio.gather(*(bounded() for _ in range(requests)))
+        return recorder.result(metrics, cpu, started, cpu_started)
+
+    return asyncio.run(run())
+
+
+def run_processes(
+    url: str,
+    operation: Operation,
+    requests: int,
+    processes: int,
+    max_retries: int | None,
+    /,
+) -> list[WorkerResult]:
+    """
+    Split `requests` flows over `processes` single threaded processes.
+    """
+    shares = [
+        requests // processes + (index < requests % processes)
+        for index in range(processes)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context('spawn'),
+    ) as executor:
+        futures = [
+            executor.submit(run_threads, url, operation, share, 1, max_retries)
+            for share in shares
+        ]
+        return [future.result() for future in futures]
+
+
+def aggregate(
+    results: list[WorkerResult],
+    /,
+    *,
+    mode: Mode,
+    operation: Operation,
+    concurrency: int,
+    requests: int,
+) -> LoadResult:
+    duration = max(result['finished'] for result in results) - min(
+        result['started'] for result in results
+    )
+    latencies: dict[str, list[float]] = {}
+    errors: dict[str, int] = {}
+    for result in results:
+        for name, values in result['latencies'].items():
+            latencies.setdefault(name, []).extend(values)
+        for name, count in result['errors'].items():
+            errors[name] = errors.get(name, 0) + count
+    if operation == 'quote':
+        latencies.pop('delivery', None)
+    return LoadResult(
+        mode=mode,
+        operation=operation,
+        concurrency=concurrency,
+        requests=requests,
+        duration=duration,
+        throughput={name: len(values) / duration for name, values in latencies.items()},
+        latency={name: summarize(values) for name, values in latencies.items()},
+        errors=errors,
+        retries=sum(result['retries'] for result in results),
+        giveups=sum(result['giveups'] for result in results),
+        cpu_time=sum(result['cpu_time'] for result in results),
+        phase_cpu_time={
+            phase: sum(result['phase_cpu_time'][phase] for result in results)
+            for phase in PHASES
+        },
+    )
+
+
+def run(
+    url: str,
+    /,
+    *,
+    mode: Mode | None = None,
+    operation: Operation | None = None,
+    concurrency: int | None = None,
+    requests: int | None = None,
+    max_retries: int | None = None,
+) -> LoadResult:
+    """
+    Drive `requests` quote (and delivery) flows against the API at `url` with
+    `concurrency` threads, processes or asyncio tasks.
+    """
+    mode = DEFAULT_MODE if mode is None else mode
+    operation = DEFAULT_OPERATION if operation is None else operation
+    concurrency = DEFAULT_CONCURRENCY if concurrency is None else concurrency
+    requests = DEFAULT_REQUESTS if requests is None else requests
+
+    match mode:
+        case 'threads':
+            results = [run_threads(url, operation, requests, concurrency, max_retries)]
+        case 'async':
+            results = [run_async(url, operation, requests, concurrency, max_retries)]
+        case 'processes':
+            results = run_processes(url, operation, requests, concurrency, max_retries)
+    return aggregate(
+        results,
+        mode=mode,
+        operation=operation,
+        concurrency=concurrency,
+        requests=requests,
+    )
+
+
+def package_version() -> str:
+    """
+    Installed uberpy version, falling back for source checkouts without metadata.
+    """
+    try:
+        return importlib.metadata.version('uberpy')
+    except importlib.metadata.PackageNotFoundError:
+        return getattr(uberpy, '__version__', 'unknown')
+
+
+def serve(connection: Connection, options: dict[str, Any], /) -> None:
+    """
+    Run a `FakeServer` in its own process so it does not compete with the
+    client for the GIL, sending its URL through `connection`.
+    """
+    latency = options.pop('latency')
+    server = FakeServer(
+        latency=None if latency is None else parse_latency(latency),
+        **options,
+    )
+    connection.send(server.url)
+    connection.close()
+    server.serve_forever()
+
+
+def report(result: LoadResult, /) -> None:
+    print(
+        f'{result["mode"]} x{result["concurrency"]}, '
+        f'{result["requests"]} {result["operation"]} flows in '
+        f'{result["duration"]:.2f}s'
+    )
+    for name, summary in result['latency'].items():
+        if not summary['count']:
+            continue
+        print(
+            f'  {name:<8}  {result["throughput"][name]:>10,.1f} ops/s  '
+            + '  '.join(
+                f'{name} {(seconds or 0) * 1000:>8.1f}ms'
+                for name, seconds in (
+                    ('p50', summary['p50']),
+                    ('p90', summary['p90']),
+                    ('p99', summary['p99']),
+                    ('max', summary['max']),
+                )
+            )
+        )
+    phases = result['phase_cpu_time']
+    total = sum(phases.values()) or 1.0
+    print(f'  client cpu time {result["cpu_time"]:.2f}s')
+    print(
+        '  cpu time by phase '
+        + ', '.join(
+            f'{phase} {seconds / total:.0%}' for phase, seconds in phases.items()
+        )
+    )
+    print(
+        f'  retries {result["retries"]}, giveups {result["giveups"]}, errors '
+        + (
+            ', '.join(f'{name} {count}' for name, count in result['errors'].items())
+            or '0'
+        )
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='uberpy-loadgen',
+        description=(
+            'End to end client throughput against a local stand-in Uber Direct '
+            'server, or the one at --url.'
+        ),
+    )
+    parser.add_argument(
+        '--mode', choices=get_args(Mode.__value__), default=DEFAULT_MODE
+    )
+    parser.add_argument(
+        '--operation',
+        choices=get_args(Operation.__value__),
+        default=DEFAULT_OPERATION,
+        help='flow to run, delivery creates a quote then a delivery',
+    )
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=DEFAULT_CONCURRENCY,
+        help='threads, processes or asyncio tasks',
+    )
+    parser.add_argument('--requests', type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument('--max-retries', type=int)
+    parser.add_argument('--url', help='server to use instead of a local one')
+    parser.add_argument(
+        '--latency',
+        help='constant:<s>, uniform:<low>:<high> or lognormal:<median>:<sigma>',
+    )
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=DEFAULT_ERROR_STATUS)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=DEFAULT_RETRY_AFTER)
+    parser.add_argument('--seed', type=int)
+    parser.add_argument(
+        '--json',
+        action='store_true',
+        help='print machine readable results',
+    )
+    parser.add_argument(
+        '--compare',
+        metavar='BASELINE',
+        help='JSON output of a previous run, exit with an error on regressions',
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help='tolerated relative ops/s drop when comparing (default: %(default)s)',
+    )
+    args = parser.parse_args(argv)
+    if args.mode == 'async':
+        try:
+            import httpx  # noqa: F401
+        except ImportError:
+            parser.error('async mode requires the aio extra')
+    if args.latency is not None:
+        try:
+            parse_latency(args.latency)
+        except (TypeError, ValueError) as e:
+            parser.error(f'invalid latency {args.latency}: {e}')
+
+    server = None
+    url = args.url
+    if url is None:
+        context = multiprocessing.get_context('spawn')
+        receiver, sender = context.Pipe(duplex=False)
+        server = context.Process(
+            target=serve,
+            args=(
+                sender,
+                {
+                    'latency': args.latency,
+                    'error_rate': args.error_rate,
+                    'error_status': args.error_status,
+                    'throttle_rate': args.throttle_rate,
+                    'retry_after': args.retry_after,
+                    'seed': args.seed,
+                },
+            ),
+            daemon=True,
+        )
+        server.start()
+        url = receiver.recv()
+
+    try:
+        result = run(
+            url,
+            mode=args.mode,
+            operation=args.operation,
+            concurrency=args.concurrency,
+            requests=args.requests,
+            max_retries=args.max_retries,
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.join()
+
+    if args.json:
+        json.dump(
+            {
+                'python': platform.python_version(),
+                'uberpy': package_version(),
+                'result': result,
+            },
+            sys.stdout,
+            indent=2,
+        )
+        print()
+    else:
+        report(result)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)['result']['throughput']
+        regressions = [
+            name
+            for name, throughput in result['throughput'].items()
+            if name in baseline and throughput < baseline[name] * (1 - args.threshold)
+        ]
+        for name in regressions:
+            print(f'regression: {name}', file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,751 @@
+import argparse
+import base64
+import json
+import math
+import random
+import re
+import socket
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from time import sleep
+from typing import Any, Callable, Mapping, NotRequired, Self, Sequence, TypedDict
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+from uberpy import constants
+
+type Latency = Callable[[random.Random], float]
+type Response = tuple[int, dict[str, str], Any]
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 0
+DEFAULT_ERROR_STATUS = 503
+DEFAULT_RETRY_AFTER = 1.0
+DEFAULT_STEP = 10.0
+DEFAULT_PAGE_SIZE = 50
+DEFAULT_QUOTE_TTL = 15 * 60
+DEFAULT_EXPIRES_IN = 3600
+
+ROUTES = (
+    'token',
+    'create_quote',
+    'create_delivery',
+    'list_deliveries',
+    'get_delivery',
+    'update_delivery',
+    'cancel_delivery',
+    'proof_of_delivery',
+)
+
+AUTO_STATUSES = (
+    constants.DeliveryStatus.PENDING,
+    constants.DeliveryStatus.PICKUP,
+    constants.DeliveryStatus.PICKUP_COMPLETE,
+    constants.DeliveryStatus.DROPOFF,
+    constants.DeliveryStatus.DELIVERED,
+)
+COMPLETE_STATUSES = frozenset(
+    (
+        constants.DeliveryStatus.DELIVERED,
+        constants.DeliveryStatus.CANCELED,
+        constants.DeliveryStatus.RETURNED,
+    )
+)
+
+# 1x1 transparent PNG
+DOCUMENT = base64.b64decode(
+    'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII='
+)
+
+API_PATH = re.compile(
+    r'^/(?P<version>v\d+)/customers/(?P<customer_id>[^/]+)/(?P<path>.+)$'
+)
+
+
+def constant(seconds: float, /) -> Latency:
+    return lambda rng: seconds
+
+
+def uniform(low: float, high: float, /) -> Latency:
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal(median: float, sigma: float, /) -> Latency:
+    """
+    Long tailed latency, `sigma` of 0.5 puts p99 at about 3.2 times the median.
+    """
+    mu = math.log(median)
+    return lambda rng: rng.lognormvariate(mu, sigma)
+
+
+def parse_latency(spec: str, /) -> Latency:
+    """
+    Latency from `constant:<seconds>`, `uniform:<low>:<high>` or
+    `lognormal:<median>:<sigma>`.
+    """
+    name, *args = spec.split(':')
+    distributions: dict[str, Callable[..., Latency]] = {
+        'constant': constant,
+        'uniform': uniform,
+        'lognormal': lognormal,
+    }
+    if name not in distributions:
+        raise ValueError(f'unknown latency distribution: {name}')
+    return distributions[name](*map(float, args))
+
+
+def timestamp(value: datetime, /) -> str:
+    return value.isoformat().replace('+00:00', 'Z')
+
+
+def error(status: int, code: str, message: str, /) -> Response:
+    return status, {}, {'kind': 'error', 'code': code, 'message': message}
+
+
+class Timeline(TypedDict):
+    """
+    When a delivery reaches each status.
+    """
+
+    pickup: datetime
+    pickup_imminent: datetime
+    pickup_complete: datetime
+    dropoff: datetime
+    dropoff_imminent: datetime
+    delivered: datetime
+    final_status: constants.DeliveryStatus
+
+
+class DeliveryRecord(TypedDict):
+    customer_id: str
+    delivery: dict[str, Any]
+    timeline: Timeline
+    canceled: NotRequired[datetime]
+
+
+class ServerStats(TypedDict):
+    requests: int
+    routes: dict[str, dict[int, int]]
+    """
+    Responses by route and status code.
+    """
+
+    throttled: int
+    errors: int
+    """
+    Injected server errors.
+    """
+
+    quotes: int
+    deliveries: int
+
+
+def auto_timeline(created: datetime, step: float, /) -> Timeline:
+    """
+    Robocourier `auto` mode, every status lasts `step` seconds and the courier
+    becomes imminent halfway through pickup and dropoff.
+    """
+    step_delta = timedelta(seconds=step)
+    return Timeline(
+        pickup=created + step_delta,
+        pickup_imminent=created + step_delta * 1.5,
+        pickup_complete=created + step_delta * 2,
+        dropoff=created + step_delta * 3,
+        dropoff_imminent=created + step_delta * 3.5,
+        delivered=created + step_delta * 4,
+        final_status=constants.DeliveryStatus.DELIVERED,
+    )
+
+
+def request_timeline(
+    created: datetime,
+    step: float,
+    test_specifications: Mapping[str, Any] | None,
+    /,
+) -> Timeline:
+    """
+    Timeline of the robocourier specification of a create delivery request.
+    """
+    timeline = auto_timeline(created, step)
+    specification = (test_specifications or {}).get('robo_courier_specification')
+    if not specification:
+        return timeline
+    if specification.get('mode') == constants.RoboCourierMode.CUSTOM:
+        pickup = datetime.fromisoformat(specification['pickup_at'])
+        return Timeline(
+            pickup=datetime.fromisoformat(specification['enroute_for_pickup_at']),
+            pickup_imminent=datetime.fromisoformat(specification['pickup_imminent_at']),
+            pickup_complete=pickup,
+            dropoff=pickup,
+            dropoff_imminent=datetime.fromisoformat(
+                specification['dropoff_imminent_at']
+            ),
+            delivered=datetime.fromisoformat(specification['dropoff_at']),
+            final_status=constants.DeliveryStatus.DELIVERED,
+        )
+    # the courier gives up at the dropoff and returns the items
+    if specification.get('cancel_reason'):
+        timeline['final_status'] = constants.DeliveryStatus.RETURNED
+    return timeline
+
+
+def delivery_status(
+    timeline: Timeline,
+    now: datetime,
+    /,
+) -> tuple[constants.DeliveryStatus, bool]:
+    """
+    Status and `courier_imminent` at `now`.
+    """
+    if now >= timeline['delivered']:
+        return timeline['final_status'], False
+    if now >= timeline['dropoff']:
+        return constants.DeliveryStatus.DROPOFF, now >= timeline['dropoff_imminent']
+    if now >= timeline['pickup_complete']:
+        return constants.DeliveryStatus.PICKUP_COMPLETE, False
+    if now >= timeline['pickup']:
+        return constants.DeliveryStatus.PICKUP, now >= timeline['pickup_imminent']
+    return constants.DeliveryStatus.PENDING, False
+
+
+def courier(rng: random.Random, /) -> dict[str, Any]:
+    phone_number = f'+1555{rng.randrange(10**7):07d}'
+    return {
+        'name': 'Robo Courier',
+        'vehicle_type': 'car',
+        'phone_number': phone_number,
+        'img_href': 'https://example.com/courier.png',
+        'public_phone_info': {
+            'formatted_phone_number': phone_number,
+            'phone_number': phone_number,
+            'pin_code': f'{rng.randrange(10**6):06d}',
+        },
+    }
+
+
+class FakeServer:
+    """
+    Local stand-in for the Uber Direct API, for load and retry testing.
+
+    Serves quotes, deliveries (create, get, list, update, cancel and proof of
+    delivery) and OAuth tokens with the response shapes of the API. Every
+    response is delayed by `latency` (a distribution, or one per route of
+    `ROUTES`), `throttle_rate` of the requests answer 429 with `Retry-After` and
+    `error_rate` answer `error_status`. Draws come from a `seed`ed generator so
+    runs are reproducible. Deliveries progress through their statuses like
+    robocourier: every `step` seconds by default, or on the schedule of the
+    request `test_specifications`.
+
+    Point a client at it with `base_url=server.url`, and a
+    `uberpy.core.auth.TokenProvider` with `oauth_url=server.oauth_url`.
+    """
+
+    def __init__(
+        self,
+        *,
+        host: str | None = None,
+        port: int | None = None,
+        latency: Latency | Mapping[str, Latency] | None = None,
+        error_rate: float = 0.0,
+        error_status: int | None = None,
+        throttle_rate: float = 0.0,
+        retry_after: float | None = None,
+        step: float | None = None,
+        seed: int | None = None,
+    ) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._error_status = (
+            DEFAULT_ERROR_STATUS if error_status is None else error_status
+        )
+        self._throttle_rate = throttle_rate
+        self._retry_after = DEFAULT_RETRY_AFTER if retry_after is None else retry_after
+        self._step = DEFAULT_STEP if step is None else step
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._quotes: dict[str, dict[str, Any]] = {}
+        self._deliveries: dict[str, DeliveryRecord] = {}
+        self._idempotency_keys: dict[str, str] = {}
+        self._stats = ServerStats(
+            requests=0,
+            routes={},
+            throttled=0,
+            errors=0,
+            quotes=0,
+            deliveries=0,
+        )
+        self._host = DEFAULT_HOST if host is None else host
+        self._httpd = _HTTPServer(
+            (self._host, DEFAULT_PORT if port is None else port),
+            self,
+        )
+        self._thread: threading.Thread | None = None
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(self, *args: object) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        return f'http://{self._host}:{self._httpd.server_port}'
+
+    @property
+    def oauth_url(self) -> str:
+        return f'{self.url}/oauth'
+
+    def start(self) -> Self:
+        """
+        Serve from a background daemon thread.
+        """
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever,
+                name='uberpy-fake-server',
+                daemon=True,
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def stats(self) -> ServerStats:
+        with self._lock:
+            return ServerStats(
+                requests=self._stats['requests'],
+                routes={
+                    route: dict(statuses)
+                    for route, statuses in self._stats['routes'].items()
+                },
+                throttled=self._stats['throttled'],
+                errors=self._stats['errors'],
+                quotes=len(self._quotes),
+                deliveries=len(self._deliveries),
+            )
+
+    def handle(
+        self,
+        method: str,
+        target: str,
+        /,
+        body: bytes = b'',
+        headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        Answer a request, without the latency and fault injection when called
+        directly.
+        """
+        url = urlsplit(target)
+        query = {name: values[-1] for name, values in parse_qs(url.query).items()}
+
+        # token requests are form encoded, credentials are not checked
+        if method == 'POST' and url.path.rstrip('/') == '/oauth/v2/token':
+            return self._token()
+
+        match = API_PATH.match(url.path)
+        if match is None:
+            return error(404, 'not_found', f'unknown path {url.path}')
+        if not (headers or {}).get('Authorization', '').startswith('Bearer '):
+            return error(401, 'unauthorized', 'missing access token')
+
+        payload = json.loads(body) if body else {}
+        customer_id = match['customer_id']
+        segments = match['path'].strip('/').split('/')
+        now = datetime.now(timezone.utc)
+        with self._lock:
+            match method, segments:
+                case 'POST', ['delivery_quotes']:
+                    return self._create_quote(payload, now)
+                case 'POST', ['deliveries']:
+                    return self._create_delivery(customer_id, payload, now)
+                case 'GET', ['deliveries']:
+                    return self._list_deliveries(customer_id, query, now, target)
+                case 'GET', ['deliveries', delivery_id]:
+                    return self._get_delivery(customer_id, delivery_id, now)
+                case 'POST', ['deliveries', delivery_id]:
+                    return self._update_delivery(customer_id, delivery_id, payload, now)
+                case 'POST', ['deliveries', delivery_id, 'cancel']:
+                    return self._cancel_delivery(customer_id, delivery_id, now)
+                case 'POST', ['deliveries', delivery_id, 'proof-of-delivery']:
+                    return self._proof_of_delivery(
+                        customer_id, delivery_id, payload, now
+                    )
+        return error(404, 'not_found', f'unknown path {url.path}')
+
+    @staticmethod
+    def route(method: str, path: str, /) -> str:
+        """
+        Route name of a request, see `ROUTES`.
+        """
+        path = urlsplit(path).path.rstrip('/')
+        if path.endswith('/oauth/v2/token'):
+            return 'token'
+        if path.endswith('/delivery_quotes'):
+            return 'create_quote'
+        if path.endswith('/cancel'):
+            return 'cancel_delivery'
+        if path.endswith('/proof-of-delivery'):
+            return 'proof_of_delivery'
+        if path.endswith('/deliveries'):
+            return 'create_delivery' if method == 'POST' else 'list_deliveries'
+        return 'update_delivery' if method == 'POST' else 'get_delivery'
+
+    def inject(self, route: str, /) -> tuple[float, Response | None]:
+        """
+        Draw the latency of a request and, maybe, an injected failure.
+        """
+        latency = self._latency
+        if isinstance(latency, Mapping):
+            latency = latency.get(route)
+        with self._lock:
+            delay = 0.0 if latency is None else max(latency(self._rng), 0.0)
+            if route != 'token' and self._rng.random() < self._throttle_rate:
+                self._stats['throttled'] += 1
+                status, headers, body = error(429, 'rate_limit_exceeded', 'slow down')
+                headers['Retry-After'] = f'{self._retry_after:g}'
+                return delay, (status, headers, body)
+            if route != 'token' and self._rng.random() < self._error_rate:
+                self._stats['errors'] += 1
+                return delay, error(
+                    self._error_status,
+                    'service_unavailable',
+                    'injected error',
+                )
+        return delay, None
+
+    def record(self, route: str, status: int, /) -> None:
+        with self._lock:
+            self._stats['requests'] += 1
+            statuses = self._stats['routes'].setdefault(route, {})
+            statuses[status] = statuses.get(status, 0) + 1
+
+    def _token(self) -> Response:
+        return (
+            200,
+            {},
+            {
+                'access_token': uuid4().hex,
+                'token_type': 'Bearer',
+                'expires_in': DEFAULT_EXPIRES_IN,
+                'scope': 'eats.deliveries',
+            },
+        )
+
+    def _create_quote(self, payload: dict[str, Any], now: datetime, /) -> Response:
+        if 'pickup_address' not in payload or 'dropoff_address' not in payload:
+            return error(400, 'invalid_params', 'missing addresses')
+        pickup_duration = self._rng.randrange(5, 20)
+        duration = pickup_duration + self._rng.randrange(10, 40)
+        quote: dict[str, Any] = {
+            'kind': 'delivery_quote',
+            'id': f'dqt_{uuid4().hex[:22]}',
+            'created': timestamp(now),
+            'expires': timestamp(now + timedelta(seconds=DEFAULT_QUOTE_TTL)),
+            'fee': self._rng.randrange(500, 1500),
+            'currency': 'usd',
+            'currency_type': 'USD',
+            'dropoff_eta': timestamp(now + timedelta(minutes=duration)),
+            'duration': duration,
+            'pickup_duration': pickup_duration,
+            'dropoff_deadline': timestamp(now + timedelta(minutes=duration + 30)),
+        }
+        self._quotes[quote['id']] = quote
+        return 200, {}, quote
+
+    def _create_delivery(
+        self,
+        customer_id: str,
+        payload: dict[str, Any],
+        now: datetime,
+        /,
+    ) -> Response:
+        # retried creations return the delivery created the first time
+        key = payload.get('idempotency_key')
+        if key is not None and key in self._idempotency_keys:
+            return self._get_delivery(customer_id, self._idempotency_keys[key], now)
+
+        quote = self._quotes.get(payload.get('quote_id', ''))
+        if quote is None:
+            return error(400, 'invalid_params', 'unknown or missing quote_id')
+
+        timeline = request_timeline(now, self._step, payload.get('test_specifications'))
+        delivery_uuid = uuid4().hex
+        delivery = {
+            'kind': 'delivery',
+            'id': f'del_{delivery_uuid[:22]}',
+            'uuid': delivery_uuid,
+            'quote_id': quote['id'],
+            'created': timestamp(now),
+            'updated': timestamp(now),
+            'currency': quote['currency'],
+            'fee': quote['fee'],
+            'deliverable_action': payload.get(
+                'deliverable_action',
+                constants.DeliveryDeliverableAction.DELIVERABLE_ACTION_MEET_AT_DOOR,
+            ),
+            'pickup_ready': timestamp(now),
+            'pickup_eta': timestamp(timeline['pickup_complete']),
+            'dropoff_eta': timestamp(timeline['delivered']),
+            'dropoff_deadline': quote['dropoff_deadline'],
+            'tracking_url': f'https://www.ubereats.com/orders/{delivery_uuid}',
+            'external_id': payload.get('external_id'),
+            'live_mode': False,
+            'courier': courier(self._rng),
+        }
+        self._deliveries[delivery['id']] = DeliveryRecord(
+            customer_id=customer_id,
+            delivery=delivery,
+            timeline=timeline,
+        )
+        if key is not None:
+            self._idempotency_keys[key] = delivery['id']
+        return 200, {}, self._render(self._deliveries[delivery['id']], now)
+
+    def _record(self, customer_id: str, delivery_id: str, /) -> DeliveryRecord | None:
+        record = self._deliveries.get(delivery_id)
+        if record is None or record['customer_id'] != customer_id:
+            return None
+        return record
+
+    def _render(self, record: DeliveryRecord, now: datetime, /) -> dict[str, Any]:
+        if 'canceled' in record:
+            status, imminent = constants.DeliveryStatus.CANCELED, False
+        else:
+            status, imminent = delivery_status(record['timeline'], now)
+        delivery = {
+            **record['delivery'],
+            'status': status,
+            'complete': status in COMPLETE_STATUSES,
+            'courier_imminent': imminent,
+        }
+        if status == constants.DeliveryStatus.PENDING:
+            delivery['courier'] = None
+        return delivery
+
+    def _get_delivery(
+        self, customer_id: str, delivery_id: str, now: datetime, /
+    ) -> Response:
+        record = self._record(customer_id, delivery_id)
+        if record is None:
+            return error(404, 'delivery_not_found', 'delivery not found')
+        return 200, {}, self._render(record, now)
+
+    def _list_deliveries(
+        self,
+        customer_id: str,
+        query: dict[str, str],
+        now: datetime,
+        target: str,
+        /,
+    ) -> Response:
+        limit = int(query.get('limit', DEFAULT_PAGE_SIZE))
+        offset = int(query.get('offset', 0))
+        status = query.get('filter')
+        deliveries = [
+            self._render(record, now)
+            for record in self._deliveries.values()
+            if record['customer_id'] == customer_id
+        ]
+        if status == 'ongoing':
+            deliveries = [
+                delivery for delivery in deliveries if not delivery['complete']
+            ]
+        elif status is not None:
+            deliveries = [
+                delivery for delivery in deliveries if delivery['status'] == status
+            ]
+        page = deliveries[offset : offset + limit]
+        next_href = None
+        if offset + limit < len(deliveries):
+            path = urlsplit(target).path
+            next_href = f'{path}?limit={limit}&offset={offset + limit}'
+            if status is not None:
+                next_href += f'&filter={status}'
+        return (
+            200,
+            {},
+            {
+                'object': 'list',
+                'url': urlsplit(target).path,
+                'data': page,
+                'next_href': next_href,
+                'total_count': len(deliveries),
+            },
+        )
+
+    def _update_delivery(
+        self,
+        customer_id: str,
+        delivery_id: str,
+        payload: dict[str, Any],
+        now: datetime,
+        /,
+    ) -> Response:
+        record = self._record(customer_id, delivery_id)
+        if record is None:
+            return error(404, 'delivery_not_found', 'delivery not found')
+        if self._render(record, now)['complete']:
+            return error(400, 'invalid_params', 'delivery is complete')
+        record['delivery'].update(
+            {
+                name: value
+                for name, value in payload.items()
+                if name in ('dropoff_notes', 'pickup_notes', 'tip')
+            },
+            updated=timestamp(now),
+        )
+        return 200, {}, self._render(record, now)
+
+    def _cancel_delivery(
+        self, customer_id: str, delivery_id: str, now: datetime, /
+    ) -> Response:
+        record = self._record(customer_id, delivery_id)
+        if record is None:
+            return error(404, 'delivery_not_found', 'delivery not found')
+        delivery = self._render(record, now)
+        if delivery['complete']:
+            return error(400, 'noncancelable_delivery', 'delivery is complete')
+        if delivery['status'] not in (
+            constants.DeliveryStatus.PENDING,
+            constants.DeliveryStatus.PICKUP,
+        ):
+            return error(400, 'noncancelable_delivery', 'delivery was picked up')
+        record['canceled'] = now
+        return 200, {}, self._render(record, now)
+
+    def _proof_of_delivery(
+        self,
+        customer_id: str,
+        delivery_id: str,
+        payload: dict[str, Any],
+        now: datetime,
+        /,
+    ) -> Response:
+        record = self._record(customer_id, delivery_id)
+        if record is None:
+            return error(404, 'delivery_not_found', 'delivery not found')
+        status = self._render(record, now)['status']
+        reached = (
+            status in COMPLETE_STATUSES
+            if payload.get('waypoint') == constants.ProofOfDeliveryWaypoint.DROPOFF
+            else status
+            not in (constants.DeliveryStatus.PENDING, constants.DeliveryStatus.PICKUP)
+        )
+        if not reached:
+            return error(404, 'proof_of_delivery_not_found', 'waypoint not reached')
+        return 200, {}, {'document': base64.b64encode(DOCUMENT).decode()}
+
+
+class _HTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address: tuple[str, int], fake: FakeServer, /) -> None:
+        super().__init__(address, _Handler)
+        self.fake = fake
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    server: _HTTPServer
+
+    def setup(self) -> None:
+        super().setup()
+        # headers and body are written separately, avoid delayed ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self) -> None:
+        self._serve('GET')
+
+    def do_POST(self) -> None:
+        self._serve('POST')
+
+    def do_HEAD(self) -> None:
+        self.send_response(204)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def _serve(self, method: str, /) -> None:
+        fake = self.server.fake
+        body = self.rfile.read(int(self.headers.get('Content-Length') or 0))
+        route = fake.route(method, self.path)
+        delay, response = fake.inject(route)
+        if delay:
+            sleep(delay)
+        if response is None:
+            try:
+                response = fake.handle(method, self.path, body, dict(self.headers))
+            except (ValueError, KeyError) as e:
+                response = error(400, 'invalid_params', str(e))
+        status, headers, payload = response
+        fake.record(route, status)
+
+        content = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(content)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog='python -m uberpy.testing.server',
+        description='Local stand-in Uber Direct API server.',
+    )
+    parser.add_argument('--host', default=DEFAULT_HOST)
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument(
+        '--latency',
+        type=parse_latency,
+        help='constant:<s>, uniform:<low>:<high> or lognormal:<median>:<sigma>',
+    )
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--error-status', type=int, default=DEFAULT_ERROR_STATUS)
+    parser.add_argument('--throttle-rate', type=float, default=0.0)
+    parser.add_argument('--retry-after', type=float, default=DEFAULT_RETRY_AFTER)
+    parser.add_argument(
+        '--step',
+        type=float,
+        default=DEFAULT_STEP,
+        help='seconds per delivery status',
+    )
+    parser.add_argument('--seed', type=int)
+    args = parser.parse_args(argv)
+
+    server = FakeServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        throttle_rate=args.throttle_rate,
+        retry_after=args.retry_after,
+        step=args.step,
+        seed=args.seed,
+    )
+    print(f'serving on {server.url}', flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
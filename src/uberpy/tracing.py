@@ -0,0 +1,136 @@
+from opentelemetry import context, trace
+from opentelemetry.trace import Span, Status, StatusCode, Tracer
+
+from uberpy.core.instrumentation import AttemptInfo, CallInfo, Instrumentation
+
+TRACER_NAME = 'uberpy'
+
+
+def _end(span: Span, end_time: int, /, error: Exception | None = None) -> None:
+    if error is not None:
+        span.record_exception(error, timestamp=end_time)
+        span.set_status(Status(StatusCode.ERROR, str(error)))
+    span.end(end_time=end_time)
+
+
+class TracingInstrumentation(Instrumentation):
+    """
+    OpenTelemetry spans for every API call.
+
+    Each call opens a `uberpy <method> <endpoint>` span with a child span per
+    attempt, which in turn holds the `access_token`, `serialize`, `http` and
+    `backoff` spans, and a `validate` span. Spans are emitted once the call ends
+    from the recorded timestamps, so the retry loop runs no tracing code and
+    nothing is built when the tracer is not recording.
+
+    Combine it with metrics through
+    `uberpy.core.instrumentation.CompositeInstrumentation`.
+    """
+
+    def __init__(self, *, tracer: Tracer | None = None) -> None:
+        self._tracer = tracer
+
+    @property
+    def tracer(self) -> Tracer:
+        return self._tracer or trace.get_tracer(TRACER_NAME)
+
+    def before_request(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        # parent the spans to the context active when the call started
+        if attempt['attempt'] == 0:
+            call.setdefault('attributes', {})['otel.context'] = context.get_current()
+
+    def on_success(self, call: CallInfo, /) -> None:
+        self._emit(call)
+
+    def on_giveup(self, call: CallInfo, /) -> None:
+        self._emit(call)
+
+    def _emit(self, call: CallInfo, /) -> None:
+        tracer = self.tracer
+        span = tracer.start_span(
+            f'uberpy {call["method"]} {call["endpoint"]}',
+            context=call.get('attributes', {}).get('otel.context'),
+            start_time=call['start_time'],
+        )
+        if not span.is_recording():
+            span.end(end_time=call['end_time'])
+            return
+
+        span.set_attributes(self._call_attributes(call))
+        parent = trace.set_span_in_context(span)
+        for attempt in call['attempts']:
+            self._emit_attempt(tracer, parent, attempt)
+        if call['error'] is None:
+            tracer.start_span(
+                'validate',
+                context=parent,
+                start_time=call['end_time'] - int(call['validation_duration'] * 1e9),
+            ).end(end_time=call['end_time'])
+        _end(span, call['end_time'], call['error'])
+
+    def _emit_attempt(
+        self,
+        tracer: Tracer,
+        parent: context.Context,
+        attempt: AttemptInfo,
+        /,
+    ) -> None:
+        attributes: dict = {'uberpy.attempt': attempt['attempt']}
+        if attempt['status_code'] is not None:
+            attributes['http.response.status_code'] = attempt['status_code']
+        if attempt['retry_after'] is not None:
+            attributes['uberpy.retry_after'] = attempt['retry_after']
+        span = tracer.start_span(
+            'attempt',
+            context=parent,
+            start_time=attempt['start_time'],
+            attributes=attributes,
+        )
+        spans = trace.set_span_in_context(span)
+
+        start = attempt['start_time']
+        for name, duration in (
+            ('access_token', attempt['token_duration']),
+            ('serialize', attempt['serialization_duration']),
+        ):
+            end = start + int(duration * 1e9)
+            tracer.start_span(name, context=spans, start_time=start).end(end_time=end)
+            start = end
+        http = tracer.start_span(
+            'http',
+            context=spans,
+            kind=trace.SpanKind.CLIENT,
+            start_time=start,
+        )
+        http.set_attributes(attributes)
+        http.set_attribute('http.response.body.size', attempt['response_size'])
+        _end(http, attempt['end_time'], attempt['error'])
+        _end(span, attempt['end_time'], attempt['error'])
+
+        # backoff sleeps follow the attempt
+        if attempt['backoff']:
+            tracer.start_span(
+                'backoff',
+                context=parent,
+                start_time=attempt['end_time'],
+                attributes={'uberpy.backoff': attempt['backoff']},
+            ).end(end_time=attempt['end_time'] + int(attempt['backoff'] * 1e9))
+
+    @staticmethod
+    def _call_attributes(call: CallInfo, /) -> dict:
+        attributes: dict = {
+            'http.request.method': call['method'],
+            'uberpy.endpoint': call['endpoint'],
+            'uberpy.attempts': len(call['attempts']),
+        }
+        path, result = call['path'], call['result']
+        if call['endpoint'] == 'deliveries':
+            delivery_id = path[1] if len(path) > 1 else getattr(result, 'id', None)
+            if delivery_id is not None:
+                attributes['uberpy.delivery_id'] = delivery_id
+            quote_id = getattr(result, 'quote_id', None)
+        else:
+            quote_id = getattr(result, 'id', None)
+        if isinstance(quote_id, str):
+            attributes['uberpy.quote_id'] = quote_id
+        return attributes
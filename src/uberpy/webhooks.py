@@ -0,0 +1,233 @@
+import hashlib
+import hmac
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from itertools import count
+from typing import Callable, Mapping, Self
+
+from uberpy import constants, exceptions, models
+
+DEFAULT_MAX_SEEN = 10_000
+
+logger = logging.getLogger(__name__)
+
+SIGNATURE_HEADERS = (
+    'x-uber-signature',
+    'x-postmates-signature',
+)
+
+type WebhookHandler = Callable[[models.WebhookEvent], None]
+
+
+def compute_signature(body: bytes, signing_key: str | bytes, /) -> str:
+    """
+    Hex encoded HMAC-SHA256 of the raw request body.
+    """
+    if isinstance(signing_key, str):
+        signing_key = signing_key.encode()
+    return hmac.new(signing_key, body, hashlib.sha256).hexdigest()
+
+
+def verify_signature(
+    body: bytes,
+    signature: str | None,
+    signing_key: str | bytes,
+    /,
+) -> bool:
+    """
+    Constant time comparison of `signature` against the expected one.
+    """
+    if not signature:
+        return False
+    # bytes, comparing non ASCII strings raises
+    return hmac.compare_digest(
+        compute_signature(body, signing_key).encode(),
+        signature.strip().lower().encode(),
+    )
+
+
+def signature_from_headers(headers: Mapping[str, str], /) -> str | None:
+    """
+    Signature header of a request, regardless of the header names case.
+    """
+    for name in SIGNATURE_HEADERS:
+        signature = headers.get(name)
+        if signature is not None:
+            return signature
+    lowered = {name.lower(): value for name, value in headers.items()}
+    for name in SIGNATURE_HEADERS:
+        signature = lowered.get(name)
+        if signature is not None:
+            return signature
+    return None
+
+
+class SeenSet:
+    """
+    Thread-safe bounded set of recently seen keys, oldest keys are forgotten first.
+    """
+
+    def __init__(self, *, max_size: int | None = None) -> None:
+        self._max_size = DEFAULT_MAX_SEEN if max_size is None else max_size
+        self._lock = threading.Lock()
+        self._keys: OrderedDict[str, None] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._keys
+
+    def add(self, key: str, /) -> bool:
+        """
+        Add `key`, returns `False` if it was already seen.
+        """
+        with self._lock:
+            if key in self._keys:
+                self._keys.move_to_end(key)
+                return False
+            self._keys[key] = None
+            while len(self._keys) > self._max_size:
+                self._keys.popitem(last=False)
+            return True
+
+    def discard(self, key: str, /) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+
+
+class WebhookReceiver:
+    """
+    Framework agnostic webhook receiver.
+
+    Feed `handle` the raw request body and headers: the signature is verified
+    against `signing_key`, the payload is parsed into `models.WebhookEvent` and
+    dispatched to the handlers registered with `on`, inline or in a pool of
+    `max_workers` threads so the HTTP response is not held by slow handlers.
+
+    Redeliveries are deduplicated per handler: a handler that completed, or is
+    still running, for an event is not run again, one that raised runs again on
+    the next delivery. Inline handler exceptions propagate, so the error response
+    triggers that redelivery, pool handler exceptions are logged. `max_seen`
+    bounds the remembered events and handler runs.
+    """
+
+    def __init__(
+        self,
+        signing_key: str | bytes,
+        /,
+        *,
+        max_seen: int | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        self._signing_key = signing_key
+        self._seen = SeenSet(max_size=max_seen)
+        # handlers are numbered to track their runs of each event
+        self._handlers: dict[str | None, list[tuple[int, WebhookHandler]]] = {}
+        self._numbers = count()
+        self._executor = (
+            None if max_workers is None else ThreadPoolExecutor(max_workers=max_workers)
+        )
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def on(
+        self,
+        kind: constants.WebhookEventKind | str | None = None,
+        /,
+    ) -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Decorator registering a handler of `kind` events, or of every event.
+        """
+
+        def register(handler: WebhookHandler) -> WebhookHandler:
+            self._handlers.setdefault(kind, []).append((next(self._numbers), handler))
+            return handler
+
+        return register
+
+    def handle(
+        self,
+        body: bytes,
+        /,
+        headers: Mapping[str, str],
+    ) -> models.WebhookEvent | None:
+        """
+        Verify, parse and dispatch a webhook request.
+
+        Returns the event, or `None` for redeliveries. Raises
+        `exceptions.InvalidSignature` for requests that must be rejected.
+        """
+        if not verify_signature(
+            body,
+            signature_from_headers(headers),
+            self._signing_key,
+        ):
+            raise exceptions.InvalidSignature('invalid webhook signature')
+
+        event = models.WebhookEvent.model_validate_json(body)
+        new = self._seen.add(event.id)
+        pending: list[tuple[str, WebhookHandler]] = []
+        for number, handler in (
+            *self._handlers.get(event.kind, ()),
+            *self._handlers.get(None, ()),
+        ):
+            key = f'{event.id}:{number}'
+            if self._seen.add(key):
+                pending.append((key, handler))
+        if not new and not pending:
+            return None
+
+        for index, (key, handler) in enumerate(pending):
+            try:
+                self._dispatch(key, handler, event)
+            except BaseException:
+                # the failed handler and the ones not run yet run on redelivery
+                for unfinished, _ in pending[index:]:
+                    self._seen.discard(unfinished)
+                raise
+        return event
+
+    def _dispatch(
+        self,
+        key: str,
+        handler: WebhookHandler,
+        event: models.WebhookEvent,
+        /,
+    ) -> None:
+        if self._executor is None:
+            handler(event)
+        else:
+            self._executor.submit(handler, event).add_done_callback(
+                partial(self._done, key, event)
+            )
+
+    def _done(
+        self,
+        key: str,
+        event: models.WebhookEvent,
+        future: Future[None],
+        /,
+    ) -> None:
+        if future.cancelled() or future.exception() is None:
+            return
+        self._seen.discard(key)
+        logger.error(
+            'webhook handler failed for event %s',
+            event.id,
+            exc_info=future.exception(),
+        )
+
+    def close(self) -> None:
+        """
+        Wait for the dispatched handlers to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
@@ -0,0 +1,93 @@
+import json
+import threading
+from typing import Any, Callable
+
+import requests
+
+from uberpy import models
+
+ADDRESS: dict = {
+    'street_address': ('Street 1',),
+    'city': 'CDMX',
+    'state': 'VZ',
+    'country': 'MX',
+    'zip_code': '99999',
+}
+
+QUOTE: dict = {
+    'id': 'dqt_1',
+    'kind': 'delivery_quote',
+    'created': '2025-01-01T00:00:00Z',
+    'expires': '2025-01-01T00:15:00Z',
+    'fee': 1099,
+    'currency_type': 'MXN',
+    'dropoff_eta': '2025-01-01T00:45:00Z',
+    'duration': 45,
+    'pickup_duration': 10,
+    'dropoff_deadline': '2025-01-01T01:00:00Z',
+}
+
+DELIVERY: dict = {
+    'id': 'del_1',
+    'quote_id': 'dqt_1',
+    'status': 'pending',
+    'complete': False,
+    'courier_imminent': False,
+    'created': '2025-01-01T00:00:00Z',
+    'currency': 'mxn',
+    'deliverable_action': 'deliverable_action_meet_at_door',
+    'dropoff_eta': '2025-01-01T00:45:00Z',
+    'fee': 1099,
+    'pickup_eta': '2025-01-01T00:10:00Z',
+    'pickup_ready': '2025-01-01T00:00:00Z',
+    'uuid': '6e5b1f7c2a3d4e5f8a9b0c1d2e3f4a5b',
+    'tracking_url': 'https://www.ubereats.com/orders/1',
+}
+
+
+def response(
+    status_code: int = 200,
+    body: Any = None,
+    headers: dict | None = None,
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = 'https://api.uber.com'
+    response.reason = 'Fake'
+    response.headers.update(headers or {})
+    response._content = b'' if body is None else json.dumps(body).encode()
+    return response
+
+
+class FakeSession(requests.Session):
+    """
+    Session answering every request with `handler`, recording calls.
+    """
+
+    def __init__(self, handler: Callable[..., requests.Response]) -> None:
+        super().__init__()
+        self.calls: list[dict] = []
+        self._handler = handler
+        self._lock = threading.Lock()
+
+    def request(self, method, url, **kwargs):  # type: ignore[override]
+        with self._lock:
+            self.calls.append({'method': method, 'url': url, **kwargs})
+        return self._handler(method=method, url=url, **kwargs)
+
+
+def delivery_request(**fields: Any) -> models.DeliveryCreateRequest:
+    return models.DeliveryCreateRequest.model_validate(
+        {
+            'pickup_name': 'Store',
+            'pickup_address': ADDRESS,
+            'pickup_phone_number': '+525555555555',
+            'dropoff_name': 'Customer',
+            'dropoff_address': ADDRESS,
+            'dropoff_phone_number': '+525555555556',
+            'manifest_items': [{'name': 'Item', 'quantity': 1}],
+            'manifest_total_value': 1099,
+            'quote_id': 'dqt_1',
+            **fields,
+        }
+    )
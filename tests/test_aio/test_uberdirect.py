@@ -0,0 +1,262 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from tests.helpers import ADDRESS, DELIVERY, QUOTE
+from uberpy import exceptions, models
+from uberpy.aio import AsyncUberDirect
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import MetricsInstrumentation
+
+
+def test_create_quote():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) == 1:
+            return httpx.Response(503, headers={'Retry-After': '0'})
+        return httpx.Response(200, json=QUOTE)
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            lambda: 'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.quotes.create_quote(
+                request=models.QuoteCreateRequest(
+                    pickup_address=ADDRESS,
+                    pickup_phone_number='+525555555555',
+                    dropoff_address=ADDRESS,
+                ),
+            )
+
+    quote = asyncio.run(main())
+
+    assert quote.id == 'dqt_1'
+    assert len(calls) == 2
+    assert calls[-1].url.path == '/v1/customers/customer/delivery_quotes'
+    assert calls[-1].headers['Authorization'] == 'Bearer token'
+    assert json.loads(calls[-1].content)['pickup_phone_number'] == '+525555555555'
+
+
+def test_invalidate_stale_token():
+    class Tokens:
+        def __init__(self) -> None:
+            self.token = 'token-1'
+
+        def __call__(self) -> str:
+            return self.token
+
+        def invalidate(self, stale: str, /) -> str:
+            self.token = 'token-2'
+            return self.token
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers['Authorization'] == 'Bearer token-1':
+            return httpx.Response(401)
+        return httpx.Response(200, json=QUOTE)
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            Tokens(),
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.quotes.create_quote(
+                request=models.QuoteCreateRequest(
+                    pickup_address=ADDRESS,
+                    pickup_phone_number='+525555555555',
+                    dropoff_address=ADDRESS,
+                ),
+            )
+
+    assert asyncio.run(main()).id == 'dqt_1'
+
+
+def test_async_access_token():
+    async def access_token() -> str:
+        return 'async-token'
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers['Authorization'] == 'Bearer async-token'
+        return httpx.Response(200, json=QUOTE)
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            access_token,
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.quotes.create_quote(
+                request=models.QuoteCreateRequest(
+                    pickup_address=ADDRESS,
+                    pickup_phone_number='+525555555555',
+                    dropoff_address=ADDRESS,
+                ),
+            )
+
+    assert asyncio.run(main()).id == 'dqt_1'
+
+
+def test_create_quotes():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        store = json.loads(request.content)['external_store_id']
+        if store == 'slow':
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={**QUOTE, 'id': f'dqt_{store}'})
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return await client.quotes.create_quotes(
+                requests=[
+                    models.QuoteCreateRequest(
+                        pickup_address=ADDRESS,
+                        pickup_phone_number='+525555555555',
+                        dropoff_address=ADDRESS,
+                        external_store_id=store,
+                    )
+                    for store in ['slow', 'a']
+                ],
+                accept=lambda quote: True,
+            )
+
+    results = asyncio.run(main())
+
+    assert results[0] is None
+    assert isinstance(results[1], models.QuoteCreateResponse)
+
+
+def test_list_deliveries():
+    def handler(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params['offset'])
+        return httpx.Response(
+            200,
+            json={
+                'data': [{**DELIVERY, 'id': f'del_{offset}'}] if offset < 3 else [],
+                'next_href': 'next',
+            },
+        )
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        ) as client:
+            return [
+                delivery.id
+                async for delivery in client.deliveries.list_deliveries(page_size=1)
+            ]
+
+    assert asyncio.run(main()) == ['del_0', 'del_1', 'del_2']
+
+
+def test_instrumentation():
+    metrics = MetricsInstrumentation()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json=DELIVERY)
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            instrumentation=metrics,
+        ) as client:
+            await client.deliveries.get_delivery('del_1')
+
+    asyncio.run(main())
+
+    snapshot = metrics.snapshot()['GET deliveries']
+    assert snapshot['calls'] == 1
+    assert snapshot['status_codes'] == {200: 1}
+
+
+def test_deadline():
+    timeouts = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        timeouts.append(request.extensions['timeout'])
+        return httpx.Response(503, headers={'Retry-After': '60'})
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            deadline=1,
+        ) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await client.deliveries.get_delivery('del_1')
+            with pytest.raises(exceptions.DeadlineExceeded):
+                await client.deliveries.get_delivery('del_1', deadline=0)
+            # the batch deadline bounds every quote
+            return await client.quotes.create_quotes(
+                requests=[
+                    models.QuoteCreateRequest(
+                        pickup_address=ADDRESS,
+                        pickup_phone_number='+525555555555',
+                        dropoff_address=ADDRESS,
+                    )
+                ],
+                deadline=0.5,
+            )
+
+    [result] = asyncio.run(main())
+
+    assert isinstance(result, httpx.HTTPStatusError)
+    assert len(timeouts) == 2
+    assert all(0 < timeout <= 1 for timeout in timeouts[0].values())
+    assert all(0 < timeout <= 0.5 for timeout in timeouts[1].values())
+
+
+def test_hedging():
+    cancelled = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        try:
+            # the first request hangs, the hedge answers
+            if not cancelled:
+                cancelled.append(False)
+                await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled[0] = True
+            raise
+        return httpx.Response(200, json=DELIVERY)
+
+    hedging = Hedging(min_samples=1)
+    hedging.record('GET deliveries', 0.01)
+
+    async def main():
+        async with AsyncUberDirect(
+            'customer',
+            'token',
+            version='v1',
+            client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+            hedging=hedging,
+        ) as client:
+            delivery = await client.deliveries.get_delivery('del_1')
+            await asyncio.sleep(0)
+            return delivery
+
+    delivery = asyncio.run(main())
+
+    assert delivery.id == 'del_1'
+    assert cancelled == [True]
+    assert hedging.snapshot()['GET deliveries']['wins'] == 1
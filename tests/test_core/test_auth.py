@@ -0,0 +1,104 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.helpers import ADDRESS, QUOTE, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core.auth import TokenProvider
+
+
+def token_session(expires_in: int = 3600) -> FakeSession:
+    tokens = 0
+
+    def handler(*, url, headers=None, **kwargs):
+        nonlocal tokens
+        if url.endswith('/token'):
+            tokens += 1
+            time.sleep(0.05)
+            return response(
+                200, {'access_token': f'token-{tokens}', 'expires_in': expires_in}
+            )
+        # the first token is revoked
+        if headers['Authorization'] == 'Bearer token-1':
+            return response(401)
+        return response(200, QUOTE)
+
+    return FakeSession(handler)
+
+
+def test_token_provider():
+    provider = TokenProvider(
+        client_id='client',
+        client_secret='secret',
+        session=token_session(),
+    )
+
+    # concurrent callers share a single fetch
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(lambda _: provider(), range(8)))
+    assert tokens == ['token-1'] * 8
+    assert provider.refreshes == 1
+
+    # invalidating a stale token refreshes once
+    assert provider.invalidate('token-1') == 'token-2'
+    assert provider.invalidate('token-1') == 'token-2'
+    assert provider.refreshes == 2
+
+    provider.close()
+
+
+def test_token_provider_background_refresh():
+    provider = TokenProvider(
+        client_id='client',
+        client_secret='secret',
+        refresh_margin=0.9,
+        session=token_session(expires_in=1),
+    )
+
+    assert provider() == 'token-1'
+    time.sleep(0.7)
+    assert provider() == 'token-2'
+
+    provider.close()
+
+
+def test_token_provider_fresh():
+    provider = TokenProvider(
+        client_id='client',
+        client_secret='secret',
+        background_refresh=False,
+        session=token_session(expires_in=1),
+    )
+
+    assert not provider.fresh
+    assert provider() == 'token-1'
+    assert provider.fresh
+    # past the refresh margin a call fetches a token even though it has not expired
+    time.sleep(0.6)
+    assert not provider.fresh
+    assert provider() == 'token-2'
+
+
+def test_unauthorized_refreshes_token():
+    session = token_session()
+    provider = TokenProvider(
+        client_id='client',
+        client_secret='secret',
+        session=session,
+    )
+    client = UberDirect('customer', provider, version='v1', session=session)
+
+    started = time.monotonic()
+    quote = client.quotes.create_quote(
+        request=models.QuoteCreateRequest(
+            pickup_address=ADDRESS,
+            pickup_phone_number='+525555555555',
+            dropoff_address=ADDRESS,
+        ),
+    )
+
+    assert quote.id == 'dqt_1'
+    assert provider.refreshes == 2
+    # no backoff after refreshing the token
+    assert time.monotonic() - started < 0.5
+
+    provider.close()
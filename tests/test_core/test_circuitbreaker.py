@@ -0,0 +1,138 @@
+import pytest
+import requests
+
+from tests.helpers import DELIVERY, FakeSession, response
+from uberpy import UberDirect, exceptions
+from uberpy.core.circuitbreaker import Circuit, CircuitBreaker
+from uberpy.core.ratelimit import RateLimiter
+
+
+def test_circuit():
+    circuit = Circuit(
+        failure_rate=0.5,
+        min_calls=4,
+        window_size=4,
+        open_duration=10,
+        half_open_probes=1,
+    )
+
+    for failure in (True, False, False, False):
+        assert circuit.acquire(0)
+        circuit.record(0, failure=failure)
+    assert circuit.state(0) == 'closed'
+
+    # the oldest failure slides out of the window
+    circuit.record(1, failure=True)
+    assert circuit.current_failure_rate() == 0.25
+    circuit.record(2, failure=True)
+    assert circuit.current_failure_rate() == 0.5
+    assert circuit.state(2) == 'open'
+    assert not circuit.acquire(5)
+    assert circuit.retry_after(5) == 7
+
+    # a single probe, failing reopens the circuit
+    assert circuit.acquire(12)
+    assert not circuit.acquire(12)
+    circuit.record(12, failure=True)
+    assert circuit.state(13) == 'open'
+    assert circuit.opened == 2
+
+    # released probes let another request through
+    assert circuit.acquire(22)
+    circuit.release(22)
+    assert circuit.acquire(22)
+    circuit.record(22, failure=False)
+    assert circuit.state(22) == 'closed'
+    assert circuit.calls == 0
+
+
+def test_circuit_breaker():
+    calls = []
+
+    def request(**kwargs):
+        calls.append(kwargs['url'])
+        return response(503, headers={'Retry-After': '0'})
+
+    breaker = CircuitBreaker(min_calls=2, window_size=2)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(request),
+        max_retries=5,
+        jitter_max=0,
+        circuit_breaker=breaker,
+    )
+
+    with pytest.raises(exceptions.CircuitOpenError) as info:
+        client.deliveries.get_delivery('del_1')
+    # fails fast instead of retrying
+    assert len(calls) == 2
+    assert 0 < info.value.retry_after <= 30
+
+    with pytest.raises(exceptions.CircuitOpenError):
+        client.deliveries.get_delivery('del_1')
+    assert len(calls) == 2
+
+    snapshot = breaker.snapshot()
+    assert snapshot['customer deliveries']['state'] == 'open'
+
+
+def test_circuit_breaker_client_errors():
+    responses = iter([response(404), response(200, DELIVERY)] * 2)
+    breaker = CircuitBreaker(min_calls=2, window_size=2)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(lambda **kwargs: next(responses)),
+        circuit_breaker=breaker,
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.HTTPError):
+            client.deliveries.get_delivery('del_1')
+        client.deliveries.get_delivery('del_1')
+    assert breaker.state('customer', 'deliveries') == 'closed'
+
+
+def test_circuit_breaker_before_rate_limiter():
+    breaker = CircuitBreaker(min_calls=2, window_size=2)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(
+            lambda **kwargs: response(503, headers={'Retry-After': '0'})
+        ),
+        max_retries=5,
+        jitter_max=0,
+        circuit_breaker=breaker,
+        rate_limiter=RateLimiter(rate=0.001, burst=2, policy='fail'),
+    )
+
+    # the open circuit fails fast without waiting for a rate limit slot
+    with pytest.raises(exceptions.CircuitOpenError):
+        client.deliveries.get_delivery('del_1')
+
+
+def test_circuit_breaker_unclassified_errors():
+    def request(**kwargs):
+        raise ValueError('unexpected')
+
+    breaker = CircuitBreaker(min_calls=1, window_size=1, open_duration=0)
+    breaker.acquire('customer', 'deliveries')
+    breaker.record('customer', 'deliveries', failure=True)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(request),
+        circuit_breaker=breaker,
+    )
+
+    # the probe is released without closing the circuit
+    for _ in range(2):
+        with pytest.raises(ValueError):
+            client.deliveries.get_delivery('del_1')
+    assert breaker.state('customer', 'deliveries') == 'half_open'
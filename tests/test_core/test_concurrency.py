@@ -0,0 +1,117 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+from typing import Iterator
+
+import pytest
+import requests
+
+from tests.helpers import ADDRESS
+from uberpy import UberDirect, models
+from uberpy.core.auth import TokenProvider
+from uberpy.core.instrumentation import MetricsInstrumentation
+from uberpy.core.session import ThreadLocalSession
+from uberpy.testing import FakeServer, constant
+
+LATENCY = 0.02
+
+
+@pytest.fixture
+def server() -> Iterator[FakeServer]:
+    # slow token responses widen the window for concurrent refreshes
+    with FakeServer(
+        latency={'create_quote': constant(LATENCY), 'token': constant(0.05)},
+    ) as server:
+        yield server
+
+
+def quote_request(store: int) -> models.QuoteCreateRequest:
+    return models.QuoteCreateRequest(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        dropoff_address=ADDRESS,
+        external_store_id=str(store),
+    )
+
+
+def create_quotes(client: UberDirect, count: int, threads: int) -> list[str]:
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        return list(
+            executor.map(
+                lambda store: (
+                    client.quotes.create_quote(
+                        request=quote_request(store),
+                    ).id
+                ),
+                range(count),
+            )
+        )
+
+
+def test_thread_local_session():
+    session = ThreadLocalSession(requests.Session)
+    sessions = set()
+
+    def use(_: int) -> None:
+        sessions.add(id(session.session))
+        assert session.session is session.session
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        barrier = threading.Barrier(4)
+        list(executor.map(lambda i: (barrier.wait(), use(i)), range(4)))
+
+    assert len(sessions) == 4
+    session.close()
+
+
+@pytest.mark.parametrize('session_strategy', ['shared', 'thread'])
+def test_shared_client(server: FakeServer, session_strategy):
+    metrics = MetricsInstrumentation()
+    token = TokenProvider(
+        client_id='id',
+        client_secret='secret',
+        oauth_url=server.oauth_url,
+        background_refresh=False,
+    )
+    client = UberDirect(
+        'customer',
+        token,
+        version='v1',
+        base_url=server.url,
+        session_strategy=session_strategy,
+        pool_maxsize=32,
+        instrumentation=metrics,
+    )
+
+    ids = create_quotes(client, 256, 32)
+
+    # every thread gets its own response, never another thread's
+    assert len(set(ids)) == 256
+    stats = server.stats()
+    assert stats['quotes'] == 256
+    assert token.refreshes == stats['routes']['token'][200] == 1
+    assert stats['routes']['create_quote'] == {200: 256}
+    assert metrics.snapshot()['POST delivery_quotes']['calls'] == 256
+
+
+@pytest.mark.timing
+def test_throughput_scaling(server: FakeServer):
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        base_url=server.url,
+        pool_maxsize=16,
+    )
+    create_quotes(client, 16, 16)
+
+    throughput = {}
+    for threads in (1, 4, 16):
+        started = perf_counter()
+        create_quotes(client, 48, threads)
+        throughput[threads] = 48 / (perf_counter() - started)
+
+    # requests are I/O bound, threads must overlap them. Bounds are loose, the
+    # ideal speedup is linear and uberpy-loadgen measures the actual one
+    assert throughput[4] > 1.5 * throughput[1]
+    assert throughput[16] > 1.5 * throughput[1]
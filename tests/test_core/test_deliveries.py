@@ -0,0 +1,114 @@
+import json
+import threading
+
+from tests.helpers import DELIVERY, FakeSession, delivery_request, response
+from uberpy import UberDirect, models
+
+
+def test_create_deliveries():
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def handler(*, json, **kwargs):
+        nonlocal in_flight, max_in_flight
+        with lock:
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+        try:
+            if json['manifest_reference'] == 'error':
+                return response(400, {'code': 'invalid_params'})
+            return response(
+                200, {**DELIVERY, 'id': f'del_{json["manifest_reference"]}'}
+            )
+        finally:
+            with lock:
+                in_flight -= 1
+
+    session = FakeSession(handler)
+    client = UberDirect('customer', 'token', version='v1', session=session)
+    references = [str(i) for i in range(20)] + ['error']
+
+    batch = client.deliveries.create_deliveries(
+        requests=(
+            delivery_request(manifest_reference=reference) for reference in references
+        ),
+        max_concurrency=4,
+    )
+    results = dict(
+        (request.manifest_reference, (request, result)) for request, result in batch
+    )
+
+    assert batch.summary == {'total': 21, 'succeeded': 20, 'failed': 1}
+    assert max_in_flight <= 4
+    assert isinstance(results['error'][1], Exception)
+    request, delivery = results['0']
+    assert isinstance(delivery, models.Delivery)
+    assert delivery.id == 'del_0'
+
+    # idempotency keys are filled in and sent
+    keys = {call['json']['idempotency_key'] for call in session.calls}
+    assert len(keys) == 21
+    assert request.idempotency_key in keys
+
+    # given idempotency keys are kept
+    batch = client.deliveries.create_deliveries(
+        requests=[delivery_request(manifest_reference='1', idempotency_key='key')],
+    )
+    assert [request.idempotency_key for request, _ in batch] == ['key']
+
+
+def test_response_modes():
+    session = FakeSession(lambda **kwargs: response(200, DELIVERY))
+    client = UberDirect('customer', 'token', version='v1', session=session)
+
+    delivery = client.deliveries.cancel_delivery('del_1')
+    assert isinstance(delivery, models.Delivery)
+
+    raw = client.deliveries.cancel_delivery('del_1', response_mode='raw')
+    assert json.loads(raw) == DELIVERY
+
+    lazy = client.deliveries.cancel_delivery('del_1', response_mode='lazy')
+    assert lazy.raw == raw
+    assert not lazy.validated
+    assert lazy.model == delivery
+    assert lazy.model is lazy.model
+
+    # without a model the decoded body is returned, bytes only in raw mode
+    assert client.deliveries._post({}, 'deliveries', 'del_1', 'cancel') == DELIVERY
+    raw = client.deliveries._post(
+        {}, 'deliveries', 'del_1', 'cancel', response_mode='raw'
+    )
+    assert json.loads(raw) == DELIVERY
+
+
+def test_list_deliveries():
+    def handler(*, method, url, params, **kwargs):
+        if not url.endswith('/deliveries'):
+            return response(200, {**DELIVERY, 'id': url.rsplit('/', 1)[-1]})
+        offset, limit = params['offset'], params['limit']
+        ids = range(offset, min(offset + limit, 5))
+        return response(
+            200,
+            {
+                'data': [{**DELIVERY, 'id': f'del_{i}'} for i in ids],
+                'next_href': 'next' if offset + limit < 5 else None,
+            },
+        )
+
+    session = FakeSession(handler)
+    client = UberDirect('customer', 'token', version='v1', session=session)
+
+    assert client.deliveries.get_delivery('del_9').id == 'del_9'
+
+    deliveries = client.deliveries.list_deliveries(filter='ongoing', page_size=2)
+    assert next(deliveries).id == 'del_0'
+    assert [delivery.id for delivery in deliveries] == [
+        'del_1',
+        'del_2',
+        'del_3',
+        'del_4',
+    ]
+    assert [call['params'] for call in session.calls[1:]] == [
+        {'limit': 2, 'offset': offset, 'filter': 'ongoing'} for offset in (0, 2, 4)
+    ]
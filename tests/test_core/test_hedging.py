@@ -0,0 +1,156 @@
+import threading
+
+from tests.helpers import ADDRESS, DELIVERY, QUOTE, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core.hedging import Hedging
+from uberpy.core.instrumentation import MetricsInstrumentation
+
+
+def test_hedging_policy():
+    hedging = Hedging(percentile=50, min_samples=4, max_ratio=0.5, max_burst=1)
+
+    assert hedging.delay('GET deliveries') is None
+    for latency in (0.4, 0.1, 0.3, 0.2):
+        hedging.record('GET deliveries', latency)
+    assert hedging.delay('GET deliveries') == 0.3
+
+    assert hedging.acquire('GET deliveries')
+    assert not hedging.acquire('GET deliveries')
+    hedging.delay('GET deliveries')
+    hedging.delay('GET deliveries')
+    assert hedging.acquire('GET deliveries')
+
+    assert hedging.snapshot()['GET deliveries'] == {
+        'calls': 4,
+        'hedged': 2,
+        'wins': 0,
+        'denied': 1,
+        'delay': 0.3,
+    }
+
+
+def test_hedged_quote():
+    released = threading.Event()
+    calls = iter(range(10))
+    threads = []
+
+    def request(**kwargs):
+        threads.append(threading.current_thread())
+        # the first request hangs until the call returned
+        if next(calls) == 0:
+            released.wait(5)
+        return response(200, QUOTE)
+
+    hedging = Hedging(min_samples=1)
+    hedging.record('POST delivery_quotes', 0.01)
+    session = FakeSession(request)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        hedging=hedging,
+    )
+
+    quote = client.quotes.create_quote(
+        request=models.QuoteCreateRequest(
+            pickup_address=ADDRESS,
+            pickup_phone_number='+525555555555',
+            dropoff_address=ADDRESS,
+        ),
+    )
+    released.set()
+    hedging.close()
+
+    assert quote.id == QUOTE['id']
+    assert len(session.calls) == 2
+    assert session.calls[0]['json'] == session.calls[1]['json']
+    snapshot = hedging.snapshot()['POST delivery_quotes']
+    assert snapshot['hedged'] == 1
+    assert snapshot['wins'] == 1
+    # primaries and hedges are sent from bounded pools of their own
+    assert threads[0].name.startswith('uberpy-primary')
+    assert threads[1].name.startswith('uberpy-hedging')
+
+
+def test_hedging_without_delay():
+    threads = []
+
+    def request(**kwargs):
+        threads.append(threading.current_thread())
+        return response(200, DELIVERY)
+
+    hedging = Hedging()
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(request),
+        hedging=hedging,
+    )
+    client.deliveries.get_delivery('del_1')
+
+    # no latency samples yet, the request is sent from the calling thread
+    assert threads == [threading.current_thread()]
+    assert hedging.snapshot()['GET deliveries']['calls'] == 1
+
+
+def test_hedging_records_winner():
+    released = threading.Event()
+    calls = iter(range(10))
+
+    def request(**kwargs):
+        call = next(calls)
+        # the primary fails once, then hangs until the call returned
+        if call == 0:
+            return response(503, headers={'Retry-After': '0'})
+        if call == 1:
+            released.wait(5)
+        return response(200, DELIVERY)
+
+    hedging = Hedging(min_samples=1)
+    hedging.record('GET deliveries', 0.01)
+    metrics = MetricsInstrumentation()
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(request),
+        hedging=hedging,
+        instrumentation=metrics,
+        jitter_max=0,
+    )
+
+    client.deliveries.get_delivery('del_1')
+    snapshot = metrics.snapshot()['GET deliveries']
+    released.set()
+    hedging.close()
+
+    # the losing primary's attempts are not recorded
+    assert snapshot['attempts'] == 1
+    assert snapshot['retries'] == 0
+    assert hedging.snapshot()['GET deliveries']['wins'] == 1
+
+
+def test_hedging_latency_excludes_retries():
+    calls = iter(range(10))
+
+    def request(**kwargs):
+        if next(calls) == 0:
+            return response(503, headers={'Retry-After': '0.3'})
+        return response(200, DELIVERY)
+
+    hedging = Hedging(min_samples=1)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(request),
+        hedging=hedging,
+    )
+    client.deliveries.get_delivery('del_1')
+
+    # a single successful attempt, the backoff is not part of the sample
+    delay = hedging.snapshot()['GET deliveries']['delay']
+    assert delay is not None
+    assert delay < 0.3
@@ -0,0 +1,111 @@
+import pytest
+import requests
+
+from tests.helpers import DELIVERY, FakeSession, response
+from uberpy import UberDirect
+from uberpy.core.instrumentation import (
+    AttemptInfo,
+    CallInfo,
+    Histogram,
+    Instrumentation,
+    MetricsInstrumentation,
+)
+
+
+class Recording(Instrumentation):
+    def __init__(self) -> None:
+        self.hooks: list[str] = []
+        self.calls: list[CallInfo] = []
+
+    def before_request(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        self.hooks.append(f'before_request:{attempt["attempt"]}')
+
+    def after_response(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        self.hooks.append(f'after_response:{attempt["status_code"]}')
+
+    def on_retry(self, call: CallInfo, attempt: AttemptInfo, /) -> None:
+        self.hooks.append(f'on_retry:{attempt["backoff"]}')
+
+    def on_success(self, call: CallInfo, /) -> None:
+        self.hooks.append('on_success')
+        self.calls.append(call)
+
+    def on_giveup(self, call: CallInfo, /) -> None:
+        self.hooks.append('on_giveup')
+        self.calls.append(call)
+
+
+def test_instrumentation_hooks():
+    responses = iter(
+        [
+            response(503, headers={'Retry-After': '0'}),
+            response(200, DELIVERY),
+            response(404, {'code': 'not_found'}),
+        ]
+    )
+    instrumentation = Recording()
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(lambda **kwargs: next(responses)),
+        instrumentation=instrumentation,
+    )
+
+    delivery = client.deliveries.get_delivery('del_1')
+    with pytest.raises(requests.HTTPError):
+        client.deliveries.get_delivery('del_2')
+
+    assert instrumentation.hooks == [
+        'before_request:0',
+        'after_response:503',
+        'on_retry:0.0',
+        'before_request:1',
+        'after_response:200',
+        'on_success',
+        'before_request:0',
+        'after_response:404',
+        'on_giveup',
+    ]
+    success, giveup = instrumentation.calls
+    assert success['endpoint'] == 'deliveries'
+    assert success['method'] == 'GET'
+    assert success['path'] == ('deliveries', 'del_1')
+    assert success['result'] is delivery
+    assert success['attempts'][0]['retry_after'] == 0
+    assert success['attempts'][1]['response_size'] > 0
+    assert success['end_time'] >= success['start_time']
+    assert isinstance(giveup['error'], requests.HTTPError)
+
+
+def test_metrics_instrumentation():
+    metrics = MetricsInstrumentation()
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(lambda **kwargs: response(200, DELIVERY)),
+        instrumentation=metrics,
+    )
+
+    for _ in range(3):
+        client.deliveries.cancel_delivery('del_1')
+
+    snapshot = metrics.snapshot()['POST deliveries']
+    assert snapshot['calls'] == 3
+    assert snapshot['attempts'] == 3
+    assert snapshot['retries'] == 0
+    assert snapshot['status_codes'] == {200: 3}
+    assert snapshot['duration']['count'] == 3
+    assert snapshot['validation']['count'] == 3
+    assert snapshot['response_size']['p50'] is not None
+
+
+def test_histogram():
+    histogram = Histogram((1, 2, 4))
+    for value in (0.5, 1.5, 1.5, 3, 10):
+        histogram.record(value)
+
+    assert histogram.percentile(50) == 2
+    assert histogram.percentile(90) == 10
+    assert histogram.snapshot()['buckets'] == {1: 1, 2: 2, 4: 1, float('inf'): 1}
@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from tests.helpers import ADDRESS, QUOTE, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core.quotes import QuoteCache
+
+
+def quote_request(external_store_id: str) -> models.QuoteCreateRequest:
+    return models.QuoteCreateRequest(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        dropoff_address=ADDRESS,
+        external_store_id=external_store_id,
+    )
+
+
+def test_create_quotes():
+    def handler(*, json, **kwargs):
+        store = json['external_store_id']
+        if store == 'error':
+            return response(400, {'code': 'invalid_params'})
+        if store == 'slow':
+            time.sleep(0.5)
+        return response(200, {**QUOTE, 'id': f'dqt_{store}'})
+
+    client = UberDirect('customer', 'token', version='v1', session=FakeSession(handler))
+    stores = ['a', 'error', 'b']
+
+    results = client.quotes.create_quotes(
+        requests=[quote_request(store) for store in stores],
+    )
+
+    assert isinstance(results[0], models.QuoteCreateResponse)
+    assert results[0].id == 'dqt_a'
+    assert isinstance(results[1], Exception)
+    assert isinstance(results[2], models.QuoteCreateResponse)
+    assert results[2].id == 'dqt_b'
+
+    # deadline leaves slow quotes empty
+    results = client.quotes.create_quotes(
+        requests=[quote_request(store) for store in ['slow', 'a']],
+        deadline=0.2,
+    )
+    assert results[0] is None
+    assert isinstance(results[1], models.QuoteCreateResponse)
+
+    # first accepted quote returns early
+    started = time.monotonic()
+    results = client.quotes.create_quotes(
+        requests=[quote_request(store) for store in ['slow', 'a']],
+        accept=lambda quote: True,
+    )
+    assert time.monotonic() - started < 0.4
+    assert results[0] is None
+    assert isinstance(results[1], models.QuoteCreateResponse)
+
+
+def test_create_quotes_pool():
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+    finished: list[str] = []
+
+    def handler(*, json, **kwargs):
+        nonlocal running, peak
+        store = json['external_store_id']
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.3 if store == 'slow' else 0.05)
+        with lock:
+            running -= 1
+            finished.append(store)
+        return response(200, {**QUOTE, 'id': f'dqt_{store}'})
+
+    with UberDirect(
+        'customer', 'token', version='v1', session=FakeSession(handler)
+    ) as client:
+        client.quotes.create_quotes(
+            requests=[quote_request(str(index)) for index in range(6)],
+            max_concurrency=2,
+        )
+        assert peak == 2
+
+        # the slow quote keeps running on the client's pool after an early return
+        client.quotes.create_quotes(
+            requests=[quote_request(store) for store in ['slow', 'a']],
+            accept=lambda quote: True,
+        )
+        assert 'slow' not in finished
+
+    # closing the client waits for it
+    assert finished[-1] == 'slow'
+
+
+def test_quote_cache():
+    now = datetime.now(timezone.utc)
+
+    def handler(*, json, **kwargs):
+        expires = now + timedelta(minutes=15)
+        if json['external_store_id'] == 'expiring':
+            expires = now + timedelta(seconds=10)
+        return response(200, {**QUOTE, 'expires': expires.isoformat()})
+
+    session = FakeSession(handler)
+    cache = QuoteCache(max_size=2, expiry_margin=30)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        quote_cache=cache,
+    )
+
+    quote = client.quotes.create_quote(request=quote_request('a'))
+    assert client.quotes.create_quote(request=quote_request('a')) is quote
+    assert len(session.calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # quotes about to expire are not served
+    client.quotes.create_quote(request=quote_request('expiring'))
+    client.quotes.create_quote(request=quote_request('expiring'))
+    assert len(session.calls) == 3
+
+    # least recently used quotes are evicted
+    client.quotes.create_quote(request=quote_request('b'))
+    client.quotes.create_quote(request=quote_request('c'))
+    assert len(cache) == 2
+    assert cache.evictions == 1
+    client.quotes.create_quote(request=quote_request('a'))
+    assert len(session.calls) == 6
@@ -0,0 +1,99 @@
+import time
+
+from pytest import raises
+
+from tests.helpers import ADDRESS, QUOTE, FakeSession, response
+from uberpy import UberDirect, exceptions, models
+from uberpy.core.ratelimit import RateLimiter, TokenBucket
+
+
+def test_token_bucket():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    # burst is allowed right away, then one request every 1 / rate
+    assert bucket.reserve(0) == 0
+    assert bucket.reserve(0) == 0
+    assert round(bucket.reserve(0), 6) == 0.1
+    assert round(bucket.reserve(0), 6) == 0.2
+
+    bucket = TokenBucket(rate=10, burst=2)
+    bucket.pause(0, 5)
+    assert bucket.reserve(0, consume=False) == 5
+
+
+def test_rate_limiter():
+    limiter = RateLimiter(rate=10, burst=1, rates={'deliveries': 1}, policy='fail')
+
+    assert limiter.reserve('customer', 'delivery_quotes') == 0
+    assert limiter.reserve('customer', 'deliveries') == 0
+    assert limiter.reserve('other', 'deliveries') == 0
+    with raises(exceptions.RateLimitExceeded) as e:
+        limiter.reserve('customer', 'deliveries')
+    assert 0 < e.value.retry_after <= 1
+
+    # rate adapts to 429 responses and recovers on success
+    limiter.throttled('customer', 'delivery_quotes')
+    assert limiter.rate('customer', 'delivery_quotes') == 5
+    limiter.succeeded('customer', 'delivery_quotes')
+    assert limiter.rate('customer', 'delivery_quotes') == 5.5
+    for _ in range(20):
+        limiter.succeeded('customer', 'delivery_quotes')
+    assert limiter.rate('customer', 'delivery_quotes') == 10
+
+
+def test_rate_limited_client():
+    statuses = [429, 200, 200]
+
+    def handler(**kwargs):
+        status_code = statuses.pop(0)
+        if status_code == 429:
+            return response(429, headers={'Retry-After': '0.2'})
+        return response(200, QUOTE)
+
+    limiter = RateLimiter(rate=100)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(handler),
+        rate_limiter=limiter,
+    )
+    request = models.QuoteCreateRequest(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        dropoff_address=ADDRESS,
+    )
+
+    started = time.monotonic()
+    client.quotes.create_quote(request=request)
+    client.quotes.create_quote(request=request)
+
+    assert time.monotonic() - started >= 0.2
+    assert limiter.rate('customer', 'delivery_quotes') < 100
+
+
+def test_rate_limit_wait_exceeds_deadline():
+    session = FakeSession(lambda **kwargs: response(200, QUOTE))
+    limiter = RateLimiter(rate=1, burst=1)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        rate_limiter=limiter,
+        deadline=0.5,
+    )
+    request = models.QuoteCreateRequest(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        dropoff_address=ADDRESS,
+    )
+
+    client.quotes.create_quote(request=request)
+    # fails without waiting for a slot or reserving it
+    started = time.monotonic()
+    with raises(exceptions.DeadlineExceeded):
+        client.quotes.create_quote(request=request)
+    assert time.monotonic() - started < 0.1
+    assert len(session.calls) == 1
+    assert limiter.reserve('customer', 'delivery_quotes') <= 1
@@ -0,0 +1,86 @@
+import pytest
+import requests
+
+from tests.helpers import DELIVERY, FakeSession, response
+from uberpy import UberDirect, exceptions
+from uberpy.core.base import cap_timeout, compute_backoff
+from uberpy.core.retry import RetryBudget
+
+
+def test_retry_budget():
+    budget = RetryBudget(ratio=0.5, min_retries_per_second=1, max_tokens=2)
+
+    assert budget.withdraw(now=0)
+    assert budget.withdraw(now=0)
+    assert not budget.withdraw(now=0)
+
+    budget.deposit(now=0)
+    budget.deposit(now=0)
+    assert budget.withdraw(now=0)
+    # refilled over time
+    assert budget.withdraw(now=1)
+    assert not budget.withdraw(now=1)
+
+    assert budget.snapshot() == {
+        'requests': 2,
+        'retries': 4,
+        'rejected': 2,
+        'tokens': 0.0,
+    }
+
+
+def test_backoff_and_timeout_caps():
+    assert compute_backoff(0, 0, retry_after='60', max_retry_after=5) == 5
+    assert compute_backoff(0, 0, retry_after='2', max_retry_after=5) == 2
+    assert cap_timeout(10, None) == 10
+    assert cap_timeout(10, 2) == 2
+    assert cap_timeout((3, 10), 5) == (3, 5)
+
+
+def test_deadline():
+    responses = iter(
+        [
+            response(503, headers={'Retry-After': '0.01'}),
+            response(200, DELIVERY),
+            response(503, headers={'Retry-After': '60'}),
+        ]
+    )
+    session = FakeSession(lambda **kwargs: next(responses))
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        deadline=2,
+    )
+
+    client.deliveries.get_delivery('del_1')
+    assert len(session.calls) == 2
+    assert all(call['timeout'] <= 2 for call in session.calls)
+
+    # the capped Retry-After does not fit in the call deadline
+    with pytest.raises(requests.HTTPError):
+        client.deliveries.get_delivery('del_1', deadline=1)
+    assert len(session.calls) == 3
+    assert session.calls[-1]['timeout'] <= 1
+
+    with pytest.raises(exceptions.DeadlineExceeded):
+        client.deliveries.get_delivery('del_1', deadline=0)
+    assert len(session.calls) == 3
+
+
+def test_retry_budget_exhausted():
+    session = FakeSession(lambda **kwargs: response(503, headers={'Retry-After': '0'}))
+    budget = RetryBudget(ratio=0, min_retries_per_second=0, max_tokens=1)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        retry_budget=budget,
+    )
+
+    with pytest.raises(requests.HTTPError):
+        client.deliveries.get_delivery('del_1')
+    assert len(session.calls) == 2
+    assert budget.rejected == 1
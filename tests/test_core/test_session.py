@@ -0,0 +1,84 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from tests.helpers import ADDRESS, QUOTE, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core import base
+from uberpy.core.session import KeepAliveHTTPAdapter, create_session
+
+
+def test_create_session():
+    session = create_session(pool_maxsize=64, pool_block=True, keepalive_idle=30)
+    adapter = session.get_adapter('https://api.uber.com')
+
+    assert isinstance(adapter, KeepAliveHTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+    assert adapter.poolmanager.connection_pool_kw['block'] is True
+    assert (
+        socket.SOL_SOCKET,
+        socket.SO_KEEPALIVE,
+        1,
+    ) in adapter.poolmanager.connection_pool_kw['socket_options']
+
+
+def test_connect_timeout():
+    session = FakeSession(lambda **kwargs: response(200, QUOTE))
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        timeout=5,
+        connect_timeout=1,
+    )
+    client.quotes.create_quote(
+        request=models.QuoteCreateRequest(
+            pickup_address=ADDRESS,
+            pickup_phone_number='+525555555555',
+            dropoff_address=ADDRESS,
+        ),
+    )
+
+    assert session.calls[0]['timeout'] == (1, 5)
+
+
+def test_warmup(monkeypatch):
+    connections = set()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'
+
+        def do_HEAD(self):
+            connections.add(self.client_address)
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(
+        base,
+        'BASE_URL',
+        f'http://127.0.0.1:{server.server_port}/{{version}}/customers/{{customer_id}}',
+    )
+
+    try:
+        client = UberDirect('customer', 'token', version='v1')
+        assert client.warmup(4) == 4
+        assert 1 <= len(connections) <= 4
+
+        # only the calling thread's own session is warmed
+        connections.clear()
+        client = UberDirect(
+            'customer', 'token', version='v1', session_strategy='thread'
+        )
+        assert client.warmup(4) == 1
+        assert len(connections) == 1
+        pool = client._session.session.get_adapter(base.BASE_URL).poolmanager.pools
+        assert len(pool.keys()) == 1
+    finally:
+        server.shutdown()
@@ -0,0 +1,80 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from tests.helpers import ADDRESS, QUOTE, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_single_flight():
+    single_flight = SingleFlight[int]()
+    calls = 0
+    started = threading.Event()
+
+    def fn() -> int:
+        nonlocal calls
+        calls += 1
+        started.set()
+        time.sleep(0.2)
+        return calls
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        leader = executor.submit(single_flight.do, 'key', fn)
+        started.wait()
+        followers = [executor.submit(single_flight.do, 'key', fn) for _ in range(7)]
+        results = [leader.result(), *(follower.result() for follower in followers)]
+
+    assert results == [1] * 8
+    assert single_flight.coalesced == 7
+
+    # calls after completion are not coalesced
+    assert single_flight.do('key', fn) == 2
+
+
+def test_async_single_flight():
+    single_flight = AsyncSingleFlight[int]()
+    calls = 0
+
+    async def fn() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.05)
+        return calls
+
+    async def main():
+        return await asyncio.gather(*(single_flight.do('key', fn) for _ in range(8)))
+
+    assert asyncio.run(main()) == [1] * 8
+    assert single_flight.coalesced == 7
+
+
+def test_coalesce_quotes():
+    def handler(**kwargs):
+        time.sleep(0.2)
+        return response(200, QUOTE)
+
+    session = FakeSession(handler)
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=session,
+        coalesce_quotes=True,
+    )
+    request = models.QuoteCreateRequest(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        dropoff_address=ADDRESS,
+    )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        quotes = list(
+            executor.map(
+                lambda _: client.quotes.create_quote(request=request), range(4)
+            )
+        )
+
+    assert len(session.calls) == 1
+    assert all(quote is quotes[0] for quote in quotes)
@@ -0,0 +1,138 @@
+from datetime import datetime, timedelta, timezone
+
+from tests.helpers import DELIVERY, FakeSession, response
+from uberpy import UberDirect, models
+from uberpy.core.tracker import DeliveryTracker, next_interval
+
+
+def test_next_interval():
+    now = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    delivery = models.Delivery.model_validate(
+        {
+            **DELIVERY,
+            'pickup_eta': (now + timedelta(minutes=10)).isoformat(),
+            'dropoff_eta': (now + timedelta(hours=2)).isoformat(),
+        }
+    )
+    kwargs = {'min_interval': 10, 'max_interval': 300, 'eta_fraction': 0.25}
+
+    assert next_interval(delivery, now=now, **kwargs) == 150
+    picked_up = delivery.model_copy(update={'status': 'pickup_complete'})
+    assert next_interval(picked_up, now=now, **kwargs) == 300
+    imminent = delivery.model_copy(update={'courier_imminent': True})
+    assert next_interval(imminent, now=now, **kwargs) == 10
+
+
+def test_delivery_tracker():
+    states = {
+        'del_1': iter(['pending', 'pickup', 'delivered']),
+        'del_2': iter(['pending'] * 10),
+    }
+
+    def handler(*, url, **kwargs):
+        delivery_id = url.rsplit('/', 1)[-1]
+        status = next(states[delivery_id])
+        return response(
+            200,
+            {
+                **DELIVERY,
+                'id': delivery_id,
+                'status': status,
+                'complete': status == 'delivered',
+            },
+        )
+
+    session = FakeSession(handler)
+    client = UberDirect('customer', 'token', version='v1', session=session)
+    tracker = DeliveryTracker(
+        client.deliveries,
+        rate=1,
+        burst=1,
+        min_interval=1,
+        max_interval=1,
+    )
+    events = []
+    tracker.on_change(lambda delivery, changes: events.append((delivery.id, changes)))
+    tracker.track('del_1', now=0)
+    tracker.track('del_2', now=0)
+
+    # budget allows a single request per second
+    assert tracker.poll(now=0) == 1
+    assert len(session.calls) == 1
+    assert tracker.poll(now=1) == 1
+    assert len(session.calls) == 2
+
+    tracker.poll(now=2)
+    tracker.poll(now=3)
+    tracker.poll(now=4)
+
+    assert 'del_1' not in tracker
+    assert 'del_2' in tracker
+    statuses = [
+        changes['status'] for delivery_id, changes in events if delivery_id == 'del_1'
+    ]
+    assert statuses == [
+        (None, 'pending'),
+        ('pending', 'pickup'),
+        ('pickup', 'delivered'),
+    ]
+    # unchanged snapshots emit no events
+    assert [delivery_id for delivery_id, _ in events].count('del_2') == 1
+
+    tracker.untrack('del_2')
+    assert tracker.poll(now=10) is None
+
+
+def test_delivery_tracker_callback_errors(caplog):
+    session = FakeSession(
+        lambda *, url, **kwargs: response(
+            200, {**DELIVERY, 'id': url.rsplit('/', 1)[-1], 'status': 'pending'}
+        )
+    )
+    client = UberDirect('customer', 'token', version='v1', session=session)
+    errors = []
+    tracker = DeliveryTracker(
+        client.deliveries,
+        min_interval=1,
+        max_interval=1,
+        on_error=lambda delivery_id, e: errors.append(delivery_id),
+    )
+
+    @tracker.on_change
+    def fail(delivery, changes):
+        raise RuntimeError(delivery.id)
+
+    tracker.track('del_1', now=0)
+    tracker.track('del_2', now=0)
+
+    # callbacks failing does not stop the batch from being rescheduled
+    assert tracker.poll(now=0) == 1
+    assert sorted(errors) == ['del_1', 'del_2']
+    assert sorted(entry[2] for entry in tracker._queue) == ['del_1', 'del_2']
+
+    # logged without an error callback
+    tracker = DeliveryTracker(client.deliveries)
+    tracker.on_change(fail)
+    tracker.track('del_3', now=0)
+    tracker.poll(now=0)
+    assert 'del_3' in tracker
+    assert 'on_change callback failed for del_3' in caplog.text
+
+
+def test_delivery_tracker_untrack_during_refresh():
+    def handler(*, url, **kwargs):
+        delivery_id = url.rsplit('/', 1)[-1]
+        tracker.untrack(delivery_id)
+        if delivery_id == 'del_2':
+            return response(400, {'code': 'invalid_params'})
+        return response(200, {**DELIVERY, 'id': delivery_id})
+
+    client = UberDirect('customer', 'token', version='v1', session=FakeSession(handler))
+    tracker = DeliveryTracker(client.deliveries, min_interval=1, max_interval=1)
+    tracker.track('del_1', now=0)
+    tracker.track('del_2', now=0)
+
+    # refreshes finishing after untrack do not track the deliveries again
+    assert tracker.poll(now=0) is None
+    assert len(tracker) == 0
+    assert tracker._failures == {}
@@ -0,0 +1,16 @@
+from decimal import Decimal
+
+from pydantic import BaseModel
+
+from uberpy import fields
+
+
+class Model(BaseModel):
+    number: fields.DecimalFromInt
+
+
+def test_decimal_from_int_is_exact():
+    for cents in [0, 1, 29, 1099, -5, 10**20 + 1]:
+        model = Model.model_validate({'number': cents})
+        assert model.number == Decimal(cents) / 100
+        assert model.model_dump(mode='json')['number'] == cents
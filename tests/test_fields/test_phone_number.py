@@ -0,0 +1,37 @@
+from typing import Annotated
+
+from pydantic import BaseModel, ValidationError
+from pytest import raises
+
+from uberpy import fields
+
+
+def test_phone_number():
+    validator = fields.CachedPhoneNumberValidator(default_region='MX', cache_size=2)
+
+    class Model(BaseModel):
+        phone_number: Annotated[str, validator]
+
+    assert Model(phone_number='55 5555 5555').phone_number == '+525555555555'
+    assert Model(phone_number='55 5555 5555').phone_number == '+525555555555'
+    assert (validator.cache.hits, validator.cache.misses) == (1, 1)
+
+    # failures are cached
+    for _ in range(2):
+        with raises(ValidationError) as e:
+            Model(phone_number='invalid')
+        assert e.value.errors()[0]['type'] == 'value_error'
+    assert (validator.cache.hits, validator.cache.misses) == (2, 2)
+
+    # cache is bounded
+    Model(phone_number='+525555555556')
+    assert len(validator.cache) == 2
+
+    # other regions
+    class USModel(BaseModel):
+        phone_number: Annotated[
+            str,
+            fields.CachedPhoneNumberValidator(default_region='US'),
+        ]
+
+    assert USModel(phone_number='(201) 555-0123').phone_number == '+12015550123'
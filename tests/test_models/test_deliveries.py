@@ -0,0 +1,16 @@
+from tests.helpers import DELIVERY
+from uberpy import constants, models
+
+
+def test_delivery_status():
+    delivery = models.Delivery.model_validate(DELIVERY)
+    assert delivery.status == constants.DeliveryStatus.PENDING
+
+    # statuses added by the API do not break parsing
+    delivery = models.Delivery.model_validate({**DELIVERY, 'status': 'scheduled'})
+    assert delivery.status == 'scheduled'
+
+    delivery = models.Delivery.model_validate(
+        {name: value for name, value in DELIVERY.items() if name != 'status'}
+    )
+    assert delivery.status is None
@@ -0,0 +1,37 @@
+import json
+from decimal import Decimal
+
+import pytest
+from pydantic import ValidationError
+
+from tests.helpers import DELIVERY
+from uberpy import models
+
+
+def test_lazy_model():
+    delivery = models.LazyModel(models.Delivery, json.dumps(DELIVERY))
+
+    assert delivery.id == 'del_1'
+    assert delivery.fee == Decimal('10.99')
+    assert delivery.courier is None
+    assert delivery.dropoff_deadline is None
+    assert delivery.created is delivery.created
+    assert delivery.deliverable_action == 'deliverable_action_meet_at_door'
+    assert not delivery.validated
+    assert delivery.model == models.Delivery.model_validate(DELIVERY)
+    assert delivery.validated
+
+    with pytest.raises(AttributeError):
+        assert delivery.unknown
+
+    # fields are only validated on access
+    delivery = models.LazyModel(
+        models.Delivery, json.dumps({**DELIVERY, 'uuid': 'invalid'})
+    )
+    assert delivery.id == 'del_1'
+    with pytest.raises(ValidationError):
+        assert delivery.uuid
+
+    delivery = models.LazyModel(models.Delivery, json.dumps({'id': 'del_1'}))
+    with pytest.raises(ValidationError):
+        assert delivery.complete
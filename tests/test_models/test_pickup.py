@@ -0,0 +1,78 @@
+import pickle
+
+from pytest import raises
+
+from tests.helpers import ADDRESS, delivery_request
+from uberpy import models
+
+
+def test_pickup_profile():
+    profile = models.PickupProfile(
+        pickup_name='Store',
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+        pickup_latitude=19.4326,
+        pickup_longitude=-99.1332,
+        pickup_verification={'picture': True},
+        external_store_id='store-1',
+    )
+    fields = {
+        'dropoff_name': 'Customer',
+        'dropoff_address': ADDRESS,
+        'dropoff_phone_number': '+525555555556',
+        'manifest_items': [{'name': 'Item', 'quantity': 1}],
+        'manifest_total_value': 1099,
+        'quote_id': 'dqt_1',
+    }
+
+    request = profile.delivery_request(**fields)
+    expected = delivery_request(
+        **fields,
+        pickup_latitude=19.4326,
+        pickup_longitude=-99.1332,
+        pickup_verification={'picture': True},
+        external_store_id='store-1',
+    )
+
+    assert isinstance(request, models.DeliveryCreateRequest)
+    assert request.pickup_phone_number == '+525555555555'
+    assert request.model_dump(mode='json', exclude_none=True) == expected.model_dump(
+        mode='json',
+        exclude_none=True,
+    )
+    assert request.model_dump(by_alias=True) == expected.model_dump(by_alias=True)
+
+    quote_request = profile.quote_request(dropoff_address=ADDRESS)
+    assert isinstance(quote_request, models.QuoteCreateRequest)
+    assert quote_request.model_dump(mode='json', exclude_none=True) == {
+        'pickup_address': expected.model_dump(mode='json')['pickup_address'],
+        'pickup_phone_number': '+525555555555',
+        'pickup_latitude': 19.4326,
+        'pickup_longitude': -99.1332,
+        'dropoff_address': expected.model_dump(mode='json')['dropoff_address'],
+        'external_store_id': 'store-1',
+    }
+
+    # pickup fields come from the profile only
+    with raises(TypeError):
+        profile.delivery_request(**fields, pickup_name='Other')
+
+    # serialization is cached
+    assert profile.serialize(
+        ('pickup_name',),
+    ) is profile.serialize(('pickup_name',))
+
+
+def test_pickup_request_pickles():
+    profile = models.PickupProfile(
+        pickup_address=ADDRESS,
+        pickup_phone_number='+525555555555',
+    )
+    request = profile.quote_request(dropoff_address=ADDRESS)
+
+    restored = pickle.loads(pickle.dumps(request))
+
+    assert type(restored) is type(request)
+    assert restored.model_dump_json(exclude_none=True) == request.model_dump_json(
+        exclude_none=True
+    )
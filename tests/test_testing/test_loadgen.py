@@ -0,0 +1,60 @@
+import importlib.metadata
+import json
+
+import pytest
+
+from uberpy.testing import loadgen
+
+
+@pytest.mark.parametrize('mode', ['threads', 'processes', 'async'])
+def test_main(capsys, mode):
+    loadgen.main(
+        ['--mode', mode, '--concurrency', '2', '--requests', '10', '--json'],
+    )
+    result = json.loads(capsys.readouterr().out)['result']
+
+    assert result['mode'] == mode
+    assert result['errors'] == {}
+    assert set(result['throughput']) == {'quote', 'delivery'}
+    assert result['latency']['delivery']['count'] == 10
+    phases = result['phase_cpu_time']
+    assert set(phases) == set(loadgen.PHASES)
+    assert phases['serialization'] > 0
+    assert phases['validation'] > 0
+    assert phases['io'] > 0
+    assert sum(phases.values()) <= result['cpu_time'] + 1e-6
+
+
+def test_retries_and_compare(capsys, tmp_path):
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps({'result': {'throughput': {'quote': 1e9}}}))
+
+    with pytest.raises(SystemExit):
+        loadgen.main(
+            [
+                '--operation',
+                'quote',
+                '--requests',
+                '20',
+                '--throttle-rate',
+                '0.3',
+                '--retry-after',
+                '0',
+                '--seed',
+                '1',
+                '--compare',
+                str(baseline),
+            ],
+        )
+    out, err = capsys.readouterr()
+    assert 'retries 0' not in out
+    assert 'regression: quote' in err
+
+
+def test_package_version(monkeypatch):
+    def version(name):
+        raise importlib.metadata.PackageNotFoundError(name)
+
+    monkeypatch.setattr(importlib.metadata, 'version', version)
+
+    assert loadgen.package_version() == 'unknown'
@@ -0,0 +1,123 @@
+from datetime import datetime, timedelta, timezone
+from time import sleep
+from typing import Iterator
+
+import pytest
+
+from tests.helpers import ADDRESS, delivery_request
+from uberpy import UberDirect, constants, models
+from uberpy.core.auth import TokenProvider
+from uberpy.core.instrumentation import MetricsInstrumentation
+from uberpy.testing import FakeServer, constant, parse_latency
+
+QUOTE_REQUEST = models.QuoteCreateRequest(
+    pickup_address=ADDRESS,
+    pickup_phone_number='+525555555555',
+    dropoff_address=ADDRESS,
+)
+
+
+@pytest.fixture
+def server() -> Iterator[FakeServer]:
+    with FakeServer(step=0.05, seed=1) as server:
+        yield server
+
+
+def client(server: FakeServer, **kwargs) -> UberDirect:
+    token = TokenProvider(
+        client_id='id',
+        client_secret='secret',
+        oauth_url=server.oauth_url,
+        background_refresh=False,
+    )
+    return UberDirect('customer', token, version='v1', base_url=server.url, **kwargs)
+
+
+def test_delivery_lifecycle(server: FakeServer):
+    uber = client(server)
+
+    quote = uber.quotes.create_quote(request=QUOTE_REQUEST)
+    request = delivery_request(quote_id=quote.id, idempotency_key='key')
+    delivery = uber.deliveries.create_delivery(request=request)
+    assert delivery.status == constants.DeliveryStatus.PENDING
+    assert delivery.fee == quote.fee
+    # retried creations are deduplicated
+    assert uber.deliveries.create_delivery(request=request).id == delivery.id
+
+    sleep(0.25)
+    delivery = uber.deliveries.get_delivery(delivery.id)
+    assert delivery.status == constants.DeliveryStatus.DELIVERED
+    assert delivery.complete
+    assert delivery.courier is not None
+
+    proof = uber.deliveries.proof_of_delivery(
+        delivery.id,
+        request=models.DeliveryProofOfDeliveryRequest(
+            type=constants.ProofOfDeliveryType.PICTURE,
+            waypoint=constants.ProofOfDeliveryWaypoint.DROPOFF,
+        ),
+    )
+    assert proof.document.startswith(b'\x89PNG')
+
+    ongoing = uber.deliveries.create_delivery(
+        request=delivery_request(quote_id=quote.id)
+    )
+    assert uber.deliveries.cancel_delivery(ongoing.id).status == 'canceled'
+    assert [d.id for d in uber.deliveries.list_deliveries(page_size=1)] == [
+        delivery.id,
+        ongoing.id,
+    ]
+    assert server.stats()['deliveries'] == 2
+
+
+def test_robocourier_custom(server: FakeServer):
+    uber = client(server)
+    quote = uber.quotes.create_quote(request=QUOTE_REQUEST)
+    now = datetime.now(timezone.utc)
+    at = {
+        name: (now + timedelta(hours=offset)).isoformat()
+        for name, offset in (
+            ('enroute_for_pickup_at', -2),
+            ('pickup_imminent_at', -1),
+            ('pickup_at', 1),
+            ('dropoff_imminent_at', 2),
+            ('dropoff_at', 3),
+        )
+    }
+    delivery = uber.deliveries.create_delivery(
+        request=delivery_request(
+            quote_id=quote.id,
+            test_specifications={
+                'robo_courier_specification': {'mode': 'custom', **at},
+            },
+        )
+    )
+    assert delivery.status == constants.DeliveryStatus.PICKUP
+    assert delivery.courier_imminent
+
+
+def test_fault_injection():
+    metrics = MetricsInstrumentation()
+    with FakeServer(throttle_rate=0.3, retry_after=0, seed=2) as server:
+        uber = client(server, max_retries=10, instrumentation=metrics)
+        for _ in range(20):
+            uber.quotes.create_quote(request=QUOTE_REQUEST)
+        stats = server.stats()
+
+    assert stats['quotes'] == 20
+    assert stats['throttled'] > 0
+    assert stats['routes']['create_quote'] == {200: 20, 429: stats['throttled']}
+    assert stats['routes']['token'] == {200: 1}
+    assert metrics.snapshot()['POST delivery_quotes']['retries'] == stats['throttled']
+
+
+def test_latency():
+    assert parse_latency('constant:0.5')(None) == 0.5
+    with pytest.raises(ValueError):
+        parse_latency('normal:1:1')
+
+    with FakeServer(latency={'create_quote': constant(0.1)}) as server:
+        metrics = MetricsInstrumentation()
+        uber = client(server, instrumentation=metrics)
+        uber.quotes.create_quote(request=QUOTE_REQUEST)
+    assert metrics.snapshot()['POST delivery_quotes']['network']['max'] >= 0.1
@@ -0,0 +1,51 @@
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from tests.helpers import DELIVERY, FakeSession, response
+from uberpy import UberDirect
+from uberpy.tracing import TracingInstrumentation
+
+
+def test_tracing_instrumentation():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    responses = iter(
+        [
+            response(429, headers={'Retry-After': '0.01'}),
+            response(200, DELIVERY),
+        ]
+    )
+    client = UberDirect(
+        'customer',
+        'token',
+        version='v1',
+        session=FakeSession(lambda **kwargs: next(responses)),
+        instrumentation=TracingInstrumentation(
+            tracer=provider.get_tracer('test'),
+        ),
+    )
+
+    client.deliveries.get_delivery('del_1')
+
+    spans = {span.name: span for span in exporter.get_finished_spans()}
+    call = spans['uberpy GET deliveries']
+    assert call.attributes['uberpy.delivery_id'] == 'del_1'
+    assert call.attributes['uberpy.quote_id'] == 'dqt_1'
+    assert call.attributes['uberpy.attempts'] == 2
+
+    names = [span.name for span in exporter.get_finished_spans()]
+    assert names.count('attempt') == 2
+    assert names.count('http') == 2
+    assert names.count('backoff') == 1
+    attempts = [
+        span for span in exporter.get_finished_spans() if span.name == 'attempt'
+    ]
+    assert attempts[0].attributes['http.response.status_code'] == 429
+    assert attempts[0].attributes['uberpy.retry_after'] == 0.01
+    assert all(span.parent.span_id == call.context.span_id for span in attempts)
+    assert spans['validate'].parent.span_id == call.context.span_id
+    assert spans['backoff'].end_time - spans['backoff'].start_time == 10_000_000
@@ -0,0 +1,100 @@
+import json
+import threading
+
+import pytest
+
+from tests.helpers import DELIVERY
+from uberpy import exceptions, models, webhooks
+
+EVENT = {
+    'id': 'evt_1',
+    'kind': 'event.delivery_status',
+    'created': '2025-01-01T00:00:00Z',
+    'delivery_id': 'del_1',
+    'status': 'pickup',
+    'data': {**DELIVERY, 'status': 'pickup'},
+}
+
+
+def test_webhook_receiver():
+    body = json.dumps(EVENT).encode()
+    signature = webhooks.compute_signature(body, 'secret')
+    received = []
+    lock = threading.Lock()
+
+    with webhooks.WebhookReceiver('secret', max_workers=2) as receiver:
+
+        @receiver.on('event.delivery_status')
+        def on_status(event: models.WebhookEvent) -> None:
+            with lock:
+                received.append(event)
+
+        @receiver.on('event.courier_update')
+        def on_courier(event: models.WebhookEvent) -> None:
+            raise AssertionError
+
+        event = receiver.handle(body, {'X-Uber-Signature': signature})
+        assert event is not None
+        assert event.data is not None
+        assert event.data.status == 'pickup'
+
+        # redeliveries are dropped
+        assert receiver.handle(body, {'x-postmates-signature': signature}) is None
+
+        with pytest.raises(exceptions.InvalidSignature):
+            receiver.handle(body, {'x-uber-signature': 'invalid'})
+        with pytest.raises(exceptions.InvalidSignature):
+            receiver.handle(body, {})
+
+    assert received == [event]
+
+
+@pytest.mark.parametrize('max_workers', [None, 1])
+def test_webhook_handler_errors(caplog, max_workers):
+    body = json.dumps(EVENT).encode()
+    headers = {'x-uber-signature': webhooks.compute_signature(body, 'secret')}
+    calls = []
+
+    def deliver() -> models.WebhookEvent | None:
+        event = receiver.handle(body, headers)
+        if receiver._executor is not None:
+            # a single worker runs the done callbacks before the next task
+            receiver._executor.submit(lambda: None).result()
+        return event
+
+    with webhooks.WebhookReceiver('secret', max_workers=max_workers) as receiver:
+
+        @receiver.on()
+        def audit(event: models.WebhookEvent) -> None:
+            calls.append('audit')
+
+        @receiver.on()
+        def flaky(event: models.WebhookEvent) -> None:
+            calls.append('flaky')
+            if calls.count('flaky') == 1:
+                raise RuntimeError('database unavailable')
+
+        if max_workers is None:
+            with pytest.raises(RuntimeError):
+                deliver()
+        else:
+            deliver()
+            assert 'webhook handler failed for event evt_1' in caplog.text
+            assert 'database unavailable' in caplog.text
+
+        # only the failed handler runs again when redelivered
+        assert deliver() is not None
+        assert deliver() is None
+
+    assert calls == ['audit', 'flaky', 'flaky']
+
+
+def test_seen_set():
+    seen = webhooks.SeenSet(max_size=2)
+
+    assert seen.add('a')
+    assert seen.add('b')
+    assert not seen.add('a')
+    assert seen.add('c')
+    assert 'b' not in seen
+    assert len(seen) == 2